@@ -652,8 +652,8 @@ class ascan_with_addcustomdata(ascan_demo):
 
         # calculate a linear fit to the timestamps VS motor positions and store
         # it
-        x = [r.data[motor.getName()] for r in self.data.records]
-        y = [r.data['timestamp'] for r in self.data.records]
+        x = self.data.getColumn(motor.getName())
+        y = self.data.getColumn('timestamp')
         fitted_y = numpy.polyval(numpy.polyfit(x, y, 1), x)
         dh.addCustomData(fitted_y, 'fittedtime',
                          nxpath='measurement:NXcollection')
@@ -689,7 +689,7 @@ class ascanct_midtrigger(Macro):
         # https://github.com/sardana-org/sardana/issues/784 gets solved
         dh = scan_macro._gScan.data_handler
         # calculate position corresponding to the middle space interval
-        positions = [r.data[motor.getName()] for r in scan_macro.data.records]
+        positions = scan_macro.data.getColumn(motor.getName())
         first_position = positions[0]
         second_position = positions[1]
         positive_direction = second_position > first_position
@@ -1699,12 +1699,8 @@ class _diff_scan(Macro):
         channel_fullname = channel.getFullName()
         motor_name = motor.getName()
 
-        arr_data = []
-        arr_motpos = []
-        for record in ascan.data.records:
-            record_data = record.data
-            arr_data.append(record_data[channel_fullname])
-            arr_motpos.append(record_data[motor_name])
+        arr_data = ascan.data.getColumn(channel_fullname)
+        arr_motpos = ascan.data.getColumn(motor_name)
 
         # Find motor position corresponding to the maximum of channel values
         idx_max = np.argmax(arr_data)
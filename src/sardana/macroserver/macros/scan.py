@@ -47,7 +47,6 @@ import numpy
 
 from taurus.core.util import SafeEvaluator
 
-from sardana.macroserver.msexception import UnknownEnv
 from sardana.macroserver.macro import Hookable, Macro, Type, Table, List
 from sardana.macroserver.scan.gscan import SScan, CTScan, HScan, \
     MoveableDesc, CSScan, TScan
@@ -225,11 +224,16 @@ class aNscan(Hookable):
         step["post-step-hooks"] = self.getHooks('post-step')
 
         step["check_func"] = []
-        for point_no in range(self.nb_points):
-            step["positions"] = self.starts + point_no * self.interv_sizes
+        for point_no, positions in enumerate(self._get_positions()):
+            step["positions"] = positions
             step["point_id"] = point_no
             yield step
 
+    def _get_positions(self):
+        """Positions of all the scan points (one row for each point)"""
+        points = numpy.arange(self.nb_points).reshape(-1, 1)
+        return self.starts + points * self.interv_sizes
+
     def _waypoint_generator(self):
         step = {}
         step["pre-move-hooks"] = self.getHooks('pre-move')
@@ -321,6 +325,11 @@ class aNscan(Hookable):
         # TODO: add time estimation for ContinuousHwTimeMode
         return total_time
 
+    def getScanPoints(self):
+        if self.mode != StepMode:
+            return None
+        return self._get_positions(), self.integ_time
+
     def getIntervalEstimation(self):
         mode = self.mode
         if mode in [StepMode, ContinuousHwTimeMode, HybridMode]:
@@ -753,23 +762,27 @@ class mesh(Macro, Hookable):
                                   self.getHooks('_NOHINTS_'))
         step["post-step-hooks"] = self.getHooks('post-step')
         step["check_func"] = []
+        for point_no, positions in enumerate(self._get_positions(), 1):
+            step["positions"] = positions
+            # TODO: maybe another ID would be better? (e.g. "(A,B)")
+            step["point_id"] = point_no
+            yield step
+
+    def _get_positions(self):
+        """Positions of all the scan points (one row for each point)"""
         m1start, m2start = self.starts
         m1end, m2end = self.finals
         points1, points2 = self.nr_intervs + 1
-        point_no = 1
-        m1_space = numpy.linspace(m1start, m1end, points1)
-        m1_space_inv = numpy.linspace(m1end, m1start, points1)
+        m1_positions = numpy.tile(numpy.linspace(m1start, m1end, points1),
+                                  (points2, 1))
+        if self.bidirectional_mode:
+            m1_positions[1::2] = numpy.linspace(m1end, m1start, points1)
+        m2_positions = numpy.repeat(numpy.linspace(m2start, m2end, points2),
+                                    points1)
+        return numpy.column_stack((m1_positions.ravel(), m2_positions))
 
-        for i, m2pos in enumerate(numpy.linspace(m2start, m2end, points2)):
-            space = m1_space
-            if i % 2 != 0 and self.bidirectional_mode:
-                space = m1_space_inv
-            for m1pos in space:
-                step["positions"] = numpy.array([m1pos, m2pos])
-                # TODO: maybe another ID would be better? (e.g. "(A,B)")
-                step["point_id"] = point_no
-                point_no += 1
-                yield step
+    def getScanPoints(self):
+        return self._get_positions(), self.integ_time
 
     def run(self, *args):
         for step in self._gScan.step_scan():
@@ -873,34 +886,10 @@ class mesh_repeat(mesh):
                      m2, m2_start_pos, m2_final_pos, m2_nr_interv, integ_time,
                      bidirectional, **opts)
 
-    def _generator(self):
-        step = {}
-        step["integ_time"] = self.integ_time
-        step["pre-move-hooks"] = self.getHooks('pre-move')
-        step["post-move-hooks"] = self.getHooks('post-move')
-        step["pre-acq-hooks"] = self.getHooks('pre-acq')
-        step["post-acq-hooks"] = self.getHooks('post-acq') + \
-            self.getHooks('_NOHINTS_')
-        step["post-step-hooks"] = self.getHooks('post-step')
-        step["check_func"] = []
-        m1start, m2start = self.starts
-        m1end, m2end = self.finals
-        points1, points2 = self.nr_intervs + 1
-        point_no = 1
-        m1_space = numpy.linspace(m1start, m1end, points1)
-        m1_space_inv = numpy.linspace(m1end, m1start, points1)
-
-        for i, m2pos in enumerate(numpy.linspace(m2start, m2end, points2)):
-            space = m1_space
-            if i % 2 != 0 and self.bidirectional_mode:
-                space = m1_space_inv
-            for m1pos in space:
-                for j in range(0, self.nb_repetitions):
-                    step["positions"] = numpy.array([m1pos, m2pos])
-                    # TODO: maybe another ID would be better? (e.g. "(A,B)")
-                    step["point_id"] = point_no
-                    point_no += 1
-                    yield step
+    def _get_positions(self):
+        """Positions of all the scan points (one row for each point)"""
+        positions = mesh._get_positions(self)
+        return numpy.repeat(positions, self.nb_repetitions, axis=0)
 
 
 class dmesh_repeat(mesh_repeat):
@@ -1083,6 +1072,9 @@ motor2 sqrt(y*x+3)
             step["point_id"] = i
             yield step
 
+    def getScanPoints(self):
+        return self.paths.T, self._integ_time
+
     def run(self, *args):
         for step in self._gScan.step_scan():
             yield step
@@ -1130,23 +1122,18 @@ class scanhist(Macro):
     ]
 
     def run(self, scan_number):
-        try:
-            hist = self.getEnv("ScanHistory")
-        except UnknownEnv:
-            print("No scan recorded in history")
+        hist = self.getMacroServer().scan_history
+        if len(hist) == 0:
+            self.output("No scan recorded in history")
             return
         if scan_number < 0:
-            self.show_all(hist)
+            self.show_all(hist.getLast())
         else:
             self.show_one(hist, scan_number)
 
     def show_one(self, hist, scan_number):
-        item = None
-        for h in hist:
-            if h['serialno'] == scan_number:
-                item = h
-                break
-        if item is None:
+        h = hist.get(scan_number)
+        if h is None:
             self.warning("Could not find scan number %s", scan_number)
             return
 
@@ -2079,19 +2066,16 @@ class scanstats(Macro):
         col_header = []
         cols = []
 
-        motor_data = []
+        # column views of the scan data (no copy for float columns)
+        scan_data = parent.data
+        motor_data = numpy.asarray(scan_data.getColumn(selected_motor),
+                                   dtype=float)
         channels_data = {}
         for channel_name in calc_channels:
-            channels_data[channel_name] = []
-
-        for idx, rc in parent.data.items():
-            motor_data.append(rc[selected_motor])
-            for channel_name in calc_channels:
-                channels_data[channel_name].append(rc[channel_name])
+            channels_data[channel_name] = scan_data.getColumn(channel_name)
 
-        motor_data = numpy.array(motor_data)
         for channel_name, data in channels_data.items():
-            channel_data = numpy.array(data)
+            channel_data = numpy.asarray(data, dtype=float)
 
             (_min, _max, min_at, max_at, half_max, com, mean, _int,
              fwhm, cen) = self._calcStats(motor_data, channel_data)
@@ -37,6 +37,7 @@ from taurus.core.util.log import Logger
 from taurus.core.util.containers import CaselessDict
 
 from sardana import InvalidId, ElementType, Interface
+from sardana import sardanacustomsettings
 from sardana.sardanaevent import EventType
 from sardana.sardanamodulemanager import ModuleManager
 from sardana.sardanamanager import SardanaElementManager, SardanaIDManager
@@ -183,6 +184,9 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
         :type env_db: :obj:`str`
         """
         self.environment_manager.setEnvironmentDb(environment_db)
+        if getattr(sardanacustomsettings, "MS_MACRO_CACHE", False):
+            self.macro_manager.setMacroCache(
+                os.path.abspath(environment_db) + ".macrocache")
 
     # --------------------------------------------------------------------------
     # Python related methods
@@ -425,6 +429,10 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
     def environment_manager(self):
         return self._environment_manager
 
+    @property
+    def scan_history(self):
+        return self._environment_manager.scan_history
+
     @property
     def type_manager(self):
         return self._type_manager
@@ -687,8 +695,9 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
                 d = change
             d[key] = value
 
-        del_keys = env_man.unsetEnv(del_env)
-        env_man.setEnvObj(new_change_env)
+        with env_man.transaction():
+            del_keys = env_man.unsetEnv(del_env)
+            env_man.setEnvObj(new_change_env)
 
         evt = dict(new=new, change=change)
         evt['del'] = del_keys
@@ -31,7 +31,10 @@ __all__ = ["EnvironmentManager"]
 __docformat__ = 'restructuredtext'
 
 import os
+import atexit
 import shelve
+import threading
+import contextlib
 from itertools import zip_longest
 import operator
 
@@ -39,8 +42,9 @@ from taurus.core.util.containers import CaselessDict
 
 from sardana.macroserver.msmanager import MacroServerManager
 from sardana.macroserver.msexception import UnknownEnv
+from sardana.macroserver.msscanhistory import ScanHistory
 from sardana import sardanacustomsettings
-import collections
+import collections.abc
 
 
 def _dbm_gnu(filename):
@@ -53,6 +57,49 @@ def _dbm_dumb(filename):
     return dbm.dumb.open(filename, "c")
 
 
+class _SQLiteDict(collections.abc.MutableMapping):
+    """Dictionary like database storing each key in a separate row of an
+    SQLite table (keys and values are bytes, as used by :class:`shelve.Shelf`).
+    Changes are committed on :meth:`sync`."""
+
+    def __init__(self, filename):
+        import sqlite3
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS env "
+                           "(key BLOB PRIMARY KEY, value BLOB)")
+        self._conn.commit()
+
+    def __getitem__(self, key):
+        row = self._conn.execute("SELECT value FROM env WHERE key = ?",
+                                 (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO env (key, value) "
+                           "VALUES (?, ?)", (key, value))
+
+    def __delitem__(self, key):
+        cursor = self._conn.execute("DELETE FROM env WHERE key = ?", (key,))
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self):
+        rows = self._conn.execute("SELECT key FROM env").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM env").fetchone()[0]
+
+    def sync(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+
 def _dbm_shelve(filename, backend):
     if backend is None:
         try:
@@ -110,6 +157,27 @@ class EnvironmentManager(MacroServerManager):
         #  - value: environment value
         self._global_env = None
 
+        # protects the environment db writes
+        self._env_lock = threading.RLock()
+        # nesting level of the ongoing transactions
+        self._transaction_level = 0
+        # True if there are changes not synchronized to the environment db
+        self._dirty = False
+        # write-behind mode: period (s) of synchronizing the changes to the
+        # environment db (None or 0 means synchronize on every change)
+        self._sync_period = getattr(sardanacustomsettings,
+                                    "MS_ENV_SYNC_PERIOD", None)
+        self._sync_timer = None
+        if self._sync_period:
+            atexit.register(self.flush)
+
+        # scan history store (in memory until the environment db is set)
+        self._scan_history_max_size = getattr(
+            sardanacustomsettings, "MS_SCAN_HISTORY_MAX_SIZE", 1000)
+        self._scan_history = ScanHistory(
+            max_size=self._scan_history_max_size,
+            name=self.getLogName() + ".ScanHistory")
+
         self._initEnv()
 
         MacroServerManager.reInit(self)
@@ -119,6 +187,8 @@ class EnvironmentManager(MacroServerManager):
             return
 
         self._clearEnv()
+        if self._sync_period:
+            atexit.unregister(self.flush)
 
         MacroServerManager.cleanUp(self)
 
@@ -127,10 +197,50 @@ class EnvironmentManager(MacroServerManager):
         self._door_env = CaselessDict()
 
     def _clearEnv(self):
+        self._closeEnv()
+        self._scan_history.close()
         self._env = self._macro_env = self._global_env = self._door_env = None
 
+    def _closeEnv(self):
+        """Synchronizes the pending changes and closes the environment db"""
+        with self._env_lock:
+            self.flush()
+            if self._env is not None:
+                self._env.close()
+                self._env = None
+
+    def _openSQLiteEnv(self, f_name):
+        """Opens the SQLite environment db. If it does not exist yet but the
+        shelve environment db exists its content is migrated. The migration
+        is done into a temporary file which is renamed only when it
+        finishes, so an interrupted migration is retried on the next start.
+        """
+        sqlite_name = f_name + ".sqlite"
+        migrate = (not os.path.exists(sqlite_name)
+                   and (os.path.exists(f_name)
+                        or os.path.exists(f_name + ".dat")))
+        if migrate:
+            self.info("Migrating environment from %s to %s", f_name,
+                      sqlite_name)
+            tmp_name = sqlite_name + ".tmp"
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            tmp_env = shelve.Shelf(_SQLiteDict(tmp_name))
+            try:
+                old_env = shelve.open(f_name, flag='r')
+                try:
+                    for key, value in old_env.items():
+                        tmp_env[key] = value
+                finally:
+                    old_env.close()
+            finally:
+                tmp_env.close()
+            os.replace(tmp_name, sqlite_name)
+        return shelve.Shelf(_SQLiteDict(sqlite_name))
+
     def setEnvironmentDb(self, f_name):
         """Sets up a new environment from a file"""
+        self._closeEnv()
         self._initEnv()
         f_name = os.path.abspath(f_name)
         self._env_name = f_name
@@ -143,7 +253,16 @@ class EnvironmentManager(MacroServerManager):
                 self.error("Creating environment: %s" % ose.strerror)
                 self.debug("Details:", exc_info=1)
                 raise ose
-        if os.path.exists(f_name) or os.path.exists(f_name + ".dat"):
+        backend = getattr(sardanacustomsettings, "MS_ENV_SHELVE_BACKEND",
+                          None)
+        if backend == "sqlite":
+            try:
+                self._env = self._openSQLiteEnv(f_name)
+            except Exception:
+                self.error("Failed to access environment in %s", f_name)
+                self.debug("Details:", exc_info=1)
+                raise
+        elif os.path.exists(f_name) or os.path.exists(f_name + ".dat"):
             try:
                 self._env = shelve.open(f_name, flag='w', writeback=False)
             except Exception:
@@ -151,8 +270,6 @@ class EnvironmentManager(MacroServerManager):
                 self.debug("Details:", exc_info=1)
                 raise
         else:
-            backend = getattr(sardanacustomsettings, "MS_ENV_SHELVE_BACKEND",
-                              None)
             try:
                 self._env = shelve.Shelf(_dbm_shelve(f_name, backend))
             except Exception:
@@ -169,6 +286,28 @@ class EnvironmentManager(MacroServerManager):
             self.error("Failed to fill local enviroment cache")
             self.debug("Details:", exc_info=1)
 
+        self._setScanHistory(f_name + ".scanhistory")
+
+    def _setScanHistory(self, f_name):
+        """Sets up the scan history store. If it is empty, the scan history
+        stored in the ScanHistory environment is migrated to it."""
+        self._scan_history.close()
+        self._scan_history = ScanHistory(
+            f_name, self._scan_history_max_size,
+            name=self.getLogName() + ".ScanHistory")
+        if len(self._scan_history) == 0:
+            scan_history = self._global_env.get("ScanHistory")
+            if scan_history:
+                self.info("Migrating ScanHistory environment to %s", f_name)
+                self._scan_history.extend(scan_history)
+
+    @property
+    def scan_history(self):
+        """The scan history store
+
+        :rtype: :class:`~sardana.macroserver.msscanhistory.ScanHistory`"""
+        return self._scan_history
+
     def _fillEnvironmentCaches(self, env):
         # fill the three environment caches
         env_dict = self._global_env
@@ -457,24 +596,74 @@ class EnvironmentManager(MacroServerManager):
                 self._door_env[door_name] = d = {}
         return d, key
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """Context manager grouping environment changes so they are
+        synchronized to the environment db once, at the end of the
+        outermost transaction.
+
+        .. note::
+            The transaction method has been included in Sardana on a
+            provisional basis. Backwards incompatible changes (up to and
+            including its removal) may occur if deemed necessary by the core
+            developers.
+        """
+        with self._env_lock:
+            self._transaction_level += 1
+            try:
+                yield
+            finally:
+                self._transaction_level -= 1
+                if self._transaction_level == 0 and self._dirty:
+                    self._commit()
+
+    def _envChanged(self):
+        self._dirty = True
+        if self._transaction_level == 0:
+            self._commit()
+
+    def _commit(self):
+        """Synchronizes the changes to the environment db, immediately or
+        after the sync period in the write-behind mode"""
+        if not self._sync_period:
+            self.flush()
+            return
+        if self._sync_timer is None:
+            self._sync_timer = threading.Timer(self._sync_period, self.flush)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def flush(self):
+        """Synchronizes the pending changes to the environment db"""
+        with self._env_lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._dirty and self._env is not None:
+                self._env.sync()
+            self._dirty = False
+
     def _setOneEnv(self, key, value):
-        self._env[key] = value
-        self._env.sync()
+        with self._env_lock:
+            self._env[key] = value
+            self._envChanged()
         d, key = self._getCacheForKey(key)
         d[key] = value
 
     def _unsetOneEnv(self, key):
-        if key not in self._env:
-            raise UnknownEnv("Unknown environment %s" % key)
-        del self._env[key]
-        self._env.sync()
+        with self._env_lock:
+            if key not in self._env:
+                raise UnknownEnv("Unknown environment %s" % key)
+            del self._env[key]
+            self._envChanged()
         d, key = self._getCacheForKey(key)
         if key in d:
             del d[key]
 
     def _unsetEnv(self, env_names):
-        for key in env_names:
-            self._unsetOneEnv(key)
+        with self.transaction():
+            for key in env_names:
+                self._unsetOneEnv(key)
 
     def setEnvObj(self, obj):
         """Sets the environment for the given object. If object is a sequence
@@ -489,15 +678,16 @@ class EnvironmentManager(MacroServerManager):
 
         @return a dict representing the added environment"""
 
-        if isinstance(obj, collections.Sequence) and \
+        if isinstance(obj, collections.abc.Sequence) and \
            not isinstance(obj, str):
             obj = self._dictFromSequence(obj)
-        elif not isinstance(obj, collections.Mapping):
+        elif not isinstance(obj, collections.abc.Mapping):
             raise TypeError("obj parameter must be a sequence or a map")
 
         obj = self._encode(obj)
-        for k, v in obj.items():
-            self._setOneEnv(k, v)
+        with self.transaction():
+            for k, v in obj.items():
+                self._setOneEnv(k, v)
         return obj
 
     def setEnv(self, key, value):
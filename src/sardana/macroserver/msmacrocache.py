@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains the class definition for the MacroServer macro
+library metadata cache"""
+
+__all__ = ["MacroLibraryCache"]
+
+__docformat__ = 'restructuredtext'
+
+from sardana.sardanalibrarycache import LibraryCache
+from sardana.macroserver.msparameter import Optional
+
+
+class MacroLibraryCache(LibraryCache):
+    """Persistent cache of the macro libraries metadata: macro names, types,
+    descriptions, source code, parameter and result definitions and hints.
+
+    .. note::
+        The MacroLibraryCache class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    PERSISTENT_OBJECTS = {"Optional": Optional}
+
+    def __init__(self, filename, name="MacroLibraryCache"):
+        LibraryCache.__init__(self, filename, name)
+
+    def getMetadata(self, macro_lib):
+        macros = []
+        for macro in macro_lib.get_macros():
+            macros.append(dict(name=macro.name,
+                               elem_type=macro.get_type(),
+                               description=macro.description,
+                               code=macro.code,
+                               parameter=macro.get_parameter(),
+                               result=macro.get_result(),
+                               hints=macro.code_object.hints))
+        return dict(macros=macros)
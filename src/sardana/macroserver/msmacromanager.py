@@ -39,6 +39,7 @@ import logging
 import functools
 import traceback
 import threading
+import concurrent.futures
 
 from lxml import etree
 
@@ -58,7 +59,9 @@ from sardana.sardanautils import is_pure_str, is_non_str_seq, recur_map
 
 from sardana.macroserver.msmanager import MacroServerManager
 from sardana.macroserver.msmetamacro import MACRO_TEMPLATE, MacroLibrary, \
-    MacroClass, MacroFunction
+    MacroClass, MacroFunction, LazyMacroLibrary, LazyMacroClass, \
+    LazyMacroFunction
+from sardana.macroserver.msmacrocache import MacroLibraryCache
 from sardana.macroserver.msparameter import ParamDecoder, FlatParamDecoder, \
     WrongParam
 from sardana.macroserver.macro import Macro, MacroFunc, ExecMacroHook, \
@@ -189,6 +192,12 @@ class MacroManager(MacroServerManager):
         # value - MacroExecutor object for the door
         self._macro_executors = {}
 
+        # macro libraries metadata cache (None means disabled)
+        self._macro_cache = None
+
+        # protects the macro libraries (re)loading
+        self._macro_lib_lock = threading.RLock()
+
         MacroServerManager.reInit(self)
 
     def cleanUp(self):
@@ -202,6 +211,7 @@ class MacroManager(MacroServerManager):
         self._macro_dict = None
         self._modules = None
         self._overwritten_macros = None
+        self._macro_cache = None
 
         MacroServerManager.cleanUp(self)
 
@@ -226,17 +236,92 @@ class MacroManager(MacroServerManager):
         self._macro_path = p
 
         macro_file_names = self._findMacroLibNames()
-        for mod_name, file_name in macro_file_names.items():
-            dir_name = os.path.dirname(file_name)
-            path = [dir_name]
-            try:
-                self.reloadMacroLib(mod_name, path)
-            except:
-                pass
+        cache = self._macro_cache
+        with self._macro_lib_lock:
+            cached = {}
+            if cache is not None:
+                for mod_name, file_name in macro_file_names.items():
+                    entry = cache.get(file_name)
+                    if entry is not None:
+                        cached[mod_name] = entry
+            validations = self._validateMacroLibs(
+                [(mod_name, file_name)
+                 for mod_name, file_name in macro_file_names.items()
+                 if mod_name not in cached])
+            for mod_name, file_name in macro_file_names.items():
+                try:
+                    if mod_name in cached:
+                        self._addLazyMacroLib(mod_name, file_name,
+                                              cached[mod_name])
+                    else:
+                        dir_name = os.path.dirname(file_name)
+                        self._reloadMacroLib(mod_name, [dir_name],
+                                             validations.get(mod_name))
+                except:
+                    pass
+            if cache is not None:
+                self.info("%d macro libraries restored from the cache",
+                          len(cached))
+                cache.save()
 
     def getMacroPath(self):
         return self._macro_path
 
+    def setMacroCache(self, filename):
+        """Sets the macro libraries metadata cache. Macro libraries which did
+        not change since they were cached are not imported when the macro
+        path is set but on the first use of their macros code.
+
+        .. note::
+            The macro cache has been included in Sardana on a provisional
+            basis. Backwards incompatible changes (up to and including its
+            removal) may occur if deemed necessary by the core developers.
+
+        :param filename: cache file name or None to disable the cache
+        :type filename: :obj:`str`
+        """
+        if filename is None:
+            self._macro_cache = None
+        else:
+            self._macro_cache = MacroLibraryCache(
+                filename, name=self.getLogName() + ".MacroLibraryCache")
+
+    def getMacroCache(self):
+        """Returns the macro libraries metadata cache or None if it is
+        disabled.
+
+        :rtype: :class:`~sardana.macroserver.msmacrocache.MacroLibraryCache`
+        """
+        return self._macro_cache
+
+    def _validateMacroLibs(self, macro_file_names):
+        """Validates the given macro libraries concurrently, so their (cold)
+        imports run in parallel, if allowed by the MS_MACRO_IMPORT_WORKERS
+        setting.
+
+        :param macro_file_names: sequence of module name and file name pairs
+        :return: dictionary of module names and validation results as
+            returned by
+            :meth:`~sardana.sardanamodulemanager.ModuleManager.isValidModule`
+            (empty if the libraries were not validated)
+        :rtype: :obj:`dict`
+        """
+        from sardana import sardanacustomsettings
+        workers = getattr(sardanacustomsettings, "MS_MACRO_IMPORT_WORKERS",
+                          None)
+        if not workers or workers < 2 or len(macro_file_names) < 2:
+            return {}
+        mod_manager = ModuleManager()
+
+        def validate(item):
+            mod_name, file_name = item
+            return mod_manager.isValidModule(mod_name,
+                                             [os.path.dirname(file_name)])
+
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            results = executor.map(validate, macro_file_names)
+            return dict(zip([item[0] for item in macro_file_names], results))
+
     def _findMacroLibName(self, lib_name, path=None):
         path = path or self.getMacroPath()
         f_name = lib_name
@@ -474,10 +559,20 @@ class MacroManager(MacroServerManager):
             a list of absolute path to search for libraries [default: None,
             means the current MacroPath will be used]
         :return: the MacroLibrary object for the reloaded macro library"""
+        with self._macro_lib_lock:
+            try:
+                return self._reloadMacroLib(module_name, path)
+            finally:
+                if self._macro_cache is not None:
+                    self._macro_cache.save()
+
+    def _reloadMacroLib(self, module_name, path=None, validation=None):
         path = path or self.getMacroPath()
         mod_manager = ModuleManager()
         m, exc_info = None, None
-        valid, exc_info = mod_manager.isValidModule(module_name, path)
+        if validation is None:
+            validation = mod_manager.isValidModule(module_name, path)
+        valid, exc_info = validation
         if not valid:
             params = dict(module=m, name=module_name,
                           macro_server=self.macro_server, exc_info=exc_info)
@@ -490,7 +585,7 @@ class MacroManager(MacroServerManager):
                 self._macro_dict.pop(macro.name)
 
         try:
-            m = mod_manager.reloadModule(module_name, path)
+            m = mod_manager.reloadModule(module_name, path, validate=False)
         except:
             exc_info = sys.exc_info()
         macro_lib = None
@@ -520,21 +615,8 @@ class MacroManager(MacroServerManager):
                                           logger=self)
             for _, macro in inspect.getmembers(m, _is_macro):
                 try:
-                    isoverwritten = False
-                    macro_name = macro.__name__
-                    if macro_name in self._overwritten_macros:
-                        isoverwritten = True
-                    elif (macro_name in list(self._macro_dict.keys())
-                            and self._macro_dict[macro_name].lib != macro_lib):
-                        isoverwritten = True
-                        msg = ('Macro "{0}" defined in "{1}" macro library'
-                               + ' has been overwritten by "{2}" macro library'
-                               )
-                        old_lib_name = self._macro_dict[macro_name].lib.name
-                        self.debug(msg.format(macro_name, old_lib_name,
-                                              macro_lib.name))
-                        self._overwritten_macros.append(macro_name)
-
+                    isoverwritten = self._isMacroOverwritten(macro.__name__,
+                                                             macro_lib)
                     self.addMacro(macro_lib, macro, isoverwritten)
                     count_correct_macros += 1
                 except Exception as e:
@@ -545,6 +627,11 @@ class MacroManager(MacroServerManager):
         try:
             if macro_lib.has_macros():
                 self._modules[module_name] = macro_lib
+            if self._macro_cache is not None:
+                if m is None or macro_errors:
+                    self._macro_cache.remove(macro_lib.file_path)
+                else:
+                    self._macro_cache.update(macro_lib)
             return macro_lib
         finally:
             if macro_errors:
@@ -567,6 +654,110 @@ class MacroManager(MacroServerManager):
                     msg += "\nUse relmaclib to reload the corrected macro(s)\n"
                 raise Exception(msg)
 
+    def _isMacroOverwritten(self, macro_name, macro_lib):
+        if macro_name in self._overwritten_macros:
+            return True
+        old_macro = self._macro_dict.get(macro_name)
+        if old_macro is None or old_macro.lib == macro_lib:
+            return False
+        msg = ('Macro "{0}" defined in "{1}" macro library'
+               + ' has been overwritten by "{2}" macro library')
+        self.debug(msg.format(macro_name, old_macro.lib.name, macro_lib.name))
+        self._overwritten_macros.append(macro_name)
+        return True
+
+    def _addLazyMacroLib(self, module_name, file_name, entry):
+        """Registers the macro library restored from the cache without
+        importing its module"""
+        old_macro_lib = self._modules.pop(module_name, None)
+        if old_macro_lib is not None:
+            for macro in old_macro_lib.get_macros():
+                self._macro_dict.pop(macro.name)
+        macro_lib = LazyMacroLibrary(name=module_name, file_path=file_name,
+                                     description=entry["description"],
+                                     macro_server=self.macro_server)
+        for info in entry["macros"]:
+            macro_name = info["name"]
+            isoverwritten = self._isMacroOverwritten(macro_name, macro_lib)
+            params = dict(macro_server=self.macro_server, lib=macro_lib,
+                          info=info, isoverwritten=isoverwritten)
+            if info["elem_type"] == ElementType.MacroClass:
+                macro = LazyMacroClass(**params)
+                macro_lib.add_macro_class(macro)
+            else:
+                macro = LazyMacroFunction(**params)
+                macro_lib.add_macro_function(macro)
+            self._macro_dict[macro_name] = macro
+        if macro_lib.has_macros():
+            self._modules[module_name] = macro_lib
+        return macro_lib
+
+    def importMacroLib(self, macro_lib):
+        """Imports the python module of the macro library restored from the
+        cache and replaces the library and its macros with the imported ones.
+        If the library file has changed meanwhile it is simply reloaded.
+
+        :raises:
+            LibraryError in case the import is not successful
+
+        :param macro_lib: macro library restored from the cache
+        :type macro_lib:
+            :class:`~sardana.macroserver.msmetamacro.LazyMacroLibrary`
+        :return: the MacroLibrary object for the imported macro library"""
+        module_name = macro_lib.name
+        with self._macro_lib_lock:
+            current_macro_lib = self._modules.get(module_name)
+            if current_macro_lib is not macro_lib:
+                # already imported or reloaded
+                if current_macro_lib is None:
+                    raise UnknownMacroLibrary("Unknown macro library %s" %
+                                              module_name)
+                return current_macro_lib
+            cache = self._macro_cache
+            if cache is None or cache.get(macro_lib.file_path) is None:
+                self.info("Macro library %s changed, reloading it",
+                          module_name)
+                return self.reloadMacroLib(module_name, [macro_lib.path])
+            self.debug("Importing cached macro library %s", module_name)
+            try:
+                m = ModuleManager().reloadModule(module_name,
+                                                 [macro_lib.path],
+                                                 validate=False)
+            except Exception as e:
+                raise LibraryError("Error importing macro library %s: %s" %
+                                   (module_name, e),
+                                   exc_info=sys.exc_info())
+            if m is None:
+                raise LibraryError("Error importing macro library %s" %
+                                   module_name)
+            new_macro_lib = MacroLibrary(module=m, name=module_name,
+                                         macro_server=self.macro_server)
+            _is_macro = functools.partial(is_macro,
+                                          abs_file=new_macro_lib.file_path,
+                                          logger=self)
+            for _, code in inspect.getmembers(m, _is_macro):
+                macro_name = code.__name__
+                lazy_macro = macro_lib.get_macro(macro_name)
+                if lazy_macro is None:
+                    isoverwritten = self._isMacroOverwritten(macro_name,
+                                                             new_macro_lib)
+                else:
+                    isoverwritten = lazy_macro.isoverwritten
+                params = dict(macro_server=self.macro_server,
+                              lib=new_macro_lib, isoverwritten=isoverwritten)
+                if inspect.isclass(code):
+                    macro = MacroClass(klass=code, **params)
+                    new_macro_lib.add_macro_class(macro)
+                else:
+                    macro = MacroFunction(function=code, **params)
+                    new_macro_lib.add_macro_function(macro)
+                # macros overwritten by other libraries stay overwritten
+                old_macro = self._macro_dict.get(macro_name)
+                if old_macro is None or old_macro is lazy_macro:
+                    self._macro_dict[macro_name] = macro
+            self._modules[module_name] = new_macro_lib
+            return new_macro_lib
+
     def addMacro(self, macro_lib, macro, isoverwritten=False):
         add = self.addMacroFunction
         if inspect.isclass(macro):
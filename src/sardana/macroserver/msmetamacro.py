@@ -26,15 +26,19 @@
 """This module contains the class definition for the MacroServer meta macro
 information"""
 
-__all__ = ["MACRO_TEMPLATE", "MacroLibrary", "MacroClass", "MacroFunction"]
+__all__ = ["MACRO_TEMPLATE", "MacroLibrary", "MacroClass", "MacroFunction",
+           "LazyMacroLibrary", "LazyMacroClass", "LazyMacroFunction"]
 
 __docformat__ = 'restructuredtext'
 
 import inspect
+import weakref
 import operator
 
 from sardana import InvalidId, ElementType
-from sardana.sardanameta import SardanaLibrary, SardanaClass, SardanaFunction
+from sardana.sardanabase import SardanaBaseObject
+from sardana.sardanameta import SardanaLibrary, SardanaCode, SardanaClass, \
+    SardanaFunction
 from sardana.macroserver.msparameter import Type
 import collections
 
@@ -315,3 +319,113 @@ class MacroFunction(SardanaFunction, Parameterizable):
 
     def get_hints_definition(self):
         return self.function.hints or ()
+
+
+class LazyMacroLibrary(MacroLibrary):
+    """Object representing a macro library restored from the
+    :class:`~sardana.macroserver.msmacrocache.MacroLibraryCache` which python
+    module has not been imported yet. The module is imported on the first
+    use of the code of any of its macros.
+
+    .. note::
+        The LazyMacroLibrary class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    def __init__(self, **kwargs):
+        description = kwargs.pop('description')
+        MacroLibrary.__init__(self, **kwargs)
+        self.description = description
+
+    @property
+    def code(self):
+        """Returns a sequence of sourcelines corresponding to the module code
+        (read from the module file).
+
+           :return: list of source code lines
+           :rtype: list<str>"""
+        with open(self.file_path) as f:
+            return f.readlines()
+
+
+class LazyMacro(object):
+    """Helper class for the macro (class or function) restored from the
+    :class:`~sardana.macroserver.msmacrocache.MacroLibraryCache`. Its
+    description, code, parameters, result and hints are served from the cache
+    and the macro library is imported on the first access to the code
+    object (e.g. when the macro is executed)."""
+
+    def __init__(self, **kwargs):
+        lib = kwargs.pop('lib')
+        info = kwargs.pop('info')
+        self._lib = weakref.ref(lib)
+        self._code_obj = None
+        self.description = info['description']
+        self._code = info['code']
+        self._parameter = info['parameter']
+        self._result = info['result']
+        self._hints = info['hints']
+        name = info['name']
+        kwargs['manager'] = kwargs.pop('macro_server')
+        kwargs['elem_type'] = info['elem_type']
+        kwargs['name'] = name
+        kwargs['full_name'] = "{0}.{1}".format(lib.name, name)
+        kwargs['parent'] = lib
+        SardanaBaseObject.__init__(self, **kwargs)
+
+    @property
+    def code_object(self):
+        if self._code_obj is None:
+            macro_manager = self.get_manager().macro_manager
+            lib = self.lib
+            if lib is None:
+                # the library was meanwhile reloaded
+                macro = macro_manager.getMacro(self.name)
+            else:
+                macro_lib = macro_manager.importMacroLib(lib)
+                macro = macro_lib.get_macro(self.name)
+                if macro is None:
+                    raise Exception("Macro %s no longer exists in %s" %
+                                    (self.name, macro_lib.name))
+            self._code_obj = macro.code_object
+        return self._code_obj
+
+    def get_hints_definition(self):
+        return self._hints
+
+    def serialize(self, *args, **kwargs):
+        kwargs = SardanaCode.serialize(self, *args, **kwargs)
+        kwargs['macro_server'] = self.get_manager().name
+        kwargs['id'] = InvalidId
+        kwargs['hints'] = self._hints
+        kwargs['parameters'] = self.get_parameter()
+        kwargs['result'] = self.get_result()
+        return kwargs
+
+
+class LazyMacroClass(LazyMacro, MacroClass):
+    """Macro class restored from the
+    :class:`~sardana.macroserver.msmacrocache.MacroLibraryCache`
+
+    .. note::
+        The LazyMacroClass class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+    pass
+
+
+class LazyMacroFunction(LazyMacro, MacroFunction):
+    """Macro function restored from the
+    :class:`~sardana.macroserver.msmacrocache.MacroLibraryCache`
+
+    .. note::
+        The LazyMacroFunction class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+    pass
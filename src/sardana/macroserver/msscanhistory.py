@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains the class definition for the MacroServer scan history
+store"""
+
+__all__ = ["ScanHistory"]
+
+__docformat__ = 'restructuredtext'
+
+import os
+import pickle
+import threading
+
+from taurus.core.util.log import Logger
+
+
+class ScanHistory(Logger):
+    """Scan history store.
+
+    The scan history entries (dictionaries with at least the *serialno* key)
+    are appended to a log file and indexed by the serial number, so storing
+    a new entry or looking up one does not require loading the whole history.
+    Only the last *max_size* entries are retained. When the log grows twice as
+    big, it is compacted.
+
+    If *filename* is None the history is kept in memory only.
+
+    .. note::
+        The ScanHistory class has been included in Sardana on a provisional
+        basis. Backwards incompatible changes (up to and including its
+        removal) may occur if deemed necessary by the core developers.
+    """
+
+    def __init__(self, filename=None, max_size=1000, name="ScanHistory"):
+        self.call__init__(Logger, name)
+        self._filename = filename
+        self._max_size = max_size
+        self._lock = threading.RLock()
+        # list of entries (in memory) or file offsets of entries (in log)
+        # in order of appending
+        self._entries = []
+        # serial numbers of the entries in order of appending
+        self._serialnos = []
+        # dict<int, int> where:
+        #  - key: scan serial number
+        #  - value: position of the last entry with this serial number
+        #    in self._entries
+        self._index = {}
+        # position in self._entries of the first retained entry
+        self._first = 0
+        self._file = None
+        if filename is not None:
+            self._load()
+
+    def _load(self):
+        """Opens the log file and builds the index"""
+        self._file = open(self._filename, "a+b")
+        self._file.seek(0)
+        offset = 0
+        while True:
+            try:
+                entry = pickle.load(self._file)
+            except EOFError:
+                break
+            except Exception:
+                self.warning("Discarding corrupted scan history entries "
+                             "from %s", self._filename)
+                self.debug("Details:", exc_info=1)
+                self._file.truncate(offset)
+                break
+            self._addToIndex(entry, offset)
+            offset = self._file.tell()
+        self._retain()
+
+    def _addToIndex(self, entry, item):
+        serialno = entry["serialno"]
+        self._index[serialno] = len(self._entries)
+        self._entries.append(item)
+        self._serialnos.append(serialno)
+
+    def _retain(self):
+        """Discards the entries over the retention limit and compacts the log
+        file when it holds twice as many entries as retained"""
+        first = max(len(self._entries) - self._max_size, 0)
+        for position in range(self._first, first):
+            serialno = self._serialnos[position]
+            if self._index.get(serialno) == position:
+                del self._index[serialno]
+            if self._filename is None:
+                self._entries[position] = None
+        self._first = max(first, self._first)
+        if self._first >= self._max_size:
+            self._compact()
+
+    def _compact(self):
+        entries = self.getLast()
+        self._entries, self._serialnos = [], []
+        self._index, self._first = {}, 0
+        if self._filename is None:
+            for entry in entries:
+                self._addToIndex(entry, entry)
+            return
+        tmp_filename = self._filename + ".tmp"
+        with open(tmp_filename, "wb") as f:
+            for entry in entries:
+                offset = f.tell()
+                pickle.dump(entry, f)
+                self._addToIndex(entry, offset)
+        self._file.close()
+        os.replace(tmp_filename, self._filename)
+        self._file = open(self._filename, "a+b")
+
+    def _read(self, position):
+        item = self._entries[position]
+        if self._filename is None:
+            return item
+        self._file.seek(item)
+        return pickle.load(self._file)
+
+    def __len__(self):
+        return len(self._entries) - self._first
+
+    def __contains__(self, serialno):
+        return serialno in self._index
+
+    def append(self, entry):
+        """Appends a scan history entry.
+
+        :param entry: scan history entry (must contain *serialno* key)
+        :type entry: :obj:`dict`
+        """
+        with self._lock:
+            if self._filename is None:
+                self._addToIndex(entry, entry)
+            else:
+                self._file.seek(0, os.SEEK_END)
+                offset = self._file.tell()
+                pickle.dump(entry, self._file)
+                self._file.flush()
+                self._addToIndex(entry, offset)
+            self._retain()
+
+    def extend(self, entries):
+        """Appends scan history entries.
+
+        :param entries: scan history entries
+        :type entries: seq<:obj:`dict`>
+        """
+        for entry in entries:
+            self.append(entry)
+
+    def get(self, serialno, default=None):
+        """Returns the scan history entry of the given serial number (the last
+        one if the serial number was repeated).
+
+        :param serialno: scan serial number
+        :type serialno: :obj:`int`
+        :param default: value returned if the entry does not exist
+        :return: scan history entry
+        :rtype: :obj:`dict`
+        """
+        with self._lock:
+            position = self._index.get(serialno)
+            if position is None:
+                return default
+            return self._read(position)
+
+    def getLast(self, nb=None):
+        """Returns the last scan history entries.
+
+        :param nb: number of entries (None means all retained entries)
+        :type nb: :obj:`int`
+        :return: scan history entries in order of appending
+        :rtype: :obj:`list`<:obj:`dict`>
+        """
+        with self._lock:
+            start = self._first
+            if nb is not None:
+                start = max(len(self._entries) - nb, self._first)
+            return [self._read(position)
+                    for position in range(start, len(self._entries))]
+
+    def close(self):
+        """Closes the log file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
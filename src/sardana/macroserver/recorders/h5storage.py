@@ -34,6 +34,7 @@ __docformat__ = 'restructuredtext'
 
 import os
 import re
+import time
 import posixpath
 from datetime import datetime
 import numpy
@@ -73,6 +74,13 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
                         'uint16', 'uint32',
                         'uint64', str_dt, byte_dt)
     _dataCompressionRank = -1
+    #: number of records accumulated in memory before writing them to the
+    #: file (1 means write every record immediately)
+    _bufferSize = 1
+    #: minimum time (s) between file flushes (0 means flush on every write)
+    _flushPeriod = 0
+    #: approximate size (bytes) of the chunks of the buffered datasets
+    ChunkSize = 2 ** 20
 
     def __init__(self, filename=None, macro=None, overwrite=False, **pars):
         BaseFileRecorder.__init__(self, **pars)
@@ -85,6 +93,9 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
         self.currentlist = None
         self._nxclass_map = {}
         self.entryname = 'entry'
+        self._buffer = {}
+        self._nb_records = 0
+        self._last_flush_time = None
 
         scheme = r'([A-Za-z][A-Za-z0-9\.\+\-]*)'
         authority = (r'//(?P<host>([\w\-_]+\.)*[\w\-_]+)'
@@ -145,6 +156,10 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
         serialno = env['serialno']
         self._dataCompressionRank = env.get('DataCompressionRank',
                                             self._dataCompressionRank)
+        self._bufferSize = max(1, env.get('H5BufferSize', self._bufferSize))
+        self._flushPeriod = env.get('H5FlushPeriod', self._flushPeriod)
+        self._buffer = {}
+        self._nb_records = 0
 
         # open/create the file and store its descriptor
         self.fd = self._openFile(self.filename)
@@ -234,15 +249,24 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
         _meas = nxentry.create_group('measurement')
         _meas.attrs['NX_class'] = 'NXcollection'
         if self.savemode == SaveModes.Record:
+            # in buffered mode preallocate the datasets to the estimated
+            # number of points (trimmed at the end of the scan)
+            nb_points = 0
+            intervals = env.get('total_scan_intervals')
+            if self._isBuffered() and intervals is not None:
+                # negative estimations have the "at least" semantics
+                intervals = abs(intervals)
+                if numpy.isfinite(intervals):
+                    nb_points = int(intervals) + 1
             # create extensible datasets
             for dd in self.datadesc:
-                shape = ([0] + list(dd.shape))
+                shape = ([nb_points] + list(dd.shape))
                 _ds = _meas.create_dataset(
                     dd.label,
                     dtype=dd.dtype,
                     shape=shape,
                     maxshape=([None] + list(dd.shape)),
-                    chunks=(1,) + tuple(dd.shape),
+                    chunks=self._chunks(dd),
                     compression=self._compression(shape)
                 )
                 if hasattr(dd, 'data_units'):
@@ -256,6 +280,28 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
         self._createPreScanSnapshot(env)
 
         self.fd.flush()
+        self._last_flush_time = time.time()
+
+    def _isBuffered(self):
+        """Returns True if records are accumulated in memory before writing
+        them to the file"""
+        return self._bufferSize > 1 or self._flushPeriod > 0
+
+    def _chunks(self, dd):
+        """Returns the chunk shape for the dataset of the given column.
+
+        In buffered mode the chunks span as many records as fit in
+        `ChunkSize` bytes (up to the buffer size), otherwise one record."""
+        shape = tuple(dd.shape)
+        rows = 1
+        if self._isBuffered():
+            try:
+                itemsize = numpy.dtype(dd.dtype).itemsize
+            except TypeError:
+                itemsize = 8
+            row_size = max(1, int(numpy.prod(shape)) * itemsize)
+            rows = max(1, min(self._bufferSize, self.ChunkSize // row_size))
+        return (rows,) + shape
 
     def _compression(self, shape, compfilter='gzip'):
         """
@@ -315,12 +361,10 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
     def _writeRecord(self, record):
         if self.filename is None:
             return
-        _meas = self.fd[posixpath.join(self.entryname, 'measurement')]
 
         for dd in self.datadesc:
             if dd.name in record.data:
                 data = record.data[dd.name]
-                _ds = _meas[dd.label]
                 if data is None:
                     data = numpy.zeros(dd.shape, dtype=dd.dtype)
                 # skip NaN if value reference is enabled
@@ -332,23 +376,58 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
                     self.debug('%s casted to %s (was %s)',
                                dd.label, dd.dtype, data.dtype.name)
                     data = data.astype(dd.dtype)
-
-                # resize the dataset and add the latest chunk
-                if _ds.shape[0] <= record.recordno:
-                    _ds.resize(record.recordno + 1, axis=0)
-
-                # write the slab of data
-                _ds[record.recordno, ...] = data
-
+                self._buffer.setdefault(dd.label, []).append(
+                    (record.recordno, data))
             else:
                 self.debug('missing data for label %r', dd.label)
-        self.fd.flush()
+        self._nb_records = max(self._nb_records, record.recordno + 1)
+
+        now = time.time()
+        flush_due = now - self._last_flush_time >= self._flushPeriod
+        if flush_due or self._bufferedRecords() >= self._bufferSize:
+            self._writeBuffer()
+        if flush_due:
+            self.fd.flush()
+            self._last_flush_time = now
+
+    def _bufferedRecords(self):
+        """Returns the maximum number of records buffered for a dataset"""
+        if not self._buffer:
+            return 0
+        return max(len(rows) for rows in self._buffer.values())
+
+    def _writeBuffer(self):
+        """Writes the buffered records to the datasets, as contiguous slabs
+        whenever the record numbers are consecutive"""
+        if not self._buffer:
+            return
+        _meas = self.fd[posixpath.join(self.entryname, 'measurement')]
+        for label, rows in self._buffer.items():
+            _ds = _meas[label]
+            last_recordno = rows[-1][0]
+            # resize the dataset to fit the latest slab
+            if _ds.shape[0] <= last_recordno:
+                _ds.resize(last_recordno + 1, axis=0)
+            first_recordno = rows[0][0]
+            if last_recordno - first_recordno + 1 == len(rows):
+                # write the slab of data
+                slab = numpy.array([data for _, data in rows])
+                slab = slab.reshape((len(rows),) + _ds.shape[1:])
+                _ds[first_recordno:last_recordno + 1, ...] = slab
+            else:
+                for recordno, data in rows:
+                    _ds[recordno, ...] = data
+        self._buffer = {}
 
     def _endRecordList(self, recordlist):
 
         if self.filename is None:
             return
 
+        if self.savemode == SaveModes.Record:
+            self._writeBuffer()
+            self._trimDatasets()
+
         self._populateInstrumentInfo()
         self._createNXData()
 
@@ -419,6 +498,14 @@ class NXscanH5_FileRecorder(BaseFileRecorder):
         self.fd.close()
         self.currentlist = None
 
+    def _trimDatasets(self):
+        """Shrinks the preallocated datasets to the number of records"""
+        _meas = self.fd[posixpath.join(self.entryname, 'measurement')]
+        for dd in self.datadesc:
+            _ds = _meas[dd.label]
+            if _ds.shape[0] > self._nb_records:
+                _ds.resize(self._nb_records, axis=0)
+
     def writeRecordList(self, recordlist):
         """Called when in BLOCK writing mode"""
         self._startRecordList(recordlist)
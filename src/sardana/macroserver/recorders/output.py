@@ -29,6 +29,7 @@ __all__ = ["JsonRecorder", "OutputRecorder"]
 
 __docformat__ = 'restructuredtext'
 
+import time
 import numpy
 import datetime
 import operator
@@ -43,12 +44,41 @@ import numbers
 
 
 class JsonRecorder(DataRecorder):
+    """Sends the scan data as JSON packets through the Door's RecordData
+    attribute.
+
+    The records are sent either one by one, in packets of type
+    *record_data*, or, if the batched mode is enabled (JsonRecorderBatchSize
+    and/or JsonRecorderBatchPeriod environment variables), coalesced in
+    packets of type *record_data_batch* with the data of the records in
+    columns (name as key and list of values as value). The *data_desc*
+    packet announces which of them is used in the scan by the
+    *record_data_version* key (:attr:`RECORD_DATA_VERSION` for batches,
+    missing for records sent one by one)."""
+
+    #: version of the record data protocol with batches of records
+    RECORD_DATA_VERSION = 2
 
     def __init__(self, stream, cols=None, **pars):
         DataRecorder.__init__(self, **pars)
         self._stream = weakref.ref(stream)
+        self._batchSize = 1
+        self._batchPeriod = 0
+        self._codec = 'utf8_json'
+        self._batch = None
+        self._batchLen = 0
+        self._sendTime = 0
+
+    def _isBatched(self):
+        return self._batchSize != 1
 
     def _startRecordList(self, recordlist):
+        env = recordlist.getEnviron()
+        self._batchPeriod = max(0, env.get('JsonRecorderBatchPeriod', 0))
+        # if only the period is set the batches are not limited in size
+        self._batchSize = max(0, env.get('JsonRecorderBatchSize',
+                                         0 if self._batchPeriod else 1))
+        self._codec = env.get('JsonRecorderCodec', 'utf8_json')
         macro_id = recordlist.getEnvironValue('macro_id')
         title = recordlist.getEnvironValue('title')
         counters = recordlist.getEnvironValue('counters')
@@ -82,26 +112,53 @@ class JsonRecorder(DataRecorder):
                 'scanfile': scanfile,
                 'scandir': scandir,
                 'serialno': serialno}
+        if self._isBatched():
+            data['record_data_version'] = self.RECORD_DATA_VERSION
+        self._batch = None
+        self._batchLen = 0
+        self._sendTime = time.time()
         self._sendPacket(type="data_desc", data=data, macro_id=macro_id)
 
     def _endRecordList(self, recordlist):
         macro_id = recordlist.getEnvironValue('macro_id')
+        self._sendBatch(macro_id)
         data = {'endtime': recordlist.getEnvironValue('endtime').ctime(),
                 'deadtime': recordlist.getEnvironValue('deadtime')}
         self._sendPacket(type="record_end", data=data, macro_id=macro_id)
 
     def _writeRecord(self, record):
         macro_id = self.recordlist.getEnvironValue('macro_id')
-        data = {}  # dict(record.data)
-        for k in self.column_desc:
-            name = k.name
-            data[name] = record.data[name]
-        self._sendPacket(type="record_data", data=data, macro_id=macro_id)
+        if not self._isBatched():
+            data = {}  # dict(record.data)
+            for k in self.column_desc:
+                name = k.name
+                data[name] = record.data[name]
+            self._sendPacket(type="record_data", data=data, macro_id=macro_id)
+            return
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = {k.name: [] for k in self.column_desc}
+        for name, values in batch.items():
+            values.append(record.data[name])
+        self._batchLen += 1
+        size = self._batchSize
+        if ((size and self._batchLen >= size)
+                or time.time() - self._sendTime >= self._batchPeriod > 0):
+            self._sendBatch(macro_id)
+
+    def _sendBatch(self, macro_id):
+        '''sends the batch of records (if any)'''
+        if self._batch is None:
+            return
+        data, self._batch, self._batchLen = self._batch, None, 0
+        self._sendTime = time.time()
+        self._sendPacket(type="record_data_batch", data=data,
+                         macro_id=macro_id)
 
     def _sendPacket(self, **kwargs):
         '''creates a JSON packet using the keyword arguments passed
         and then sends it'''
-        self._stream()._sendRecordData(kwargs, codec='utf8_json')
+        self._stream()._sendRecordData(kwargs, codec=self._codec)
 
     def _addCustomData(self, value, name, **kwargs):
         '''
@@ -115,6 +172,8 @@ class JsonRecorder(DataRecorder):
         except:
             pass
         macro_id = self._stream().getID()
+        # keep the order of the packets
+        self._sendBatch(macro_id)
         data = dict(kwargs)  # shallow copy
         data['name'] = name
         data['value'] = value
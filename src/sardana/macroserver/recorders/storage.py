@@ -99,6 +99,7 @@ class FIO_FileRecorder(BaseFileRecorder):
         self.setFileName(self.base_filename)
 
         envRec = recordlist.getEnviron()
+        self._setSyncPolicy(envRec)
 
         self.sampleTime = envRec['estimatedtime'] / \
             (envRec['total_scan_intervals'] + 1)
@@ -259,8 +260,7 @@ class FIO_FileRecorder(BaseFileRecorder):
         outLine = " Col %d %s %s\n" % (i, 'timestamp', 'DOUBLE')
         self.fd.write(outLine)
 
-        self.fd.flush()
-        os.fsync(self.fd.fileno())
+        self._syncFile()
 
     def _writeRecord(self, record):
         if self.filename is None:
@@ -288,8 +288,7 @@ class FIO_FileRecorder(BaseFileRecorder):
         outstr += '\n'
 
         fd.write(outstr)
-        fd.flush()
-        os.fsync(self.fd.fileno())
+        self._syncRecord()
 
         if len(self.mcaNames) > 0:
             self._writeMcaFile(record)
@@ -301,7 +300,7 @@ class FIO_FileRecorder(BaseFileRecorder):
         envRec = recordlist.getEnviron()
         end_time = envRec['endtime'].ctime()
         self.fd.write("! Acquisition ended at %s\n" % end_time)
-        self.fd.flush()
+        self._syncFile()
         self.fd.close()
 
     def _writeMcaFile(self, record):
@@ -410,6 +409,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
             return
 
         env = recordlist.getEnviron()
+        self._setSyncPolicy(env)
 
         # datetime object
         start_time = env['starttime']
@@ -490,8 +490,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
 
         self.fd = io.open(self.filename, 'a', newline='\n')
         self.fd.write(str(header % data))
-        self.fd.flush()
-        os.fsync(self.fd.fileno())
+        self._syncFile()
 
     def _prepareMultiLines(self, character, sep, items_list):
         '''Translate list of lists of items into multiple line string
@@ -589,8 +588,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
 
         fd.write(str(outstr))
 
-        fd.flush()
-        os.fsync(self.fd.fileno())
+        self._syncRecord()
 
     def _endRecordList(self, recordlist):
         if self.filename is None:
@@ -599,7 +597,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
         env = recordlist.getEnviron()
         end_time = env['endtime'].ctime()
         self.fd.write(str("#C Acquisition ended at %s\n" % end_time))
-        self.fd.flush()
+        self._syncFile()
         self.fd.close()
 
     def _addCustomData(self, value, name, **kwargs):
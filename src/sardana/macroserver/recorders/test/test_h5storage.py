@@ -32,6 +32,7 @@ from datetime import datetime
 import h5py
 import numpy
 from unittest import TestCase
+from taurus.test import insertTest
 
 from sardana.macroserver.scan import ColumnDesc
 from sardana.macroserver.recorders.h5storage import NXscanH5_FileRecorder
@@ -55,6 +56,9 @@ class Record(object):
         self.recordno = recordno
 
 
+@insertTest(helper_name="buffered_write", shape=tuple())
+@insertTest(helper_name="buffered_write", shape=(10,))
+@insertTest(helper_name="buffered_write", shape=(4, 4))
 class TestNXscanH5_FileRecorder(TestCase):
 
     def setUp(self):
@@ -188,6 +192,41 @@ class TestNXscanH5_FileRecorder(TestCase):
             for path in part_file_paths:
                 os.remove(path)
 
+    def _simulate_scan(self, shape, nb_records, buffer_size=None,
+                       flush_period=None, total_scan_intervals=None):
+        data_desc = [
+            ColumnDesc(name=COL1_NAME, label=COL1_NAME, dtype="float64",
+                       shape=shape)
+        ]
+        self.env["datadesc"] = data_desc
+        if buffer_size is not None:
+            self.env["H5BufferSize"] = buffer_size
+        if flush_period is not None:
+            self.env["H5FlushPeriod"] = flush_period
+        if total_scan_intervals is not None:
+            self.env["total_scan_intervals"] = total_scan_intervals
+        recorder = NXscanH5_FileRecorder(filename=self.path)
+        self.env["starttime"] = datetime.now()
+        recorder._startRecordList(self.record_list)
+        for i in range(nb_records):
+            record = Record({COL1_NAME: numpy.full(shape, i, "float64")}, i)
+            recorder._writeRecord(record)
+        self.env["endtime"] = datetime.now()
+        recorder._endRecordList(self.record_list)
+
+    def buffered_write(self, shape, nb_records=25):
+        """Test buffered writes to preallocated datasets in a simulated
+        sardana scan which finishes earlier than estimated."""
+        self._simulate_scan(shape, nb_records, buffer_size=10,
+                            flush_period=1, total_scan_intervals=99)
+        with h5py.File(self.path, "r") as file_:
+            dataset = file_["entry0"]["measurement"][COL1_NAME]
+            msg = "preallocated dataset was not trimmed"
+            self.assertEqual(dataset.shape, (nb_records,) + shape, msg)
+            for i in range(nb_records):
+                msg = "data does not match"
+                numpy.testing.assert_array_equal(dataset[i], i, msg)
+
     def tearDown(self):
         try:
             os.remove(self.path)
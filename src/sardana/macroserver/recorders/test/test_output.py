@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for output recorders."""
+
+import time
+from datetime import datetime
+from unittest import TestCase
+
+from taurus.test import insertTest
+from taurus.core.util.codecs import CodecFactory
+
+from sardana.macroserver.scan import ColumnDesc
+from sardana.macroserver.recorders.output import JsonRecorder
+from sardana.taurus.core.tango.sardana.macroserver import BaseDoor
+
+COLUMNS = ["point_nb", "col1", "col2", "timestamp"]
+
+
+class RecordList(dict):
+
+    def __init__(self, env):
+        self._env = env
+
+    def getEnviron(self):
+        return self._env
+
+    def getEnvironValue(self, name):
+        return self._env[name]
+
+
+class Record(object):
+
+    def __init__(self, data, recordno=0):
+        self.data = data
+        self.recordno = recordno
+
+
+class Stream(object):
+    """Macro stream which encodes and decodes the record data packets as the
+    Door and its clients"""
+
+    def __init__(self):
+        self.packets = []
+
+    def getID(self):
+        return "1"
+
+    def _sendRecordData(self, data, codec=None):
+        encoded = CodecFactory().getCodec(codec).encode(("", data))
+        format_ = encoded[0]
+        _, packet = CodecFactory().getCodec(format_).decode(encoded)
+        self.packets.append(packet)
+
+
+@insertTest(helper_name="record_data", nb_records=10)
+@insertTest(helper_name="record_data", nb_records=10, batch_size=4)
+@insertTest(helper_name="record_data", nb_records=10, batch_size=0)
+@insertTest(helper_name="record_data", nb_records=10, batch_period=0.05,
+            record_time=0.02)
+@insertTest(helper_name="record_data", nb_records=10, batch_size=4,
+            codec="bz2_utf8_json")
+class TestJsonRecorder(TestCase):
+
+    def setUp(self):
+        self.env = {
+            "macro_id": "1",
+            "serialno": 0,
+            "title": "test",
+            "counters": ["col1", "col2"],
+            "ScanFile": None,
+            "ScanDir": None,
+            "datadesc": [ColumnDesc(name=name, label=name, dtype="float64",
+                                    shape=tuple()) for name in COLUMNS],
+            "ref_moveables": [],
+            "estimatedtime": 1,
+            "total_scan_intervals": 1,
+            "starttime": None,
+            "endtime": None,
+            "deadtime": 0
+        }
+        self.record_list = RecordList(self.env)
+
+    def _scan(self, nb_records, batch_size=None, batch_period=None,
+              codec=None, record_time=0):
+        for name, value in (("JsonRecorderBatchSize", batch_size),
+                            ("JsonRecorderBatchPeriod", batch_period),
+                            ("JsonRecorderCodec", codec)):
+            if value is not None:
+                self.env[name] = value
+        stream = Stream()
+        recorder = JsonRecorder(stream)
+        recorder.recordlist = self.record_list
+        self.env["starttime"] = datetime.now()
+        recorder._startRecordList(self.record_list)
+        for i in range(nb_records):
+            time.sleep(record_time)
+            data = dict(point_nb=i, col1=float(i), col2=2. * i,
+                        timestamp=float(i))
+            recorder._writeRecord(Record(data, i))
+        self.env["endtime"] = datetime.now()
+        recorder._endRecordList(self.record_list)
+        return stream.packets
+
+    def record_data(self, nb_records, batch_size=None, batch_period=None,
+                    codec=None, record_time=0):
+        """Test that the records received by the clients are the same
+        regardless of batching"""
+        packets = self._scan(nb_records, batch_size, batch_period, codec,
+                             record_time)
+        data_desc = packets[0]
+        self.assertEqual(data_desc["type"], "data_desc")
+        self.assertEqual(packets[-1]["type"], "record_end")
+        batched = batch_size not in (None, 1) or bool(batch_period)
+        if batched:
+            self.assertEqual(data_desc["data"]["record_data_version"],
+                             JsonRecorder.RECORD_DATA_VERSION)
+        else:
+            self.assertNotIn("record_data_version", data_desc["data"])
+        nb_packets = len(packets) - 2
+        if not batched:
+            self.assertEqual(nb_packets, nb_records)
+        elif batch_size:
+            self.assertEqual(nb_packets, -(-nb_records // batch_size))
+        elif batch_period:
+            # sleep time is not accurate
+            self.assertGreater(nb_packets, 1)
+            self.assertLess(nb_packets, nb_records)
+        else:
+            self.assertEqual(nb_packets, 1)
+        records = []
+        for packet in packets[1:-1]:
+            records.extend(BaseDoor.splitRecordData(packet))
+        self.assertEqual(len(records), nb_records)
+        for i, record in enumerate(records):
+            self.assertEqual(record["type"], "record_data")
+            self.assertEqual(record["macro_id"], "1")
+            self.assertEqual(record["data"],
+                             dict(point_nb=i, col1=float(i), col2=2. * i,
+                                  timestamp=float(i)))
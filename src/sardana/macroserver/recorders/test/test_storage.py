@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for text file recorders."""
+
+import os
+import time
+import tempfile
+from datetime import datetime
+from unittest import TestCase, mock
+
+from taurus.test import insertTest
+
+from sardana.macroserver.scan import ColumnDesc
+from sardana.macroserver.recorders.storage import SPEC_FileRecorder
+
+COL1_NAME = "col1"
+
+
+class RecordList(dict):
+
+    def __init__(self, env):
+        self._env = env
+
+    def getEnviron(self):
+        return self._env
+
+
+class Record(object):
+
+    def __init__(self, data, recordno=0):
+        self.data = data
+        self.recordno = recordno
+
+
+# header, records and end of the scan
+@insertTest(helper_name="sync_policy", nb_records=10, expected_syncs=12)
+@insertTest(helper_name="sync_policy", nb_records=10, sync_records=4,
+            expected_syncs=4)
+@insertTest(helper_name="sync_policy", nb_records=10, sync_records=0,
+            expected_syncs=2)
+@insertTest(helper_name="sync_policy", nb_records=10, sync_records=0,
+            sync_period=0.05, record_time=0.02, expected_syncs=5)
+class TestSPEC_FileRecorder(TestCase):
+
+    def setUp(self):
+        self.dir_name = tempfile.gettempdir()
+        self.path = os.path.join(self.dir_name, "test.spec")
+        try:
+            os.remove(self.path)  # remove file just in case
+        except OSError:
+            pass
+
+        self.env = {
+            "serialno": 0,
+            "starttime": None,
+            "title": "test",
+            "user": "user",
+            "datadesc": [ColumnDesc(name=COL1_NAME, label=COL1_NAME,
+                                    dtype="float64", shape=tuple())],
+            "endtime": None
+        }
+        self.record_list = RecordList(self.env)
+
+    def tearDown(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _scan(self, nb_records, record_time=0):
+        recorder = SPEC_FileRecorder(filename=self.path)
+        self.env["starttime"] = datetime.now()
+        # simulate the acquisition time with a fake clock of the recorder
+        clock = [time.time()]
+        with mock.patch("sardana.macroserver.scan.recorder.storage.time") \
+                as time_mock:
+            time_mock.time.side_effect = lambda: clock[0]
+            recorder._startRecordList(self.record_list)
+            for i in range(nb_records):
+                clock[0] += record_time
+                recorder._writeRecord(Record({COL1_NAME: float(i)}, i))
+            self.env["endtime"] = datetime.now()
+            recorder._endRecordList(self.record_list)
+
+    def sync_policy(self, nb_records, expected_syncs, sync_records=None,
+                    sync_period=None, record_time=0):
+        """Test number of file synchronizations with the storage"""
+        if sync_records is not None:
+            self.env["FileRecorderSyncRecords"] = sync_records
+        if sync_period is not None:
+            self.env["FileRecorderSyncPeriod"] = sync_period
+        with mock.patch("os.fsync") as fsync:
+            self._scan(nb_records, record_time)
+        self.assertEqual(fsync.call_count, expected_syncs)
+        with open(self.path) as f:
+            lines = [line for line in f if not line.startswith("#")]
+        self.assertEqual(len(lines), nb_records)
@@ -53,10 +53,11 @@ from taurus.core.util.threadpool import ThreadPool
 from taurus.core.util.event import CallableRef
 from taurus.core.tango.tangovalidator import TangoDeviceNameValidator
 
+from sardana import sardanacustomsettings
 from sardana.sardanathreadpool import OmniWorker
 from sardana.util.tree import BranchNode, LeafNode, Tree
 from sardana.util.motion import Motor as VMotor
-from sardana.util.motion import MotionPath
+from sardana.util.motion import MotionPath, motion_durations
 from sardana.util.thread import CountLatch
 from sardana.pool.pooldefs import SynchDomain, SynchParam
 from sardana.macroserver.msexception import MacroServerException, UnknownEnv, \
@@ -338,10 +339,15 @@ class GScan(Logger):
             apply_extrapol = macro.getEnv('ApplyExtrapolation')
         except UnknownEnv:
             apply_extrapol = False
+        try:
+            max_records = macro.getEnv('ScanDataMaxRecords')
+        except UnknownEnv:
+            max_records = None
         # The Scan data object
         data = ScanFactory().getScanData(data_handler,
                                          apply_interpolation=apply_interpol,
-                                         apply_extrapolation=apply_extrapol)
+                                         apply_extrapolation=apply_extrapol,
+                                         max_records=max_records)
 
         # The Output recorder (if any)
         output_recorder = self._getOutputRecorder()
@@ -373,23 +379,30 @@ class GScan(Logger):
         # ---------------------------------------------------------------------
         self._setupEnvironment(env)
 
-    def _check_moveables_limits(self):
-        for m in self._moveables:
-            pos_range = m.moveable.getAttribute("Position").range
+    @staticmethod
+    def _get_moveable_limits(moveable):
+        """Returns the (low, high) limits of the moveable position, None if
+        the limit is not defined"""
+        pos_range = moveable.getAttribute("Position").range
+        try:
+            high = float(pos_range[1].magnitude)    # Taurus 4
+        except AttributeError:
             try:
-                high = float(pos_range[1].magnitude)    # Taurus 4
-            except AttributeError:
-                try:
-                    high = float(pos_range[1])          # Taurus 3
-                except ValueError:
-                    high = None
+                high = float(pos_range[1])          # Taurus 3
+            except ValueError:
+                high = None
+        try:
+            low = float(pos_range[0].magnitude)     # Taurus 4
+        except AttributeError:
             try:
-                low = float(pos_range[0].magnitude)     # Taurus 4
-            except AttributeError:
-                try:
-                    low = float(pos_range[0])           # Taurus 3
-                except ValueError:
-                    low = None
+                low = float(pos_range[0])           # Taurus 3
+            except ValueError:
+                low = None
+        return low, high
+
+    def _check_moveables_limits(self):
+        for m in self._moveables:
+            low, high = self._get_moveable_limits(m.moveable)
 
             if any((high, low)) and not any((m.min_value, m.max_value)):
                 self.macro.info("Scan range is not defined for %s and could "
@@ -410,6 +423,45 @@ class GScan(Logger):
                             "requested movement of %s is below its lower limit"
                             % m.moveable.getName())
 
+            if m.moveable.getType() == "PseudoMotor":
+                positions = [float(pos) for pos in (m.min_value, m.max_value)
+                             if pos is not None]
+                self._check_physical_limits(m.moveable, positions)
+
+    def _get_physical_positions(self, pseudo_motor, positions):
+        """Returns the (moveable, positions) pairs of the physical moveables
+        of the pseudo motor for the given pseudo motor positions converted
+        in one call to the Pool. Returns an empty list if the conversion is
+        not possible."""
+        if len(positions) == 0:
+            return []
+        try:
+            physical_positions = pseudo_motor.calcPhysicalArray(positions)
+        except Exception:
+            self.macro.debug("Could not calculate %s physical positions",
+                             pseudo_motor.getName())
+            self.macro.debug("Details:", exc_info=1)
+            return []
+        return [(self.macro.getMoveable(name), physical_positions[:, i])
+                for i, name in enumerate(pseudo_motor.elements)]
+
+    def _check_physical_limits(self, pseudo_motor, positions):
+        """Check the pseudo motor positions against the limits of its
+        physical moveables (recursively for the nested pseudo motors)"""
+        physical = self._get_physical_positions(pseudo_motor, positions)
+        for moveable, physical_positions in physical:
+            low, high = self._get_moveable_limits(moveable)
+            if high is not None and np.any(physical_positions > high):
+                raise RuntimeError(
+                    "requested movement of %s is above %s upper limit"
+                    % (pseudo_motor.getName(), moveable.getName()))
+            if low is not None and np.any(physical_positions < low):
+                raise RuntimeError(
+                    "requested movement of %s is below %s lower limit"
+                    % (pseudo_motor.getName(), moveable.getName()))
+            if moveable.getType() == "PseudoMotor":
+                self._check_physical_limits(moveable, physical_positions)
+
     def _getExtraColumns(self):
         ret = []
         try:
@@ -533,6 +585,11 @@ class GScan(Logger):
             raise TypeError("ScanRecorder MUST be string or sequence of "
                             "strings. It is '%s'" % scan_recorders_t)
 
+        try:
+            queue_size = macro.getEnv('FileRecorderQueueSize')
+        except UnknownEnv:
+            queue_size = 0
+
         file_recorders = []
         for i, file_name in enumerate(file_names):
             abs_file_name = os.path.join(scan_dir, file_name)
@@ -543,6 +600,7 @@ class GScan(Logger):
                         scan_recorders[i])(abs_file_name, macro=macro)
                 if not file_recorder:
                     file_recorder = FileRecorder(abs_file_name, macro=macro)
+                file_recorder.setAsynchWrite(queue_size)
                 file_recorders.append(file_recorder)
             except InterruptException:
                 raise
@@ -743,6 +801,18 @@ class GScan(Logger):
         except UnknownEnv:
             env['DataCompressionRank'] = -1
 
+        # set the HDF5 recorders write buffering, the file recorders
+        # durability policy and the JSON recorder batching (recorder
+        # defaults if unset)
+        for name in ('H5BufferSize', 'H5FlushPeriod',
+                     'FileRecorderSyncRecords', 'FileRecorderSyncPeriod',
+                     'JsonRecorderBatchSize', 'JsonRecorderBatchPeriod',
+                     'JsonRecorderCodec'):
+            try:
+                env[name] = self.macro.getEnv(name)
+            except UnknownEnv:
+                pass
+
         # set the sample information
         # @todo: use the instrument API to get this info
         try:
@@ -841,6 +911,79 @@ class GScan(Logger):
             ret.append(v_motor)
         return ret
 
+    def _get_motion_paths(self, moveable, v_motor, positions):
+        """Returns the (virtual motor, positions) pairs describing the motion
+        of the moveable through the positions. Pseudo motors are described
+        by the motion of their physical moveables."""
+        if moveable.getType() != "PseudoMotor":
+            return [(v_motor, positions)]
+        physical = self._get_physical_positions(moveable, positions)
+        if len(physical) == 0:
+            return [(v_motor, positions)]
+        paths = []
+        for physical_moveable, physical_positions in physical:
+            try:
+                physical_v_motor = VMotor.fromMotor(physical_moveable)
+            except Exception:
+                physical_v_motor = VMotor(min_vel=0, max_vel=float('+inf'),
+                                          accel_time=0, decel_time=0)
+            paths.extend(self._get_motion_paths(physical_moveable,
+                                                physical_v_motor,
+                                                physical_positions))
+        return paths
+
+    def _estimate_motion_time(self, positions):
+        """Estimate the motion time of going through the positions.
+
+        :param positions: sequence of positions of the moveables (one for
+            each point), the first element are the start positions
+        :type positions: seq<seq<float>>
+        :return: motion time
+        :rtype: float
+        """
+        if len(positions) < 2:
+            return 0.0
+        positions = np.array(positions, dtype=float)
+        durations = np.zeros(len(positions) - 1)
+        v_motors = self.get_virtual_motors()
+        for moveable, v_motor, moveable_positions in zip(self.moveables,
+                                                         v_motors,
+                                                         positions.T):
+            for v_motor, motor_positions in self._get_motion_paths(
+                    moveable.moveable, v_motor, moveable_positions):
+                motor_positions = np.asarray(motor_positions, dtype=float)
+                np.maximum(durations,
+                           motion_durations(v_motor, motor_positions[:-1],
+                                            motor_positions[1:]),
+                           out=durations)
+        return float(durations.sum())
+
+    def _estimate_points(self, positions, integ_times):
+        """Estimate time and intervals of a scan from all its points.
+
+        :param positions: positions of the moveables (one row for each point)
+        :type positions: :obj:`numpy.ndarray`
+        :param integ_times: integration time of each point or of all of them
+        :type integ_times: :obj:`numpy.ndarray` or :obj:`float`
+        :return: estimated time and number of intervals
+        :rtype: :obj:`tuple`
+        """
+        positions = np.asarray(positions, dtype=float)
+        nb_points = len(positions)
+        start_positions = self.motion.readPosition(force=True)
+        positions = np.vstack(([start_positions], positions))
+        total_time = self._estimate_motion_time(positions)
+        integ_times = np.asarray(integ_times, dtype=float)
+        if integ_times.ndim == 0:
+            total_time += nb_points * float(integ_times)
+        else:
+            total_time += float(integ_times.sum())
+        if hasattr(self.macro, "getIntervalEstimation"):
+            interval_nb = self.macro.getIntervalEstimation()
+        else:
+            interval_nb = max(nb_points - 1, 0)
+        return total_time, interval_nb
+
     MAX_ITER = 100000
 
     def _estimate(self, max_iter=None):
@@ -850,9 +993,18 @@ class GScan(Logger):
         position) and acquisition time.
 
         Interval estimation is a number of scan trajectory intervals.
+
+        Macros which know all their points in advance may implement
+        ``getScanPoints`` returning the positions (one row per point) and
+        the integration times of the points, or None if not applicable.
+        Then the estimation is exact and does not iterate the generator.
         """
         with_time = hasattr(self.macro, "getTimeEstimation")
         with_interval = hasattr(self.macro, "getIntervalEstimation")
+        if hasattr(self.macro, "getScanPoints"):
+            points = self.macro.getScanPoints()
+            if points is not None:
+                return self._estimate_points(*points)
         if with_time and with_interval:
             t = self.macro.getTimeEstimation()
             i = self.macro.getIntervalEstimation()
@@ -866,25 +1018,18 @@ class GScan(Logger):
         try:
             if not with_time:
                 try:
-                    start_pos = self.motion.readPosition(force=True)
-                    v_motors = self.get_virtual_motors()
-                    motion_time, acq_time = 0.0, 0.0
+                    positions = [self.motion.readPosition(force=True)]
                     while point_nb < max_iter:
-                        step = next(iterator)
-                        end_pos = step['positions']
-                        max_path_duration = 0.0
-                        for v_motor, start, stop in zip(v_motors,
-                                                        start_pos,
-                                                        end_pos):
-                            path = MotionPath(v_motor, start, stop)
-                            max_path_duration = max(
-                                max_path_duration, path.duration)
-                        integ_time = step.get("integ_time", 0.0)
-                        acq_time += integ_time
-                        motion_time += max_path_duration
-                        total_time += integ_time + max_path_duration
+                        try:
+                            step = next(iterator)
+                        except StopIteration:
+                            total_time += self._estimate_motion_time(
+                                positions)
+                            raise
+                        positions.append(step['positions'])
+                        total_time += step.get("integ_time", 0.0)
                         point_nb += 1
-                        start_pos = end_pos
+                    total_time += self._estimate_motion_time(positions)
                 finally:
                     if with_interval:
                         interval_nb = self.macro.getIntervalEstimation()
@@ -973,10 +1118,6 @@ class GScan(Logger):
             env['delaytime'] = total_time - acq_time - env['motiontime']
 
         self.data.end()
-        try:
-            scan_history = self.macro.getEnv('ScanHistory')
-        except UnknownEnv:
-            scan_history = []
 
         scan_file = env['ScanFile']
         if isinstance(scan_file, str):
@@ -990,10 +1131,13 @@ class GScan(Logger):
                        ScanFile=scan_file, ScanDir=env['ScanDir'],
                        endstatus=ScanEndStatus.whatis(env['endstatus']),
                        channels=names)
+        scan_history = self.macro.getMacroServer().scan_history
         scan_history.append(history)
-        while len(scan_history) > self.MAX_SCAN_HISTORY:
-            scan_history.pop(0)
-        self.macro.setEnv('ScanHistory', scan_history)
+        # optionally the most recent scans are also kept in the ScanHistory
+        # environment for the clients which still read it from there
+        if getattr(sardanacustomsettings, "MS_SCAN_HISTORY_ENV", False):
+            self.macro.setEnv('ScanHistory',
+                              scan_history.getLast(self.MAX_SCAN_HISTORY))
 
     def scan(self):
         for _ in self.step_scan():
@@ -1056,7 +1200,21 @@ class GScan(Logger):
 
 
 class SScan(GScan):
-    """Step scan"""
+    """Step scan
+
+    When the *ScanPipelined* environment variable is set the steps without
+    hooks are pipelined: the extra columns reading and the recording of the
+    point are done by a worker thread, in the order of the points, while
+    the motion to the next point is already in progress.
+    """
+
+    STEP_HOOKS = ('pre-move-hooks', 'post-move-hooks', 'pre-acq-hooks',
+                  'post-acq-hooks', 'hooks', 'post-step-hooks')
+
+    #: whether the steps can be pipelined (see *ScanPipelined*)
+    PIPELINED_STEPS = True
+
+    _record_pool = None
 
     def scan_loop(self):
         lstep = None
@@ -1086,6 +1244,15 @@ class SScan(GScan):
             self.condition_macro, pars = self.macro.createMacro(
                 general_condition)
 
+        try:
+            pipelined = macro.getEnv('ScanPipelined')
+        except UnknownEnv:
+            pipelined = False
+        # the general condition is evaluated on the recorded point
+        if (pipelined and self.PIPELINED_STEPS
+                and self.condition_macro is None):
+            self._startRecording()
+
         self._sum_motion_time = 0
         self._sum_acq_time = 0
 
@@ -1099,6 +1266,8 @@ class SScan(GScan):
             if scream:
                 yield ((i + 1) / nb_points) * 100
 
+        self._waitRecords()
+
         if not scream:
             yield 100.0
 
@@ -1109,6 +1278,15 @@ class SScan(GScan):
         motion, mg = self.motion, self.measurement_group
         startts = self._env['startts']
 
+        pipelined = (self._record_pool is not None
+                     and not any(step.get(name) for name in self.STEP_HOOKS))
+        if not pipelined:
+            # hooks may rely on the already acquired points being recorded
+            self._waitRecords()
+        else:
+            # report recording errors as soon as possible
+            self._checkRecordError()
+
         # pre-move hooks
         for hook in step.get('pre-move-hooks', ()):
             hook()
@@ -1148,6 +1326,10 @@ class SScan(GScan):
             except Exception:
                 pass
 
+        if pipelined:
+            self._acquirePipelined(step, state, positions)
+            return
+
         ic = 1
         while ic:
             curr_time = time.time()
@@ -1247,6 +1429,107 @@ class SScan(GScan):
 
             self.point_id = self.point_id + 1
 
+    def _acquirePipelined(self, step, state, positions):
+        """Acquire the point and delegate its recording to the record worker
+        so the motion to the next point can start immediately."""
+        mg = self.measurement_group
+        dt = time.time() - self._env['startts']
+        # allow scan to be stopped between motion and data acquisition
+        self.macro.checkPoint()
+
+        if state != Ready:
+            self._waitRecords()
+            self.dump_information(
+                self.point_id, step, self.motion.moveable_list)
+            m = "Scan aborted after problematic motion: " \
+                "Motion ended with %s\n" % str(state)
+            raise ScanException({'msg': m})
+
+        integ_time = step['integ_time']
+        # Acquire data
+        self.debug("[START] acquisition")
+        if self._deterministic_scan:
+            state, data_line = mg.count_raw()
+        else:
+            state, data_line = mg.count(integ_time)
+        self.debug("[ END ] acquisition")
+        self._sum_acq_time += integ_time
+        self._env['acqtime'] = self._sum_acq_time
+
+        # the generator may reuse the step dictionaries
+        extrainfo = dict(step.get('extrainfo', {}))
+        self._record_latch.count_up()
+        # only one thread is present in the pool so points are recorded
+        # in order
+        self._record_pool.add(self._recordPoint, None, data_line,
+                              self.point_id, dt, positions, extrainfo)
+        self.point_id = self.point_id + 1
+
+    def _recordPoint(self, data_line, point_nb, dt, positions, extrainfo):
+        """Complete the point with the extra columns, positions and extra
+        information and add it to the scan data (executed by the record
+        worker)."""
+        try:
+            for ec in self._extra_columns:
+                data_line[ec.getName()] = ec.read()
+            data_line['point_nb'] = point_nb
+            data_line['timestamp'] = dt
+            for i, m in enumerate(self.moveables):
+                data_line[m.moveable.getName()] = positions[i]
+            data_line.update(extrainfo)
+            self.data.addRecord(data_line)
+        except Exception as e:
+            self.debug("Failed to record point %d", point_nb, exc_info=True)
+            if self._record_error is None:
+                self._record_error = e
+        finally:
+            self._record_latch.count_down()
+
+    def _startRecording(self):
+        """Start the worker which records the pipelined points."""
+        # protect older versions of Taurus (without the worker_cls argument)
+        # remove it whenever we bump Taurus dependency
+        try:
+            self._record_pool = ThreadPool(name="RecordTH",
+                                           Psize=1,
+                                           Qsize=100000,
+                                           worker_cls=OmniWorker)
+        except TypeError:
+            self._record_pool = ThreadPool(name="RecordTH",
+                                           Psize=1,
+                                           Qsize=100000)
+        self._record_latch = CountLatch()
+        self._record_error = None
+
+    def _checkRecordError(self):
+        if self._record_pool is None or self._record_error is None:
+            return
+        error, self._record_error = self._record_error, None
+        raise error
+
+    def _waitRecords(self):
+        """Wait until all the pipelined points are recorded and raise the
+        recording error if any."""
+        if self._record_pool is None:
+            return
+        self._record_latch.wait()
+        self._checkRecordError()
+
+    def _stopRecording(self):
+        """Wait until all the pipelined points are recorded and dispose the
+        record worker."""
+        if self._record_pool is None:
+            return
+        self._record_latch.wait()
+        self._record_pool.join()
+        self._record_pool = None
+        if self._record_error is not None:
+            self.macro.warning("Some points were not recorded: %s",
+                               self._record_error)
+
+    def end(self):
+        self._stopRecording()
+        GScan.end(self)
 
     def dump_information(self, n, step, elements):
         msg = ["Report: Stopped at step #" + str(n) + " with:"]
@@ -2027,9 +2310,8 @@ class CAcquisition(object):
 
         info = {'label': full_name}
         if self._index_offset != 0:
-            idx = np.array(value_buffer['index'])
-            idx += self._index_offset
-            value_buffer['index'] = idx.tolist()
+            idx = np.asarray(value_buffer['index'])
+            value_buffer['index'] = idx + self._index_offset
         info.update(value_buffer)
         # info is a dictionary with at least keys: label, data,
         # index and its values are of type string for label and
@@ -2053,9 +2335,8 @@ class CAcquisition(object):
 
         info = {'label': full_name}
         if self._index_offset != 0:
-            idx = np.array(value_ref_buffer['index'])
-            idx += self._index_offset
-            value_ref_buffer['index'] = idx.tolist()
+            idx = np.asarray(value_ref_buffer['index'])
+            value_ref_buffer['index'] = idx + self._index_offset
         info.update(value_ref_buffer)
         # info is a dictionary with at least keys: label, data,
         # index and its values are of type string for label and
@@ -2654,6 +2935,9 @@ class CTScan(CScan, CAcquisition):
 class HScan(SScan):
     """Hybrid scan"""
 
+    # the acquisition is done during the motion
+    PIPELINED_STEPS = False
+
     def stepUp(self, n, step, lstep):
         motion, mg = self.motion, self.measurement_group
         startts = self._env['startts']
@@ -29,7 +29,10 @@ __all__ = ["SaveModes", "RecorderStatus", "DataHandler", "DataRecorder"]
 
 __docformat__ = 'restructuredtext'
 
+import sys
 import time
+import queue
+import threading
 
 from taurus.core.util.log import Logger
 from taurus.core.util.enumeration import Enumeration
@@ -56,11 +59,20 @@ class DataHandler:
                 recorder.startRecordList(recordlist)
 
     def endRecordList(self, recordlist):
+        # end all the recorders even if some of them fail and raise the
+        # first error afterwards
+        exc_info = None
         for recorder in self.recorders:
-            if recorder.savemode is SaveModes.Record:
-                recorder.endRecordList(recordlist)
-            else:
-                recorder.writeRecordList(recordlist)
+            try:
+                if recorder.savemode is SaveModes.Record:
+                    recorder.endRecordList(recordlist)
+                else:
+                    recorder.writeRecordList(recordlist)
+            except Exception:
+                if exc_info is None:
+                    exc_info = sys.exc_info()
+        if exc_info is not None:
+            raise exc_info[1].with_traceback(exc_info[2])
 
     def addRecord(self, recordlist, record):
         for recorder in self.recorders:
@@ -69,6 +81,18 @@ class DataHandler:
             else:  # blockSave
                 pass
 
+    def addRecords(self, recordlist, records):
+        '''Write a batch of records.
+
+        :param recordlist: the record list the records belong to
+        :param records: the records to be written
+        :type records: seq<Record>
+        '''
+        for recorder in self.recorders:
+            if recorder.savemode is SaveModes.Record:
+                for record in records:
+                    recorder.writeRecord(record)
+
     def addCustomData(self, value, name, **kwargs):
         '''Write data other than a record.
 
@@ -83,13 +107,38 @@ class DataHandler:
         '''
         for recorder in self.recorders:
             recorder.addCustomData(value, name, **kwargs)
+
+    def getQueueDepths(self):
+        """Returns the number of records waiting to be written per recorder.
+
+        :return: queue depth per recorder
+        :rtype: dict<DataRecorder, int>"""
+        return {recorder: recorder.getQueueDepth()
+                for recorder in self.recorders}
+
+    def getWriterLags(self):
+        """Returns the writer lag per recorder (see
+        :meth:`DataRecorder.getWriterLag`).
+
+        :return: writer lag (s) per recorder
+        :rtype: dict<DataRecorder, float>"""
+        return {recorder: recorder.getWriterLag()
+                for recorder in self.recorders}
 #
 # Recorders
 #
 
 
 class DataRecorder(Logger):
-    """ Generic class for data recorder. Does nothing"""
+    """ Generic class for data recorder. Does nothing
+
+    The records can be optionally written asynchronously (see
+    :meth:`setAsynchWrite`): :meth:`writeRecord` puts them on a bounded
+    queue, which is drained by a dedicated writer thread. When the queue is
+    full :meth:`writeRecord` blocks until there is space (backpressure).
+    Errors of the writer thread are raised on the next :meth:`writeRecord`
+    or :meth:`endRecordList` call. :meth:`endRecordList` waits until all the
+    queued records are written."""
 
     def __init__(self, *args, **kwargs):
         name = self.__class__.__name__
@@ -97,6 +146,11 @@ class DataRecorder(Logger):
         self.recordlist = None
         self.status = RecorderStatus.Idle
         self.savemode = SaveModes.Record
+        self._queue_size = 0
+        self._queue = None
+        self._writer = None
+        self._writer_exc_info = None
+        self._writing_since = None
 
     def getStatus(self):
         return self.status
@@ -113,6 +167,8 @@ class DataRecorder(Logger):
             self.recordlist = recordlist
 
         self._startRecordList(recordlist)
+        if self.isAsynchWrite():
+            self._startWriter()
 
         if is_idle:
             return 0
@@ -123,10 +179,13 @@ class DataRecorder(Logger):
         pass
 
     def endRecordList(self, recordlist):
-        self._endRecordList(recordlist)
-
-        self.status = RecorderStatus.Idle
-        self.recordlist = None
+        try:
+            self._stopWriter()
+            self._endRecordList(recordlist)
+        finally:
+            self.status = RecorderStatus.Idle
+            self.recordlist = None
+        self._raiseWriterError()
 
     def _endRecordList(self, recordlist):
         pass
@@ -139,7 +198,12 @@ class DataRecorder(Logger):
         self._endRecordList(recordlist)
 
     def writeRecord(self, record):
-        self._writeRecord(record)
+        if self._writer is None:
+            self._writeRecord(record)
+            return
+        self._raiseWriterError()
+        # blocks while the queue is full
+        self._queue.put((record, time.time()))
 
     def _writeRecord(self, record):
         pass
@@ -147,12 +211,108 @@ class DataRecorder(Logger):
     def setSaveMode(self, mode):
         self.savemode = mode
 
+    def setAsynchWrite(self, queue_size):
+        """Enables (or disables) the asynchronous writing of records.
+
+        Takes effect on the next :meth:`startRecordList`.
+
+        .. note::
+            The asynchronous writing of records has been included in Sardana
+            on a provisional basis. Backwards incompatible changes (up to and
+            including its removal) may occur if deemed necessary by the core
+            developers.
+
+        :param queue_size: maximum number of records waiting to be written,
+            0 disables the asynchronous writing
+        :type queue_size: int"""
+        self._queue_size = queue_size
+
+    def isAsynchWrite(self):
+        return self._queue_size > 0
+
+    def getQueueDepth(self):
+        """Returns the number of records waiting to be written
+        (always 0 when writing synchronously).
+
+        :return: queue depth
+        :rtype: int"""
+        if self._queue is None:
+            return 0
+        return self._queue.qsize()
+
+    def getWriterLag(self):
+        """Returns the time the oldest record not written yet has been
+        waiting (always 0 when writing synchronously).
+
+        :return: writer lag (s)
+        :rtype: float"""
+        writing_since = self._writing_since
+        if writing_since is None:
+            return 0.
+        return time.time() - writing_since
+
+    def _startWriter(self):
+        self._writer_exc_info = None
+        self._writing_since = None
+        self._queue = queue.Queue(self._queue_size)
+        self._writer = threading.Thread(
+            target=self._writerLoop,
+            name="%sWriter" % self.__class__.__name__)
+        self._writer.daemon = True
+        self._writer.start()
+
+    def _stopWriter(self):
+        """Waits until all the queued records are written and stops the
+        writer thread"""
+        writer = self._writer
+        if writer is None:
+            return
+        self._queue.put(None)
+        writer.join()
+        self._writer = None
+        self._queue = None
+
+    def _writerLoop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            record, self._writing_since = item
+            # after an error discard the records so the producer never
+            # blocks on a full queue
+            if self._writer_exc_info is None:
+                try:
+                    self._writeRecord(record)
+                except Exception:
+                    self._writer_exc_info = sys.exc_info()
+                    self.error("Error writing record %s",
+                               getattr(record, "recordno", None))
+                    self.debug("Details:", exc_info=1)
+            self._writing_since = None
+            self._queue.task_done()
+
+    def _raiseWriterError(self):
+        exc_info = self._writer_exc_info
+        if exc_info is None:
+            return
+        self._writer_exc_info = None
+        raise exc_info[1].with_traceback(exc_info[2])
+
     def addCustomData(self, value, name, **kwargs):
+        # keep the order with respect to the queued records
+        self._drainWriter()
         try:
             self._addCustomData(value, name, **kwargs)
         except Exception as e:
             raise RuntimeError('%s can not process custom data: %s' %
                                (self.__class__.__name__, e))
 
+    def _drainWriter(self):
+        """Waits until all the queued records are written"""
+        if self._writer is None:
+            return
+        self._queue.join()
+
     def _addCustomData(self, value, name, **kwargs):
         pass
@@ -52,11 +52,54 @@ class AmbiguousRecorderError(MacroServerException):
 
 
 class BaseFileRecorder(DataRecorder):
+    """Base class for file recorders.
+
+    Text file recorders may apply a durability policy on the written records
+    (see :meth:`_setSyncPolicy`): the file is flushed after every record but
+    synchronized with the storage (``os.fsync``) only every
+    :attr:`_syncRecords` records and/or every :attr:`_syncPeriod` seconds.
+    If both are 0 it is synchronized only at the end of the scan."""
+
+    #: synchronize the file every this number of records (0 means disabled)
+    _syncRecords = 1
+    #: synchronize the file every this number of seconds (0 means disabled)
+    _syncPeriod = 0
 
     def __init__(self, **pars):
         DataRecorder.__init__(self, **pars)
         self.filename = None
         self.fd = None
+        self._unsyncedRecords = 0
+        self._syncTime = 0
+
+    def _setSyncPolicy(self, env):
+        """Set the durability policy from the scan environment
+        (FileRecorderSyncRecords and FileRecorderSyncPeriod)
+
+        :param env: scan environment
+        :type env: dict
+        """
+        self._syncRecords = max(0, env.get('FileRecorderSyncRecords',
+                                           self._syncRecords))
+        self._syncPeriod = max(0, env.get('FileRecorderSyncPeriod',
+                                          self._syncPeriod))
+
+    def _syncFile(self):
+        """Flush the file and synchronize it with the storage"""
+        self.fd.flush()
+        os.fsync(self.fd.fileno())
+        self._unsyncedRecords = 0
+        self._syncTime = time.time()
+
+    def _syncRecord(self):
+        """Flush the file after writing a record and synchronize it with the
+        storage if required by the durability policy"""
+        self.fd.flush()
+        self._unsyncedRecords += 1
+        records, period = self._syncRecords, self._syncPeriod
+        if ((records and self._unsyncedRecords >= records)
+                or (period and time.time() - self._syncTime >= period)):
+            self._syncFile()
 
     def getFileName(self):
         return self.filename
@@ -26,11 +26,14 @@
 """This is the macro server scan data module"""
 
 __all__ = ["ColumnDesc", "MoveableDesc", "Record", "RecordEnvironment",
-           "ScanDataEnvironment", "RecordList", "ScanData", "ScanFactory"]
+           "ScanDataEnvironment", "ColumnStore", "RecordList", "ScanData",
+           "ScanFactory"]
 
 import copy
 import math
 
+import numpy
+
 from taurus.core.util.singleton import Singleton
 from taurus import Device, Attribute, getSchemeFromName, Factory
 from taurus.core.taurusexception import TaurusException
@@ -230,29 +233,29 @@ class Record(object):
         return name
 
     def __getitem__(self, item):
+        return self.data[self._getKey(item)]
+
+    def _getKey(self, item):
+        """Returns the data key corresponding to the given item (column name,
+        taurus or Tango name)"""
         item = item.lower()
         if item == 'dt':
             item = 'timestamp'
         if item in self.data:
-            return self.data[item]
+            return item
 
         # --------------------------------------------------------------------
         # TODO: refactor this block once data uses taurus 4 names
 
         if int(taurus_release.version.split('.')[0]) < 4:
             # Taurus 3 backward compatibility
-            name = self.__get_t3_name(item)
-            data = self.data[name]
-        else:
-            try:
-                name = self.__get_t4_name(item)
-                data = self.data[name]
-            except KeyError:
-                # Using a Tango URL
-                name = self.__get_tango_name(item)
-                data = self.data[name]
+            return self.__get_t3_name(item)
+        name = self.__get_t4_name(item)
+        if name not in self.data:
+            # Using a Tango URL
+            name = self.__get_tango_name(item)
         # --------------------------------------------------------------------
-        return data
+        return name
 
 
 class RecordEnvironment(dict):
@@ -293,17 +296,171 @@ class ScanDataEnvironment(RecordEnvironment):
     needed = ['title', 'labels', 'user']
 
 
+class ColumnStore(object):
+    """Columnar storage of the scan data.
+
+    Each column is a NumPy array indexed by the record number. Floating point
+    values are stored in float64 columns, any other values (integers,
+    strings, arrays, etc.) in object columns. Values which were not set are
+    NaN.
+
+    The records before :attr:`offset` can be discarded (see :meth:`discard`)
+    in order to bound the memory usage. Their space is reused by the
+    following records.
+
+    .. note::
+        The ColumnStore class has been included in Sardana on a provisional
+        basis. Backwards incompatible changes (up to and including its
+        removal) may occur if deemed necessary by the core developers.
+    """
+
+    def __init__(self):
+        self._columns = {}
+        # record number of the first row of the arrays
+        self._base = 0
+        # record number of the first record kept
+        self._offset = 0
+        # record number after the last reserved record
+        self._stop = 0
+        self._capacity = 0
+
+    @property
+    def offset(self):
+        """Record number of the first record kept in memory"""
+        return self._offset
+
+    @property
+    def stop(self):
+        """Record number after the last reserved record"""
+        return self._stop
+
+    def labels(self):
+        return list(self._columns.keys())
+
+    def __contains__(self, label):
+        return label in self._columns
+
+    def reserve(self, stop):
+        """Reserve space (initialized with NaN) for the records up to the
+        given record number.
+
+        :param stop: record number after the last record to reserve
+        :type stop: int"""
+        old_stop = self._stop
+        if stop <= old_stop:
+            return
+        base = self._base
+        if stop - base > self._capacity:
+            # reuse the space of the discarded records
+            shift = self._offset - base
+            used = old_stop - self._offset
+            if shift > 0:
+                for column in self._columns.values():
+                    column[:used] = column[shift:shift + used]
+                base = self._base = self._offset
+        if stop - base > self._capacity:
+            capacity = max(stop - base, 2 * self._capacity)
+            used = old_stop - base
+            for label, column in list(self._columns.items()):
+                new_column = numpy.empty(capacity, dtype=column.dtype)
+                new_column[:used] = column[:used]
+                self._columns[label] = new_column
+            self._capacity = capacity
+        for column in self._columns.values():
+            column[old_stop - base:stop - base] = float('NaN')
+        self._stop = stop
+
+    def setValues(self, label, idxs, values):
+        """Set values of the given column.
+
+        :param label: column label
+        :type label: str
+        :param idxs: record numbers
+        :type idxs: seq<int>
+        :param values: values
+        :type values: seq"""
+        if numpy.min(idxs) < self._offset:
+            # ignore values of the discarded records
+            pairs = [(idx, value) for idx, value in zip(idxs, values)
+                     if idx >= self._offset]
+            if len(pairs) == 0:
+                return
+            idxs, values = list(zip(*pairs))
+        self.reserve(int(numpy.max(idxs)) + 1)
+        column = self._columns.get(label)
+        if column is None:
+            column = numpy.empty(self._capacity, dtype=numpy.float64)
+            column[:] = float('NaN')
+            self._columns[label] = column
+        rows = numpy.asarray(idxs, dtype=numpy.int64) - self._base
+        try:
+            array = numpy.asarray(values)
+        except ValueError:
+            # e.g. ragged sequence of arrays
+            array = None
+        if (array is not None and array.ndim == 1
+                and array.dtype.kind == 'f'
+                and column.dtype != object):
+            column[rows] = array
+            return
+        if column.dtype != object:
+            column = column.astype(object)
+            self._columns[label] = column
+        for row, value in zip(rows, values):
+            column[row] = value
+
+    def getValue(self, idx, label):
+        """Returns value of the given column in the given record.
+
+        :raises: KeyError if the column does not exist"""
+        return self._columns[label][idx - self._base]
+
+    def getColumn(self, label, start=None, stop=None):
+        """Returns a view (no copy) of the given column. The view is valid
+        until the store is modified.
+
+        :param label: column label
+        :type label: str
+        :param start: first record number [default: first record kept]
+        :type start: int
+        :param stop: record number after the last record [default: last
+            reserved record]
+        :type stop: int
+        :return: column values
+        :rtype: numpy.ndarray
+        :raises: KeyError if the column does not exist"""
+        column = self._columns[label]
+        if start is None or start < self._offset:
+            start = self._offset
+        if stop is None or stop > self._stop:
+            stop = self._stop
+        stop = max(start, stop)
+        return column[start - self._base:stop - self._base]
+
+    def discard(self, stop):
+        """Discard the records before the given record number.
+
+        :param stop: record number after the last record to discard
+        :type stop: int"""
+        self._offset = max(self._offset, min(stop, self._stop))
+
+
 class RecordList(dict):
     """  A RecordList is a set of records: for example a scan.
     It is composed of a environment and a list of records"""
 
     def __init__(self, datahandler, environ=None, apply_interpolation=False,
-                 apply_extrapolation=False, initial_data=None):
+                 apply_extrapolation=False, initial_data=None,
+                 max_records=None):
 
         self.datahandler = datahandler
         self.apply_interpolation = apply_interpolation
         self.apply_extrapolation = apply_extrapolation
         self.initial_data = initial_data
+        # maximum number of written records kept in memory (None - all)
+        if max_records is not None:
+            max_records = max(1, max_records)
+        self.max_records = max_records
         if environ is None:
             self.environ = RecordEnvironment()
         else:
@@ -312,6 +469,13 @@ class RecordList(dict):
         # currentIndex indicates the place in the records list
         # where the next completed record will be written
         self.currentIndex = 0
+        self._store = ColumnStore()
+        # labels of the data added with addData (stored only in the columns)
+        self._dataLabels = set()
+        # record number after the last record copied to the columns
+        self._storedIndex = 0
+        self._channelIndexes = {}
+        self._highWaterMarks = numpy.zeros(0, dtype=numpy.int64)
 
     # make it pickable
     def __getstate__(self):
@@ -353,6 +517,15 @@ class RecordList(dict):
             self.labels.append(dataDesc.name)
         for label in self.labels:
             self.columnIndexDict[label] = 0
+        # columnar storage of the data
+        self._store = ColumnStore()
+        self._dataLabels = set()
+        self._storedIndex = 0
+        # per channel high-water-mark (index of the last added value + 1)
+        self._channelIndexes = dict((label, i) for i, label
+                                    in enumerate(self.channelLabels))
+        self._highWaterMarks = numpy.zeros(len(self.channelLabels),
+                                           dtype=numpy.int64)
         ####
         self.datahandler.startRecordList(self)
 
@@ -372,7 +545,10 @@ class RecordList(dict):
         rc.data['timestamp'] = initial_data.get('timestamp')
         rc.setRecordNo(self.recordno)
         for label in self.channelLabels:
-            rc.data[label] = initial_data.get(label, float('NaN'))
+            value = initial_data.get(label, float('NaN'))
+            rc.data[label] = value
+            if label in initial_data:
+                self._store.setValues(label, [recordno], [value])
         for label in self.refMoveablesLabels:
             rc.data[label] = initial_data.get(label)
         self.records.append(rc)
@@ -381,9 +557,86 @@ class RecordList(dict):
     def initRecords(self, nb_records):
         '''Call nb_records times initRecord method
         '''
+        self._store.reserve(self.recordno + nb_records)
         for _ in range(nb_records):
             self.initRecord()
 
+    def _getValue(self, recordno, label):
+        '''Returns the value of the given column in the given record'''
+        if label in self._dataLabels:
+            return self._store.getValue(recordno, label)
+        return self.records[recordno].data[label]
+
+    def _fillRecords(self, start, stop):
+        '''Copy the channels data from the columns to the records'''
+        records = self.records[start:stop]
+        for label in self.channelLabels:
+            if label not in self._store:
+                continue
+            column = self._store.getColumn(label, start, stop)
+            for rc, value in zip(records, column.tolist()):
+                rc.data[label] = value
+        return records
+
+    def _copyRecords(self, start, records):
+        '''Copy the data (not already stored in the columns) from the given
+        records to the columns'''
+        labels = self._getRecordsLabels(records)
+        if len(records) > 0:
+            idxs = range(start, start + len(records))
+            for label in labels:
+                values = [rc.data.get(label) for rc in records]
+                self._store.setValues(label, idxs, values)
+        self._storedIndex = start + len(records)
+
+    def _storeRecords(self, start, records):
+        '''Copy the data from the written records to the columns and discard
+        the records exceeding the maximum number of records kept in memory.
+
+        If all the records are kept in memory the columns are filled only
+        when requested (see :meth:`getColumn`) so the data are not held
+        twice during the scan.'''
+        max_records = self.max_records
+        if max_records is None:
+            return
+        self._copyRecords(start, records)
+        stop = self.currentIndex - max_records
+        for i in range(self._store.offset, stop):
+            self.records[i] = None
+            self.pop(i, None)
+        self._store.discard(stop)
+
+    def _getRecordsLabels(self, records):
+        '''Returns labels of the completed records data which are not
+        already stored in the columns'''
+        if len(records) == 0:
+            return []
+        labels = list(records[0].data.keys())
+        if self.apply_interpolation or self.apply_extrapolation:
+            return labels
+        return [label for label in labels if label not in self._dataLabels]
+
+    def getColumn(self, name):
+        '''Returns a view (no copy) of the column of the completed records
+        kept in memory. The view is valid until new data is added.
+
+        .. note::
+            The getColumn method has been included in Sardana on a
+            provisional basis. Backwards incompatible changes (up to and
+            including its removal) may occur if deemed necessary by the core
+            developers.
+
+        :param name: column name (label, taurus or Tango name)
+        :type name: str
+        :return: column values
+        :rtype: numpy.ndarray'''
+        if self._storedIndex < self.currentIndex:
+            start = self._storedIndex
+            self._copyRecords(start, self.records[start:self.currentIndex])
+        keys = Record(dict.fromkeys(self._store.labels()))
+        label = keys._getKey(name)
+        return self._store.getColumn(label, stop=self.currentIndex)
+
     def addRecord(self, record):
         rc = Record(record)
         rc.setRecordNo(self.recordno)
@@ -392,6 +645,7 @@ class RecordList(dict):
         self.recordno += 1
         self.datahandler.addRecord(self, rc)
         self.currentIndex += 1
+        self._storeRecords(rc.recordno, [rc])
 
     def applyZeroOrderInterpolation(self, record):
         ''' Apply a zero order interpolation to the given record
@@ -428,8 +682,7 @@ class RecordList(dict):
                 # dig into the record list for the first valid value in the
                 # column and use it to extrapolate missing initial values
                 while True:
-                    next_data = self.records[next_idx].data
-                    next_v = next_data[k]
+                    next_v = self._getValue(next_idx, k)
                     try:
                         is_valid = not math.isnan(next_v)
                     except TypeError:
@@ -449,10 +702,11 @@ class RecordList(dict):
         idxs = data['index']
         # TODO: think if the ScanData.addData is the best API for
         # passing value references
-        rawData = data.get('value') or data.get('value_ref')
-
+        rawData = data.get('value')
+        if rawData is None:
+            rawData = data.get('value_ref')
 
-        maxIdx = max(idxs)
+        maxIdx = int(numpy.max(idxs))
         recordsLen = len(self.records)
         # Calculate missing records
         missingRecords = recordsLen - (maxIdx + 1)
@@ -460,33 +714,45 @@ class RecordList(dict):
         if missingRecords < 0:
             missingRecords = abs(missingRecords)
             self.initRecords(missingRecords)
-        for idx, value in zip(idxs, rawData):
-            rc = self.records[idx]
-            rc.setRecordNo(idx)
-            rc.data[label] = value
-            self.columnIndexDict[label] = idx + 1
+        self._store.setValues(label, idxs, rawData)
+        self._dataLabels.add(label)
+        idx = int(idxs[-1])
+        self.columnIndexDict[label] = idx + 1
+        if label in self._channelIndexes:
+            self._highWaterMarks[self._channelIndexes[label]] = idx + 1
         self.tryToAdd(idx, label)
 
+    def getCompletedFrontier(self):
+        '''Returns the number of records completed i.e. for which all the
+        channels already added data (minimum of the channels high-water-marks)
+        '''
+        if len(self._highWaterMarks) == 0:
+            return len(self.records)
+        return int(self._highWaterMarks.min())
+
     def tryToAdd(self, idx, label):
         start = self.currentIndex
+        stop = min(idx + 1, self.getCompletedFrontier())
+        if stop <= start:
+            return
         # apply extrapolation only at the beginning of the record list
         apply_extrapolation = (self.apply_extrapolation and start == 0)
-        for i in range(start, idx + 1):
-            if self.isRecordCompleted(i):
-                rc = self.records[i]
-                if apply_extrapolation:
-                    self.applyExtrapolation(rc)
-                self[self.currentIndex] = rc
-                if self.apply_interpolation:
-                    self.applyZeroOrderInterpolation(rc)
-                self.datahandler.addRecord(self, rc)
-                self.currentIndex += 1
+        records = self._fillRecords(start, stop)
+        for rc in records:
+            rc.completed = 1
+            if apply_extrapolation:
+                self.applyExtrapolation(rc)
+            self[self.currentIndex] = rc
+            if self.apply_interpolation:
+                self.applyZeroOrderInterpolation(rc)
+            self.currentIndex += 1
+        self.datahandler.addRecords(self, records)
+        self._storeRecords(start, records)
 
     def isRecordCompleted(self, recordno):
         rc = self.records[recordno]
-        for label in self.channelLabels:
-            if self.columnIndexDict[label] <= self.currentIndex:
-                return False
+        if self.getCompletedFrontier() <= self.currentIndex:
+            return False
         rc.completed = 1
         return True
 
@@ -495,14 +761,18 @@ class RecordList(dict):
 
     def end(self):
         start = self.currentIndex
-        for i in range(start, len(self.records)):
-            rc = self.records[i]
-            self[self.currentIndex] = rc
-            if self.apply_interpolation:
-                self.applyZeroOrderInterpolation(rc)
-            self.datahandler.addRecord(self, rc)
-            self.currentIndex += 1
-        self.datahandler.endRecordList(self)
+        try:
+            records = self._fillRecords(start, len(self.records))
+            for rc in records:
+                self[self.currentIndex] = rc
+                if self.apply_interpolation:
+                    self.applyZeroOrderInterpolation(rc)
+                self.currentIndex += 1
+            self.datahandler.addRecords(self, records)
+            self._storeRecords(start, records)
+        finally:
+            # always end the recorders e.g. to stop their writer threads
+            self.datahandler.endRecordList(self)
 
     def getDataHandler(self):
         return self.datahandler
@@ -511,10 +781,11 @@ class RecordList(dict):
 class ScanData(RecordList):
 
     def __init__(self, environment=None, data_handler=None,
-                 apply_interpolation=False, apply_extrapolation=False):
+                 apply_interpolation=False, apply_extrapolation=False,
+                 max_records=None):
         dh = data_handler or DataHandler()
         RecordList.__init__(self, dh, environment, apply_interpolation,
-                            apply_extrapolation)
+                            apply_extrapolation, max_records=max_records)
 
 
 class ScanFactory(Singleton):
@@ -531,7 +802,8 @@ class ScanFactory(Singleton):
         return DataHandler()
 
     def getScanData(self, dh, apply_interpolation=False,
-                    apply_extrapolation=False):
+                    apply_extrapolation=False, max_records=None):
         return ScanData(data_handler=dh,
                         apply_interpolation=apply_interpolation,
-                        apply_extrapolation=apply_extrapolation)
+                        apply_extrapolation=apply_extrapolation,
+                        max_records=max_records)
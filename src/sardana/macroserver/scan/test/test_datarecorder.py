@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.tango-controls.org/static/sardana/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import time
+import threading
+import unittest
+
+from sardana.macroserver.scan.recorder import DataHandler, DataRecorder
+
+
+class Record(object):
+
+    def __init__(self, recordno):
+        self.recordno = recordno
+        self.data = {}
+
+
+class SlowRecorder(DataRecorder):
+    """Recorder which simulates slow disk I/O"""
+
+    def __init__(self, write_time=0, fail_at=None):
+        DataRecorder.__init__(self)
+        self.write_time = write_time
+        self.fail_at = fail_at
+        self.written = []
+        self.ended = False
+        self.threads = set()
+
+    def _writeRecord(self, record):
+        self.threads.add(threading.current_thread())
+        time.sleep(self.write_time)
+        if record.recordno == self.fail_at:
+            raise IOError("disk full")
+        self.written.append(record.recordno)
+
+    def _addCustomData(self, value, name, **kwargs):
+        self.written.append(name)
+
+    def _endRecordList(self, recordlist):
+        self.ended = True
+
+
+class AsynchWriteTestCase(unittest.TestCase):
+    """Unittest of the asynchronous writing of records of DataRecorder"""
+
+    def _write(self, recorder, nb_records):
+        data_handler = DataHandler()
+        data_handler.addRecorder(recorder)
+        data_handler.startRecordList(None)
+        for i in range(nb_records):
+            data_handler.addRecord(None, Record(i))
+        return data_handler
+
+    def test_drain(self):
+        """Records are written in order by a writer thread and all of them
+        are written when the record list ends"""
+        recorder = SlowRecorder(write_time=0.001)
+        recorder.setAsynchWrite(10)
+        data_handler = self._write(recorder, 50)
+        data_handler.addCustomData(None, "custom")
+        data_handler.addRecord(None, Record(50))
+        data_handler.endRecordList(None)
+        self.assertEqual(recorder.written,
+                         list(range(50)) + ["custom", 50])
+        self.assertNotIn(threading.current_thread(), recorder.threads)
+        self.assertTrue(recorder.ended)
+        self.assertEqual(recorder.getQueueDepth(), 0)
+        self.assertEqual(recorder.getWriterLag(), 0)
+
+    def test_backpressure(self):
+        """Queue never exceeds its size"""
+        recorder = SlowRecorder(write_time=0.01)
+        recorder.setAsynchWrite(2)
+        data_handler = DataHandler()
+        data_handler.addRecorder(recorder)
+        data_handler.startRecordList(None)
+        for i in range(10):
+            data_handler.addRecord(None, Record(i))
+            self.assertLessEqual(recorder.getQueueDepth(), 2)
+        self.assertGreater(data_handler.getWriterLags()[recorder], 0)
+        data_handler.endRecordList(None)
+        self.assertEqual(recorder.written, list(range(10)))
+
+    def test_error(self):
+        """Writer errors are raised back to the producer and the record
+        list ends anyway"""
+        recorder = SlowRecorder(fail_at=2)
+        recorder.setAsynchWrite(10)
+        data_handler = self._write(recorder, 3)
+        self.assertRaises(IOError, data_handler.endRecordList, None)
+        self.assertTrue(recorder.ended)
+        self.assertEqual(recorder.written, [0, 1])
@@ -24,8 +24,12 @@
 ##############################################################################
 
 import sys
+import time
 
 import unittest
+from unittest import mock
+
+import numpy
 from taurus.test import insertTest
 
 
@@ -111,3 +115,313 @@ class CTScanTestCase(unittest.TestCase):
             msg = 'Final positions do not match. (expected={0}, got={1})'.format(
                 expected["final_pos"], path.final_pos)
             self.assertEqual(path.final_pos, expected["final_pos"], msg)
+
+
+def _create_motor(name, limits, velocity=1.):
+    from sardana.taurus.core.tango.sardana.pool import Motor
+    motor = mock.MagicMock(Motor)
+    motor.getName.return_value = name
+    motor.getType.return_value = "Motor"
+    motor.getAttribute.return_value.range = limits
+    motor.getBaseRate.return_value = 0.
+    motor.getVelocity.return_value = velocity
+    motor.getAcceleration.return_value = .1
+    motor.getDeceleration.return_value = .1
+    return motor
+
+
+def _create_gap(name, elements):
+    gap = mock.MagicMock()
+    gap.getName.return_value = name
+    gap.getType.return_value = "PseudoMotor"
+    gap.getAttribute.return_value.range = (0., 100.)
+    gap.elements = elements
+    gap.calcPhysicalArray.side_effect = \
+        lambda positions: numpy.column_stack((numpy.asarray(positions) / 2,
+                                              numpy.asarray(positions) / 2))
+    return gap
+
+
+class GScanPseudoMotorTestCase(unittest.TestCase):
+    """Test the scan checks and estimations of the pseudo motors based on
+    the conversion of many positions at once"""
+
+    def setUp(self):
+        from sardana.macroserver.scan.gscan import GScan
+        from sardana.macroserver.scan.scandata import MoveableDesc
+        self.motors = {"m1": _create_motor("m1", (-5., 5.)),
+                       "m2": _create_motor("m2", (-5., 5.), velocity=.5)}
+        self.gap = _create_gap("gap", ["m1", "m2"])
+        self.macro = mock.MagicMock()
+        self.macro.getMoveable.side_effect = self.motors.get
+        self.scan = GScan.__new__(GScan)
+        self.scan._macro = lambda: self.macro
+        self.moveable_desc = MoveableDesc(moveable=self.gap, min_value=0.,
+                                          max_value=8.)
+        self.scan._moveables = [self.moveable_desc]
+
+    def test_check_physical_limits(self):
+        self.scan._check_moveables_limits()
+        self.gap.calcPhysicalArray.assert_called_once()
+        self.moveable_desc.max_value = 12.
+        with self.assertRaises(RuntimeError):
+            self.scan._check_moveables_limits()
+
+    def test_estimate_motion_time(self):
+        from sardana.util.motion import Motor as VMotor
+        from sardana.util.motion import MotionPath
+        motion_time = self.scan._estimate_motion_time([[0.], [4.], [8.]])
+        self.gap.calcPhysicalArray.assert_called_once()
+        # the slowest physical motor determines the motion time
+        v_motor = VMotor(min_vel=0., max_vel=.5, accel_time=.1,
+                         decel_time=.1)
+        expected = 2 * MotionPath(v_motor, 0., 2.).duration
+        self.assertAlmostEqual(motion_time, expected)
+
+
+class GScanHistoryTestCase(unittest.TestCase):
+    """Test the scan history update at the end of the scan"""
+
+    def setUp(self):
+        from sardana.macroserver.scan.gscan import GScan, ScanEndStatus
+        from sardana.macroserver.msscanhistory import ScanHistory
+        self.history = ScanHistory()
+        self.macro = mock.MagicMock()
+        self.macro.getMacroServer.return_value.scan_history = self.history
+        self.scan = GScan.__new__(GScan)
+        self.scan._macro = lambda: self.macro
+        self.scan._data = mock.MagicMock()
+        self.scan._env = dict(startts=time.time(), acqtime=0.,
+                              estimatedtime=1., title="ascan", serialno=1,
+                              user="sardana", ScanFile="test.h5",
+                              ScanDir="/tmp", datadesc=[],
+                              endstatus=ScanEndStatus.Normal)
+
+    def test_store(self):
+        self.scan.end()
+        self.assertEqual(self.history.get(1)["ScanFile"], ("test.h5",))
+        self.macro.setEnv.assert_not_called()
+
+    def test_environment(self):
+        from sardana import sardanacustomsettings
+        with mock.patch.object(sardanacustomsettings, "MS_SCAN_HISTORY_ENV",
+                               True, create=True):
+            self.scan.end()
+        self.macro.setEnv.assert_called_once_with("ScanHistory",
+                                                  self.history.getLast(20))
+
+
+@insertTest(helper_name="mesh_positions", bidirectional=False)
+@insertTest(helper_name="mesh_positions", bidirectional=True)
+@insertTest(helper_name="mesh_positions", bidirectional=True,
+            nb_repetitions=2)
+class GScanEstimateTestCase(unittest.TestCase):
+    """Test the exact scan estimation based on all the scan points"""
+
+    def setUp(self):
+        from sardana.macroserver.scan.gscan import GScan
+        from sardana.macroserver.scan.scandata import MoveableDesc
+        self.motors = [_create_motor("m1", (-5., 5.)),
+                       _create_motor("m2", (-5., 5.), velocity=.5)]
+        self.scan = GScan.__new__(GScan)
+        for motor in self.motors:
+            motor.instrument = None
+        self.scan._moveables = [MoveableDesc(moveable=motor)
+                                for motor in self.motors]
+        self.scan._motion = mock.MagicMock()
+        self.scan._motion.readPosition.return_value = [0., 0.]
+
+    @staticmethod
+    def _mesh_positions(nb_points, bidirectional=False, nb_repetitions=None):
+        # the macro parameter types are available only in the MacroServer
+        with mock.patch.dict(sys.modules), \
+                mock.patch("sardana.macroserver.macro.Type"):
+            from sardana.macroserver.macros.scan import mesh, mesh_repeat
+        if nb_repetitions is None:
+            macro = mesh.__new__(mesh)
+        else:
+            macro = mesh_repeat.__new__(mesh_repeat)
+            macro.nb_repetitions = nb_repetitions
+        macro.starts = numpy.array([0., 0.])
+        macro.finals = numpy.array([1., 2.])
+        macro.nr_intervs = numpy.array([nb_points - 1, 9])
+        macro.bidirectional_mode = bidirectional
+        return macro._get_positions()
+
+    def _set_macro(self, positions, integ_time, points=True):
+        spec = ["warning"]
+        if points:
+            spec.append("getScanPoints")
+        macro = mock.MagicMock(spec=spec)
+        if points:
+            macro.getScanPoints.return_value = positions, integ_time
+        self.scan._macro = lambda: macro
+
+        def generator():
+            for position in positions:
+                yield dict(positions=position, integ_time=integ_time)
+
+        self.scan._generator = lambda: generator
+
+    def mesh_positions(self, bidirectional, nb_repetitions=None):
+        """Test that the mesh positions are in the scan order"""
+        positions = self._mesh_positions(5, bidirectional, nb_repetitions)
+        expected = []
+        m1_space = numpy.linspace(0., 1., 5)
+        for i, m2pos in enumerate(numpy.linspace(0., 2., 10)):
+            space = m1_space
+            if i % 2 != 0 and bidirectional:
+                space = m1_space[::-1]
+            for m1pos in space:
+                expected.extend([[m1pos, m2pos]] * (nb_repetitions or 1))
+        numpy.testing.assert_array_equal(positions, expected)
+        # the estimation is the same as when iterating the generator
+        self._set_macro(positions, .1)
+        estimation = self.scan._estimate()
+        self._set_macro(positions, .1, points=False)
+        total_time, interval_nb = self.scan._estimate()
+        self.assertAlmostEqual(total_time, estimation[0])
+        self.assertEqual(interval_nb, estimation[1])
+        # the estimation is exact regardless of the number of points
+        self._set_macro(positions, .1)
+        self.assertEqual(self.scan._estimate(max_iter=10), estimation)
+        self._set_macro(positions, .1, points=False)
+        total_time, interval_nb = self.scan._estimate(max_iter=10)
+        self.assertLess(total_time, 0)
+        self.assertLess(interval_nb, 0)
+
+
+class _Data(object):
+    """Scan data which records slowly as the file recorders"""
+
+    def __init__(self, record_time=0.):
+        self.record_time = record_time
+        self.records = []
+
+    def addRecord(self, data_line):
+        time.sleep(self.record_time)
+        self.records.append(dict(data_line))
+
+
+@insertTest(helper_name="step_scan", pipelined=False)
+@insertTest(helper_name="step_scan", pipelined=True)
+@insertTest(helper_name="step_scan", pipelined=True, hooks=True)
+@insertTest(helper_name="step_scan", pipelined=True, condition=True)
+@insertTest(helper_name="record_error")
+class SScanPipelinedTestCase(unittest.TestCase):
+    """Test the step scan with the recording of the points pipelined with
+    the motion to the next point"""
+
+    def _create_scan(self, nb_points, pipelined, move_time=0., acq_time=0.,
+                     record_time=0., hooks=False, condition=False,
+                     scan_class=None):
+        from sardana.macroserver.scan.gscan import SScan
+        from sardana.macroserver.scan.scandata import MoveableDesc
+        from sardana.macroserver.msexception import UnknownEnv
+        from sardana.taurus.core.tango.sardana.pool import Ready
+        self.hook = mock.MagicMock(return_value=None)
+        self.hook.getStepExtraInfo.return_value = {}
+        self.positions = []
+
+        def generator():
+            for i in range(nb_points):
+                step = dict(positions=[float(i)], integ_time=acq_time,
+                            extrainfo=dict(info=i))
+                if hooks:
+                    step['post-acq-hooks'] = [self.hook]
+                yield step
+
+        def move(positions):
+            self.positions.append(positions[0])
+            time.sleep(move_time)
+            return Ready, positions
+
+        def count(integ_time):
+            time.sleep(integ_time)
+            return Ready, {"ct01": self.positions[-1] * 2}
+
+        def getEnv(name):
+            if name == "ScanPipelined":
+                return pipelined
+            if name == "GeneralCondition" and condition:
+                return "condition"
+            raise UnknownEnv(name)
+
+        macro = mock.MagicMock(spec=["checkPoint", "getEnv", "createMacro",
+                                     "runMacro", "getGeneralCondition",
+                                     "info", "warning"])
+        macro.getEnv.side_effect = getEnv
+        macro.getGeneralCondition.side_effect = \
+            lambda: getEnv("GeneralCondition") if condition else None
+        macro.createMacro.return_value = (mock.MagicMock(), None)
+        macro.runMacro.return_value = 0
+        motor = mock.MagicMock()
+        motor.getName.return_value = "mot01"
+        extra_column = mock.MagicMock()
+        extra_column.getName.return_value = "ec"
+        extra_column.read.return_value = 1.
+        if scan_class is None:
+            scan_class = SScan
+        scan = scan_class.__new__(scan_class)
+        scan._macro = lambda: macro
+        scan._generator = lambda: generator
+        scan._env = dict(startts=time.time())
+        scan._motion = mock.MagicMock()
+        scan._motion.move.side_effect = move
+        scan._measurement_group = mock.MagicMock()
+        scan._measurement_group.count.side_effect = count
+        scan._moveables = [MoveableDesc(moveable=motor)]
+        scan._extra_columns = [extra_column]
+        scan._data = _Data(record_time)
+        scan.debug = mock.MagicMock()
+        return scan
+
+    @staticmethod
+    def _run(scan):
+        try:
+            for _ in scan.scan_loop():
+                pass
+        finally:
+            scan._stopRecording()
+
+    def step_scan(self, pipelined, hooks=False, condition=False):
+        """Test that the points are recorded in order with all the data
+        regardless of pipelining"""
+        nb_points = 10
+        scan = self._create_scan(nb_points, pipelined, record_time=0.001,
+                                 hooks=hooks, condition=condition)
+        self._run(scan)
+        self.assertIsNone(scan._record_pool)
+        records = scan.data.records
+        self.assertEqual(len(records), nb_points)
+        for i, record in enumerate(records):
+            expected = dict(point_nb=i, timestamp=record["timestamp"],
+                            mot01=float(i), ct01=2. * i, ec=1., info=i)
+            self.assertEqual(record, expected)
+        timestamps = [record["timestamp"] for record in records]
+        self.assertEqual(timestamps, sorted(timestamps))
+        if hooks:
+            self.assertEqual(self.hook.call_count, nb_points)
+
+    def record_error(self):
+        """Test that the recording errors abort the pipelined scan"""
+        scan = self._create_scan(10, True)
+        scan._data.addRecord = mock.MagicMock(side_effect=RuntimeError)
+        with self.assertRaises(RuntimeError):
+            self._run(scan)
+        self.assertLess(len(self.positions), 10)
+
+    def test_hybrid_scan(self):
+        """Test that the hybrid scan, which acquires during the motion,
+        is never pipelined"""
+        from sardana.macroserver.scan.gscan import HScan
+        nb_points = 3
+        scan = self._create_scan(nb_points, True, scan_class=HScan)
+
+        def step_up(n, step, lstep):
+            self.assertIsNone(scan._record_pool)
+
+        with mock.patch.object(HScan, "stepUp",
+                               side_effect=step_up) as step_up_mock:
+            self._run(scan)
+        self.assertEqual(step_up_mock.call_count, nb_points)
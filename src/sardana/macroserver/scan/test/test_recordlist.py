@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.tango-controls.org/static/sardana/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import time
+import unittest
+
+import numpy
+from taurus.test import insertTest
+
+from sardana.macroserver.scan.scandata import ScanData, ColumnStore
+from sardana.macroserver.scan.recorder import DataHandler, DataRecorder
+from sardana.macroserver.scan.test.helper import createScanDataEnvironment
+
+
+class MemoryRecorder(DataRecorder):
+    """Recorder which keeps a copy of the written records data"""
+
+    def __init__(self):
+        DataRecorder.__init__(self)
+        self.records = []
+
+    def _writeRecord(self, record):
+        self.records.append(dict(record.data))
+
+
+class PointwiseScanData(ScanData):
+    """ScanData which adds data and completes records point by point
+    (implementation preceding the columnar one, used as a reference)"""
+
+    def addData(self, data):
+        label = data['label']
+        idxs = data['index']
+        rawData = data.get('value') or data.get('value_ref')
+        maxIdx = max(idxs)
+        missingRecords = len(self.records) - (maxIdx + 1)
+        if missingRecords < 0:
+            for _ in range(abs(missingRecords)):
+                self.initRecord()
+        for idx, value in zip(idxs, rawData):
+            rc = self.records[idx]
+            rc.setRecordNo(idx)
+            rc.data[label] = value
+            self.columnIndexDict[label] = idx + 1
+        self.tryToAdd(idx, label)
+
+    def tryToAdd(self, idx, label):
+        start = self.currentIndex
+        apply_extrapolation = (self.apply_extrapolation and start == 0)
+        for i in range(start, idx + 1):
+            if self.isRecordCompleted(i):
+                rc = self.records[i]
+                if apply_extrapolation:
+                    self.applyExtrapolation(rc)
+                self[self.currentIndex] = rc
+                if self.apply_interpolation:
+                    self.applyZeroOrderInterpolation(rc)
+                self.datahandler.addRecord(self, rc)
+                self.currentIndex += 1
+
+    def isRecordCompleted(self, recordno):
+        rc = self.records[recordno]
+        for label in self.channelLabels:
+            if self.columnIndexDict[label] <= self.currentIndex:
+                return False
+        rc.completed = 1
+        return True
+
+
+def generate_data(nb_channels, nb_points, chunk_size, seed=0):
+    """Generate the addData calls of channels which report their values in
+    chunks of random size (up to chunk_size), interleaved randomly"""
+    random = numpy.random.RandomState(seed)
+    chunks = []
+    for channel in range(nb_channels):
+        label = "ch%d" % channel
+        start = 0
+        while start < nb_points:
+            stop = min(nb_points, start + random.randint(1, chunk_size + 1))
+            values = random.rand(stop - start)
+            chunks.append(dict(label=label, index=list(range(start, stop)),
+                               value=list(values)))
+            start = stop
+    # shuffle the order of the channels but keep each channel ordered
+    order = random.permutation([int(c["label"][2:]) for c in chunks])
+    by_channel = {}
+    for chunk in chunks:
+        by_channel.setdefault(chunk["label"], []).append(chunk)
+    return [by_channel["ch%d" % channel].pop(0) for channel in order]
+
+
+@insertTest(helper_name="add_data", nb_channels=1, nb_points=50,
+            chunk_size=1)
+@insertTest(helper_name="add_data", nb_channels=5, nb_points=200,
+            chunk_size=10, arrays=True)
+@insertTest(helper_name="add_data", nb_channels=5, nb_points=200,
+            chunk_size=10)
+@insertTest(helper_name="add_data", nb_channels=5, nb_points=200,
+            chunk_size=10, apply_interpolation=True, missing=True)
+@insertTest(helper_name="add_data", nb_channels=5, nb_points=200,
+            chunk_size=10, apply_extrapolation=True, missing=True)
+class RecordListTestCase(unittest.TestCase):
+    """Compare the columnar RecordList.addData with the point by point
+    implementation."""
+
+    def _record(self, klass, calls, channels, apply_interpolation=False,
+                apply_extrapolation=False):
+        data_handler = DataHandler()
+        recorder = MemoryRecorder()
+        data_handler.addRecorder(recorder)
+        env = createScanDataEnvironment(channels)
+        scan_data = klass(environment=env, data_handler=data_handler,
+                          apply_interpolation=apply_interpolation,
+                          apply_extrapolation=apply_extrapolation)
+        scan_data.start()
+        start_time = time.time()
+        for call in calls:
+            scan_data.addData(call)
+        add_time = time.time() - start_time
+        scan_data.end()
+        return recorder.records, add_time
+
+    def add_data(self, nb_channels, nb_points, chunk_size,
+                 apply_interpolation=False, apply_extrapolation=False,
+                 missing=False, arrays=False):
+        calls = generate_data(nb_channels, nb_points, chunk_size)
+        if missing:
+            # first value of the first channel is missing (NaN) and so are
+            # some values in the middle of the scan
+            calls[0]["value"][0] = float("NaN")
+            calls[len(calls) // 2]["value"][-1] = float("NaN")
+        channels = ["ch%d" % channel for channel in range(nb_channels)]
+        kwargs = dict(apply_interpolation=apply_interpolation,
+                      apply_extrapolation=apply_extrapolation)
+        expected, _ = self._record(PointwiseScanData, calls, channels,
+                                   **kwargs)
+        if arrays:
+            # e.g. value buffers decoded by the binary codec
+            calls = [dict(label=call["label"],
+                          index=numpy.array(call["index"]),
+                          value=numpy.array(call["value"]))
+                     for call in calls]
+        records, _ = self._record(ScanData, calls, channels, **kwargs)
+        self.assertEqual(len(records), len(expected))
+        for record, expected_record in zip(records, expected):
+            self.assertEqual(sorted(record), sorted(expected_record))
+            for label, value in expected_record.items():
+                numpy.testing.assert_equal(record[label], value)
+
+
+class ColumnStoreTestCase(unittest.TestCase):
+    """Unittest of ColumnStore class"""
+
+    def test_columns(self):
+        store = ColumnStore()
+        store.setValues("float", [0, 1, 3], [0., 1., 3.])
+        store.setValues("int", [0, 1], [0, 1])
+        numpy.testing.assert_equal(store.getColumn("float"),
+                                   [0., 1., numpy.nan, 3.])
+        self.assertEqual(store.getColumn("float").dtype, numpy.float64)
+        self.assertEqual(store.getColumn("int").dtype, object)
+        self.assertEqual(store.getColumn("int", stop=2).tolist(), [0, 1])
+        # float column is upcasted when receiving other types
+        store.setValues("float", [4], ["str"])
+        self.assertEqual(store.getColumn("float").tolist()[-1], "str")
+
+    def test_view(self):
+        store = ColumnStore()
+        store.setValues("col", list(range(10)), numpy.arange(10.))
+        view = store.getColumn("col", 2, 5)
+        store.setValues("col", [3], [30.])
+        self.assertEqual(view[1], 30.)
+
+    def test_discard(self):
+        store = ColumnStore()
+        for i in range(100):
+            store.setValues("col", [i], [float(i)])
+            store.discard(i - 9)
+        self.assertEqual(store.offset, 90)
+        numpy.testing.assert_equal(store.getColumn("col"),
+                                   numpy.arange(90., 100.))
+        self.assertLessEqual(store._capacity, 32)
+        # values of the discarded records are ignored
+        store.setValues("col", [0, 100], [-1., 100.])
+        self.assertEqual(store.getValue(100, "col"), 100.)
+
+
+class ScanDataMemoryTestCase(unittest.TestCase):
+    """Bounded memory usage of ScanData"""
+
+    def _step_scan(self, nb_points, channels, max_records=None):
+        data_handler = DataHandler()
+        recorder = MemoryRecorder()
+        recorder._writeRecord = lambda record: None
+        data_handler.addRecorder(recorder)
+        env = createScanDataEnvironment(channels)
+        scan_data = ScanData(environment=env, data_handler=data_handler,
+                             max_records=max_records)
+        scan_data.start()
+        for i in range(nb_points):
+            record = dict(point_nb=i, timestamp=float(i))
+            for channel in channels:
+                record[channel] = float(i)
+            scan_data.addRecord(record)
+        scan_data.end()
+        return scan_data
+
+    def test_get_column(self):
+        scan_data = self._step_scan(10, ["ch0"])
+        numpy.testing.assert_equal(scan_data.getColumn("ch0"),
+                                   numpy.arange(10.))
+        numpy.testing.assert_equal(scan_data.getColumn("dt"),
+                                   numpy.arange(10.))
+
+    def test_lazy_columns(self):
+        """Columns are filled only when requested if all the records are
+        kept in memory"""
+        scan_data = self._step_scan(10, ["ch0"])
+        self.assertEqual(scan_data._store.labels(), [])
+        numpy.testing.assert_equal(scan_data.getColumn("ch0"),
+                                   numpy.arange(10.))
+        scan_data.addRecord(dict(point_nb=10, timestamp=10., ch0=10.))
+        numpy.testing.assert_equal(scan_data.getColumn("ch0"),
+                                   numpy.arange(11.))
+
+    def test_continuous_lazy_columns(self):
+        calls = generate_data(3, 100, 10)
+        data_handler = DataHandler()
+        recorder = MemoryRecorder()
+        data_handler.addRecorder(recorder)
+        env = createScanDataEnvironment(["ch0", "ch1", "ch2"])
+        scan_data = ScanData(environment=env, data_handler=data_handler)
+        scan_data.start()
+        for call in calls:
+            scan_data.addData(call)
+        scan_data.end()
+        self.assertNotIn("point_nb", scan_data._store)
+        expected = [record["ch1"] for record in recorder.records]
+        numpy.testing.assert_equal(scan_data.getColumn("ch1"), expected)
+        numpy.testing.assert_equal(scan_data.getColumn("point_nb"),
+                                   numpy.arange(100.))
+
+    def test_max_records(self):
+        scan_data = self._step_scan(100, ["ch0"], max_records=10)
+        numpy.testing.assert_equal(scan_data.getColumn("ch0"),
+                                   numpy.arange(90., 100.))
+        self.assertEqual(sorted(scan_data.keys()), list(range(90, 100)))
+        self.assertEqual(len(scan_data.records), 100)
+
+    def test_continuous_max_records(self):
+        calls = generate_data(3, 1000, 10)
+        data_handler = DataHandler()
+        recorder = MemoryRecorder()
+        data_handler.addRecorder(recorder)
+        env = createScanDataEnvironment(["ch0", "ch1", "ch2"])
+        scan_data = ScanData(environment=env, data_handler=data_handler,
+                             max_records=10)
+        scan_data.start()
+        for call in calls:
+            scan_data.addData(call)
+        scan_data.end()
+        self.assertEqual(len(recorder.records), 1000)
+        self.assertEqual(len(scan_data.getColumn("ch0")), 10)
+        expected = [record["ch1"] for record in recorder.records[-10:]]
+        numpy.testing.assert_equal(scan_data.getColumn("ch1"), expected)
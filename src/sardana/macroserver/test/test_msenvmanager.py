@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import time
+import shelve
+import shutil
+import tempfile
+
+import unittest
+from taurus.test import insertTest
+
+from sardana import sardanacustomsettings
+from sardana.macroserver.msenvmanager import EnvironmentManager
+
+
+class FakeMacroServer(object):
+    name = "macroserver/test/1"
+
+
+class SyncCounter(object):
+    """Wraps the environment db sync method and counts its calls"""
+
+    def __init__(self, env):
+        self.count = 0
+        self._sync = env.sync
+        env.sync = self
+
+    def __call__(self):
+        self.count += 1
+        self._sync()
+
+
+@insertTest(helper_name="migrate_scan_history")
+@insertTest(helper_name="migrate")
+@insertTest(helper_name="persist", backend="dumb")
+@insertTest(helper_name="persist", backend="sqlite")
+@insertTest(helper_name="persist", backend="dumb", sync_period=0.05)
+@insertTest(helper_name="persist", backend="sqlite", sync_period=0.05)
+@insertTest(helper_name="write_behind")
+@insertTest(helper_name="batch")
+class EnvironmentManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.f_name = os.path.join(self.dir_name, "env",
+                                   "macroserver.properties")
+        self.macro_server = FakeMacroServer()
+        self.managers = []
+        self._settings = {}
+        for name in ("MS_ENV_SHELVE_BACKEND", "MS_ENV_SYNC_PERIOD"):
+            self._settings[name] = getattr(sardanacustomsettings, name, None)
+
+    def _setSettings(self, backend="dumb", sync_period=None):
+        sardanacustomsettings.MS_ENV_SHELVE_BACKEND = backend
+        sardanacustomsettings.MS_ENV_SYNC_PERIOD = sync_period
+
+    def _createManager(self):
+        manager = EnvironmentManager(self.macro_server, self.f_name)
+        self.managers.append(manager)
+        return manager
+
+    def batch(self):
+        """Test that a multi-key update synchronizes the environment db once
+        """
+        self._setSettings()
+        manager = self._createManager()
+        counter = SyncCounter(manager._env)
+        manager.setEnvObj({"a": 1, "b": 2, "c": 3})
+        self.assertEqual(counter.count, 1)
+        with manager.transaction():
+            manager.setEnv("d", 4)
+            manager.unsetEnv(["a", "b"])
+        self.assertEqual(counter.count, 2)
+        self.assertEqual(manager.getEnv("d"), 4)
+        self.assertFalse(manager.hasEnv("a"))
+
+    def write_behind(self, sync_period=0.1):
+        """Test that the changes are synchronized after the sync period"""
+        self._setSettings(sync_period=sync_period)
+        manager = self._createManager()
+        counter = SyncCounter(manager._env)
+        for i in range(10):
+            manager.setEnv("a", i)
+        self.assertEqual(counter.count, 0)
+        time.sleep(sync_period * 3)
+        self.assertEqual(counter.count, 1)
+        manager.setEnv("a", 10)
+        manager.flush()
+        self.assertEqual(counter.count, 2)
+        # nothing pending - no sync
+        manager.flush()
+        self.assertEqual(counter.count, 2)
+
+    def persist(self, backend, sync_period=None):
+        """Test that the environment is persisted when the manager is
+        cleaned up"""
+        self._setSettings(backend, sync_period)
+        manager = self._createManager()
+        manager.setEnvObj({"a": 1, "door/test/1.b": [1, 2]})
+        manager.setEnv("c", "foo")
+        manager.unsetEnv("a")
+        manager.cleanUp()
+        manager = self._createManager()
+        self.assertEqual(manager.getEnv("c"), "foo")
+        self.assertEqual(manager.getEnv("b", door_name="door/test/1"),
+                         [1, 2])
+        self.assertFalse(manager.hasEnv("a"))
+
+    def migrate(self):
+        """Test migration of the shelve environment to SQLite"""
+        self._setSettings("dumb")
+        manager = self._createManager()
+        manager.setEnvObj({"a": 1, "m.b": {"x": 1}})
+        manager.cleanUp()
+        # leftover of an interrupted migration
+        with open(self.f_name + ".sqlite.tmp", "wb") as f:
+            f.write(b"interrupted")
+        self._setSettings("sqlite")
+        manager = self._createManager()
+        self.assertTrue(os.path.exists(self.f_name + ".sqlite"))
+        self.assertFalse(os.path.exists(self.f_name + ".sqlite.tmp"))
+        self.assertEqual(manager.getEnv("a"), 1)
+        self.assertEqual(manager.getEnv("b", macro_name="m"), {"x": 1})
+        manager.setEnv("a", 2)
+        manager.cleanUp()
+        # the shelve environment is left untouched
+        with shelve.open(self.f_name, flag="r") as env:
+            self.assertEqual(env["a"], 1)
+        # the SQLite environment is not migrated again
+        manager = self._createManager()
+        self.assertEqual(manager.getEnv("a"), 2)
+
+    def migrate_scan_history(self):
+        """Test migration of the ScanHistory environment to the scan history
+        store"""
+        self._setSettings()
+        manager = self._createManager()
+        self.assertEqual(len(manager.scan_history), 0)
+        entries = [dict(serialno=i) for i in range(1, 4)]
+        manager.setEnv("ScanHistory", entries)
+        manager.cleanUp()
+        manager = self._createManager()
+        self.assertEqual(manager.scan_history.getLast(), entries)
+        manager.scan_history.append(dict(serialno=4))
+        manager.cleanUp()
+        # the store is not migrated again
+        manager = self._createManager()
+        self.assertEqual(len(manager.scan_history), 4)
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.cleanUp()
+        for name, value in self._settings.items():
+            setattr(sardanacustomsettings, name, value)
+        shutil.rmtree(self.dir_name)
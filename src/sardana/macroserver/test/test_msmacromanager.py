@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for the macro manager metadata cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from taurus.test import insertTest
+
+from sardana.macroserver.macroserver import MacroServer
+from sardana.macroserver.msmetamacro import LazyMacroLibrary, \
+    LazyMacroClass, LazyMacroFunction
+
+MACRO_LIB_1 = '''"""first macro library"""
+
+from sardana.macroserver.macro import Macro, Type, Optional, macro
+
+
+class macro_lib_cls(Macro):
+    """macro class"""
+
+    param_def = [["motor", Type.Moveable, None, "motor"],
+                 ["pos", Type.Float, Optional, "position"]]
+    result_def = [["result", Type.Float, None, "result"]]
+    hints = {"scan": "macro_lib_cls"}
+
+    def run(self, motor, pos):
+        return 1.
+
+
+@macro([["value", Type.Integer, 1, "value"]])
+def macro_lib_func(self, value):
+    """macro function"""
+    return value
+
+
+@macro()
+def macro_lib_overwritten(self):
+    return 1
+'''
+
+MACRO_LIB_2 = '''"""second macro library"""
+
+from sardana.macroserver.macro import macro
+
+
+@macro()
+def macro_lib_overwritten(self):
+    return 2
+
+
+@macro()
+def macro_lib_other(self):
+    return 2
+'''
+
+
+@insertTest(helper_name="lazy_metadata")
+@insertTest(helper_name="lazy_metadata", workers=4)
+@insertTest(helper_name="first_use", macro_name="macro_lib_cls",
+            lib_name="macro_lib_1")
+@insertTest(helper_name="first_use", macro_name="macro_lib_other",
+            lib_name="macro_lib_2")
+@insertTest(helper_name="overwritten")
+@insertTest(helper_name="changed_lib")
+class MacroManagerCacheTest(unittest.TestCase):
+    # Just an hardcode fullname for create an instance of MacroServer.
+    # This macroserver does not need to be defined.
+    ms_fullname = "macroserver/demo1/1"
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.macro_dir = os.path.join(self.dir_name, "macros")
+        os.mkdir(self.macro_dir)
+        for lib_name, code in (("macro_lib_1", MACRO_LIB_1),
+                               ("macro_lib_2", MACRO_LIB_2)):
+            with open(os.path.join(self.macro_dir, lib_name + ".py"),
+                      "w") as f:
+                f.write(code)
+        self.cache_name = os.path.join(self.dir_name, "env.macrocache")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_name)
+
+    def _createManager(self, cache=True, workers=None):
+        name = self.ms_fullname.split("/")[1]
+        macro_server = MacroServer(self.ms_fullname, name, macro_path=None,
+                                   recorder_path=[])
+        self._macro_server = macro_server
+        manager = macro_server.macro_manager
+        if cache:
+            manager.setMacroCache(self.cache_name)
+        with mock.patch("sardana.sardanacustomsettings."
+                        "MS_MACRO_IMPORT_WORKERS", workers, create=True):
+            manager.setMacroPath([self.macro_dir])
+        return manager
+
+    @staticmethod
+    def _serialize(manager):
+        return {name: macro.serialize()
+                for name, macro in manager.getMacros().items()}
+
+    def lazy_metadata(self, workers=None):
+        """Test that the macros restored from the cache are described as the
+        imported ones"""
+        manager = self._createManager(workers=workers)
+        self.assertTrue(os.path.exists(self.cache_name))
+        imported = self._serialize(manager)
+        imported_libs = {name: lib.serialize()
+                         for name, lib in manager.getMacroLibs().items()}
+        manager = self._createManager(workers=workers)
+        self.assertIsInstance(manager.getMacroLib("macro_lib_1"),
+                              LazyMacroLibrary)
+        self.assertIsInstance(manager.getMacro("macro_lib_cls"),
+                              LazyMacroClass)
+        self.assertIsInstance(manager.getMacro("macro_lib_func"),
+                              LazyMacroFunction)
+        self.assertEqual(self._serialize(manager), imported)
+        self.assertEqual({name: lib.serialize()
+                          for name, lib in manager.getMacroLibs().items()},
+                         imported_libs)
+        self.assertEqual(manager.getMacro("macro_lib_cls").code,
+                         manager.getMacro("macro_lib_cls").get_code())
+        # served from the cache
+        for lib in manager.getMacroLibs().values():
+            self.assertIsInstance(lib, LazyMacroLibrary)
+
+    def first_use(self, macro_name, lib_name):
+        """Test that the macro library is imported on the first use of the
+        macro code"""
+        self._createManager()
+        manager = self._createManager()
+        macro = manager.getMacro(macro_name)
+        self.assertIsInstance(manager.getMacroLib(lib_name), LazyMacroLibrary)
+        code = macro.code_object
+        self.assertEqual(code.__name__, macro_name)
+        macro_lib = manager.getMacroLib(lib_name)
+        self.assertNotIsInstance(macro_lib, LazyMacroLibrary)
+        self.assertIs(macro_lib.module.__dict__[macro_name], code)
+        self.assertIs(manager.getMacroCode(macro_name), code)
+        self.assertNotIsInstance(manager.getMacro(macro_name), LazyMacroClass)
+        self.assertNotIsInstance(manager.getMacro(macro_name),
+                                 LazyMacroFunction)
+
+    def overwritten(self):
+        """Test that the overwritten macros are resolved as without cache"""
+        manager = self._createManager(cache=False)
+        expected = manager.getMacro("macro_lib_overwritten")
+        expected = expected.lib.name, expected.isoverwritten
+        self._createManager()
+        manager = self._createManager()
+        macro = manager.getMacro("macro_lib_overwritten")
+        self.assertEqual((macro.lib.name, macro.isoverwritten), expected)
+        # import the other library
+        other_lib_name = ({"macro_lib_1", "macro_lib_2"} - {expected[0]}).pop()
+        other_lib = manager.getMacroLib(other_lib_name)
+        other_macro = [m for m in other_lib.get_macros()
+                       if m.name != "macro_lib_overwritten"][0]
+        other_macro.code_object
+        macro = manager.getMacro("macro_lib_overwritten")
+        self.assertEqual((macro.lib.name, macro.isoverwritten), expected)
+
+    def changed_lib(self):
+        """Test that the changed macro libraries are not restored from the
+        cache"""
+        self._createManager()
+        file_name = os.path.join(self.macro_dir, "macro_lib_2.py")
+        with open(file_name, "a") as f:
+            f.write("\n\n@macro()\ndef macro_lib_new(self):\n    pass\n")
+        manager = self._createManager()
+        self.assertIsInstance(manager.getMacroLib("macro_lib_1"),
+                              LazyMacroLibrary)
+        self.assertNotIsInstance(manager.getMacroLib("macro_lib_2"),
+                                 LazyMacroLibrary)
+        self.assertIn("macro_lib_new", manager.getMacroNames())
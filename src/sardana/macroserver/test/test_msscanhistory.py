@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import time
+import shutil
+import tempfile
+
+import unittest
+from taurus.test import insertTest
+
+from sardana.macroserver.msscanhistory import ScanHistory
+
+
+def createEntry(serialno):
+    return dict(serialno=serialno, title="ascan mot01 0 10 10 0.1",
+                startts=time.time(), endts=time.time(), deadtime=0.1,
+                estimatedtime=1.0, user="sardana", ScanDir="/tmp",
+                ScanFile=("test.h5",), endstatus="Normal",
+                channels=["ct01", "ct02"])
+
+
+@insertTest(helper_name="corrupted")
+@insertTest(helper_name="persist", nb_entries=25, max_size=10)
+@insertTest(helper_name="persist", nb_entries=5, max_size=10)
+@insertTest(helper_name="retain", in_memory=True)
+@insertTest(helper_name="retain", in_memory=False)
+@insertTest(helper_name="lookup", in_memory=True)
+@insertTest(helper_name="lookup", in_memory=False)
+class ScanHistoryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.f_name = os.path.join(self.dir_name, "macroserver.scanhistory")
+        self.histories = []
+
+    def _createHistory(self, in_memory=False, max_size=1000):
+        f_name = None if in_memory else self.f_name
+        history = ScanHistory(f_name, max_size)
+        self.histories.append(history)
+        return history
+
+    def lookup(self, in_memory):
+        history = self._createHistory(in_memory)
+        history.extend([createEntry(i) for i in range(1, 6)])
+        self.assertEqual(len(history), 5)
+        self.assertIn(3, history)
+        self.assertEqual(history.get(3)["serialno"], 3)
+        self.assertIsNone(history.get(6))
+        # repeated serial number returns the last entry
+        entry = createEntry(3)
+        entry["title"] = "repeated"
+        history.append(entry)
+        self.assertEqual(history.get(3)["title"], "repeated")
+        serialnos = [e["serialno"] for e in history.getLast(2)]
+        self.assertEqual(serialnos, [5, 3])
+
+    def retain(self, in_memory, max_size=10, nb_entries=35):
+        history = self._createHistory(in_memory, max_size)
+        for i in range(nb_entries):
+            history.append(createEntry(i))
+            self.assertEqual(len(history), min(i + 1, max_size))
+        serialnos = [e["serialno"] for e in history.getLast()]
+        self.assertEqual(serialnos, list(range(nb_entries - max_size,
+                                               nb_entries)))
+        self.assertNotIn(nb_entries - max_size - 1, history)
+        self.assertIsNone(history.get(0))
+        # compaction keeps at most twice as many entries as retained
+        self.assertLess(len(history._entries), 2 * max_size)
+
+    def persist(self, nb_entries, max_size):
+        history = self._createHistory(max_size=max_size)
+        history.extend([createEntry(i) for i in range(nb_entries)])
+        history.close()
+        history = self._createHistory(max_size=max_size)
+        self.assertEqual(len(history), min(nb_entries, max_size))
+        self.assertEqual(history.get(nb_entries - 1)["serialno"],
+                         nb_entries - 1)
+        history.append(createEntry(nb_entries))
+        self.assertEqual(history.getLast(1)[0]["serialno"], nb_entries)
+
+    def corrupted(self):
+        """Test that an incompletely written entry is discarded"""
+        history = self._createHistory()
+        history.extend([createEntry(i) for i in range(3)])
+        history.close()
+        with open(self.f_name, "ab") as f:
+            f.write(b"\x80\x04\x95")
+        history = self._createHistory()
+        self.assertEqual(len(history), 3)
+        history.append(createEntry(3))
+        history.close()
+        history = self._createHistory()
+        self.assertEqual(len(history), 4)
+
+    def tearDown(self):
+        for history in self.histories:
+            history.close()
+        shutil.rmtree(self.dir_name)
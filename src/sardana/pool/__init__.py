@@ -26,10 +26,11 @@
 """This is the main device pool module"""
 
 __all__ = ["ControllerAPI", "AcqTriggerType", "AcqSynch", "AcqSynchType",
-           "AcqMode", "PoolUtil"]
+           "AcqMode", "AcqNotification", "PoolUtil"]
 
 __docformat__ = 'restructuredtext'
 
 from .pooldefs import (ControllerAPI, AcqTriggerType, AcqMode, AcqSynch,
-                       AcqSynchType, SynchDomain, SynchParam)
+                       AcqSynchType, SynchDomain, SynchParam,
+                       AcqNotification)
 from .poolutil import PoolUtil
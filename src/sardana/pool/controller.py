@@ -29,7 +29,8 @@ __all__ = ["DataAccess", "SardanaValue", "Type", "Access", "Description",
            "DefaultValue", "FGet", "FSet",
            "Memorized", "MemorizedNoInit", "NotMemorized", "MaxDimSize",
            "Controller", "Readable", "Startable", "Stopable", "Loadable",
-           "Referable", "Synchronizer",
+           "Referable", "Synchronizer", "Notifier", "VectorizedPseudoCounter",
+           "VectorizedPseudoMotor",
            "MotorController", "CounterTimerController", "ZeroDController",
            "OneDController", "TwoDController", "TriggerGateController",
            "PseudoMotorController", "PseudoCounterController",
@@ -44,7 +45,8 @@ from taurus.core.util.log import Logger
 
 from sardana import DataAccess
 from sardana.sardanavalue import SardanaValue
-from sardana.pool.pooldefs import ControllerAPI, AcqSynch, AcqMode
+from sardana.pool.pooldefs import ControllerAPI, AcqSynch, AcqMode, \
+    AcqNotification
 
 
 #: Constant data type (to be used as a *key* in the definition of
@@ -689,6 +691,152 @@ class Referable(object):
         raise NotImplementedError("RefOne must be defined in the controller")
 
 
+class Notifier(object):
+    """A Notifier interface. A controller which is able to signal that the
+    state of its axes has changed or that new data are ready to be read
+    (e.g. from an interrupt or a callback of the vendor library) should
+    implement this interface. The acquisition action then blocks waiting for
+    these notifications instead of polling the controller with a fixed
+    sleep time. Polling is still used as a fallback.
+
+    .. note: Inherit from Notifier together with either
+        CounterTimerController, OneDController or TwoDController
+
+    .. note::
+        The Notifier class has been included in Sardana on a provisional
+        basis. Backwards incompatible changes (up to and including removal
+        of the class) may occur if deemed necessary by the core developers.
+    """
+
+    def IsNotifying(self):
+        """**Controller API**. Override if necessary.
+        Called before the acquisition in order to know if the controller
+        will notify about the state changes and new data.
+        Default implementation returns True.
+
+        :return: True if the controller will send notifications or False
+            if the acquisition action must poll it
+        :rtype: bool"""
+        return True
+
+    def NotifyStateChange(self, axis=None):
+        """**Controller API**. Do not override.
+        Call it whenever the state of the axis has changed e.g. the
+        acquisition has finished. It may be called from any thread.
+
+        :param int axis: axis number or None if it concerns all the axes"""
+        self._notify(AcqNotification.StateChange, axis)
+
+    def NotifyDataReady(self, axis=None):
+        """**Controller API**. Do not override.
+        Call it whenever new data are ready to be read from the axis.
+        It may be called from any thread.
+
+        :param int axis: axis number or None if it concerns all the axes"""
+        self._notify(AcqNotification.DataReady, axis)
+
+    def _setNotificationCallback(self, cb):
+        """*Internal*. Set (or clear with None) the callback of the
+        acquisition action waiting for notifications."""
+        self._notification_cb = cb
+
+    def _notify(self, notification, axis):
+        """*Internal*."""
+        cb = getattr(self, "_notification_cb", None)
+        if cb is not None:
+            cb(notification, axis)
+
+
+class VectorizedPseudoCounter(object):
+    """A VectorizedPseudoCounter interface. A pseudo counter controller
+    which is able to calculate many pseudo counter values at once from
+    arrays of counter values should implement this interface. During the
+    continuous acquisition the chunks of counter values are passed to
+    :meth:`~VectorizedPseudoCounter.CalcArray` in one call instead of
+    calling :meth:`~PseudoCounterController.Calc` for every value.
+    The value by value calculation is still used as a fallback e.g. when
+    some of the counter values are not yet available.
+
+    .. note: Inherit from VectorizedPseudoCounter together with
+        PseudoCounterController
+
+    .. note::
+        The VectorizedPseudoCounter class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including removal of the class) may occur if deemed necessary by
+        the core developers.
+    """
+
+    def CalcArray(self, axis, values):
+        """**Pseudo Counter Controller API**. Override is **MANDATORY**.
+           Calculate pseudo counter values given the arrays of counter
+           values.
+
+           :param int axis: the pseudo counter role axis
+           :param sequence<numpy.ndarray> values: a sequence containing
+               arrays of values of underlying elements (one for each counter
+               role), the first dimension of each array corresponds to the
+               acquired value
+           :return: an array of pseudo counter values (one for each acquired
+               value) corresponding to the given axis pseudo counter role
+           :rtype: numpy.ndarray"""
+        raise NotImplementedError("CalcArray must be defined in the "
+                                  "controller")
+
+
+class VectorizedPseudoMotor(object):
+    """A VectorizedPseudoMotor interface. A pseudo motor controller which is
+    able to convert many positions at once from arrays of positions should
+    implement this interface. It is used when many points must be converted
+    at once e.g. when checking the limits or estimating the duration of a
+    scan. Pseudo motor controllers not implementing this interface convert
+    the positions point by point with
+    :meth:`~PseudoMotorController.CalcAllPseudo` and
+    :meth:`~PseudoMotorController.CalcAllPhysical`.
+
+    .. note: Inherit from VectorizedPseudoMotor together with
+        PseudoMotorController
+
+    .. note::
+        The VectorizedPseudoMotor class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including removal of the class) may occur if deemed necessary by
+        the core developers.
+    """
+
+    def CalcAllPseudoArray(self, physical_pos, curr_pseudo_pos):
+        """**Pseudo Motor Controller API**. Override is **MANDATORY**.
+           Calculates the positions of all pseudo motors that belong to the
+           pseudo motor system from the arrays of positions of the physical
+           motors.
+
+           :param numpy.ndarray physical_pos: a (N, number of motor roles)
+               array of physical motor positions (one row for each point)
+           :param sequence<float> curr_pseudo_pos: a sequence containing the
+               current pseudo motor positions or None
+           :return: a (N, number of pseudo motor roles) array of pseudo motor
+               positions (one row for each point)
+           :rtype: numpy.ndarray"""
+        raise NotImplementedError("CalcAllPseudoArray must be defined in "
+                                  "the controller")
+
+    def CalcAllPhysicalArray(self, pseudo_pos, curr_physical_pos):
+        """**Pseudo Motor Controller API**. Override is **MANDATORY**.
+           Calculates the positions of all motors that belong to the pseudo
+           motor system from the arrays of positions of the pseudo motors.
+
+           :param numpy.ndarray pseudo_pos: a (N, number of pseudo motor
+               roles) array of pseudo motor positions (one row for each
+               point)
+           :param sequence<float> curr_physical_pos: a sequence containing
+               the current physical motor positions or None
+           :return: a (N, number of motor roles) array of physical motor
+               positions (one row for each point)
+           :rtype: numpy.ndarray"""
+        raise NotImplementedError("CalcAllPhysicalArray must be defined in "
+                                  "the controller")
+
+
 class Synchronizer(object):
     """A Synchronizer interface. A controller for which its axis are 'Able to
     Synchronize' should implement this interface
@@ -47,6 +47,7 @@ from sardana.pool.poolobject import PoolObject
 from sardana.pool.poolcontainer import PoolContainer
 from sardana.pool.poolcontroller import PoolController
 from sardana.pool.poolmonitor import PoolMonitor
+from sardana.pool.poolmotion import MotionLoopPolicy
 from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
 from sardana.pool.poolcontrollermanager import ControllerManager
 from sardana.pool.poolmeasurementgroup import PoolMeasurementGroup
@@ -107,6 +108,9 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
     #: Default value representing the sleep time for each motion loop
     Default_MotionLoop_SleepTime = 0.01
 
+    #: Default value representing the sleep time policy of the motion loop
+    Default_MotionLoop_Policy = MotionLoopPolicy.Fixed
+
     #: Default value representing the number of state reads per value
     #: read during a motion loop
     Default_AcqLoop_StatesPerValue = 10
@@ -114,14 +118,29 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
     #: Default value representing the sleep time for each acquisition loop
     Default_AcqLoop_SleepTime = 0.01
 
+    #: Default value representing the maximum time the acquisition loop
+    #: waits for a notification when all the controllers are notifiers
+    Default_AcqLoop_NotificationTimeout = 0.5
+
     Default_DriftCorrection = True
 
+    #: Default value representing whether the pool monitor reads the state
+    #: of the controllers concurrently
+    Default_Monitor_Concurrent = False
+
+    #: Default value representing the time the pool monitor waits for a
+    #: controller in the concurrent mode (None means the monitor period)
+    Default_Monitor_CtrlTimeout = None
+
     def __init__(self, full_name, name=None):
         self._path_id = None
         self._motion_loop_states_per_position = self.Default_MotionLoop_StatesPerPosition
         self._motion_loop_sleep_time = self.Default_MotionLoop_SleepTime
+        self._motion_loop_policy = self.Default_MotionLoop_Policy
         self._acq_loop_states_per_value = self.Default_AcqLoop_StatesPerValue
         self._acq_loop_sleep_time = self.Default_AcqLoop_SleepTime
+        self._acq_loop_notification_timeout = \
+            self.Default_AcqLoop_NotificationTimeout
         self._drift_correction = self.Default_DriftCorrection
         self._remote_log_handler = None
 
@@ -137,7 +156,10 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
         PoolContainer.__init__(self)
         PoolObject.__init__(self, full_name=full_name, name=name, id=InvalidId,
                             pool=self, elem_type=ElementType.Pool)
-        self._monitor = PoolMonitor(self, "PMonitor", auto_start=False)
+        self._monitor = PoolMonitor(
+            self, "PMonitor", auto_start=False,
+            concurrent=self.Default_Monitor_Concurrent,
+            ctrl_timeout=self.Default_Monitor_CtrlTimeout)
         # self.init_local_logging()
         ControllerManager().set_pool(self)
 
@@ -221,6 +243,18 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
                                       set_motion_loop_sleep_time,
                                       doc="motion sleep time (s)")
 
+    def set_motion_loop_policy(self, motion_loop_policy):
+        if isinstance(motion_loop_policy, str):
+            motion_loop_policy = MotionLoopPolicy[motion_loop_policy]
+        self._motion_loop_policy = motion_loop_policy
+
+    def get_motion_loop_policy(self):
+        return self._motion_loop_policy
+
+    motion_loop_policy = property(get_motion_loop_policy,
+                                  set_motion_loop_policy,
+                                  doc="motion loop sleep time policy")
+
     def set_motion_loop_states_per_position(self, motion_loop_states_per_position):
         self._motion_loop_states_per_position = motion_loop_states_per_position
 
@@ -253,6 +287,19 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
                                          doc="Number of State reads done before doing a value read in the "
                                          "acquisition loop")
 
+    def set_acq_loop_notification_timeout(self,
+                                          acq_loop_notification_timeout):
+        self._acq_loop_notification_timeout = acq_loop_notification_timeout
+
+    def get_acq_loop_notification_timeout(self):
+        return self._acq_loop_notification_timeout
+
+    acq_loop_notification_timeout = property(
+        get_acq_loop_notification_timeout,
+        set_acq_loop_notification_timeout,
+        doc="maximum time (s) the acquisition loop waits for a controller "
+            "notification before polling the state (fallback)")
+
     def set_drift_correction(self, drift_correction):
         self._drift_correction = drift_correction
 
@@ -263,6 +310,29 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
                                 set_drift_correction,
                                 doc="drift correction")
 
+    def set_monitor_concurrent(self, monitor_concurrent):
+        self._monitor.set_concurrent(monitor_concurrent)
+
+    def get_monitor_concurrent(self):
+        return self._monitor.get_concurrent()
+
+    monitor_concurrent = property(get_monitor_concurrent,
+                                  set_monitor_concurrent,
+                                  doc="whether the pool monitor reads the "
+                                      "state of the controllers concurrently")
+
+    def set_monitor_ctrl_timeout(self, monitor_ctrl_timeout):
+        self._monitor.set_ctrl_timeout(monitor_ctrl_timeout)
+
+    def get_monitor_ctrl_timeout(self):
+        return self._monitor.get_ctrl_timeout()
+
+    monitor_ctrl_timeout = property(
+        get_monitor_ctrl_timeout,
+        set_monitor_ctrl_timeout,
+        doc="time (s) the pool monitor waits for a controller in the "
+            "concurrent mode (None means the monitor period)")
+
     @property
     def monitor(self):
         return self._monitor
@@ -280,6 +350,15 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
     def set_path(self, path):
         self.ctrl_manager.setControllerPath(path, reload=False)
 
+    def set_controller_cache(self, filename):
+        """Sets the controller libraries metadata cache file (None disables
+        the cache). Must be set before the path.
+
+        :param filename: cache file name or None
+        :type filename: :obj:`str`
+        """
+        self.ctrl_manager.setControllerCache(filename)
+
     def get_controller_libs(self):
         return self.ctrl_manager.getControllerLibs()
 
@@ -47,7 +47,7 @@ from sardana import AttrQuality, SardanaValue, State, ElementType, \
     TYPE_TIMERABLE_ELEMENTS
 
 from sardana.sardanathreadpool import get_thread_pool
-from sardana.pool import AcqSynch, AcqMode
+from sardana.pool import AcqSynch, AcqMode, AcqNotification
 from sardana.pool.poolaction import ActionContext, PoolAction, \
     OperationContext
 from sardana.pool.poolsynchronization import PoolSynchronization
@@ -529,6 +529,29 @@ class PoolAcquisition(PoolAction):
             or self._hw_acq.is_running()\
             or self._synch.is_running()
 
+    def wait_finish(self, timeout=None):
+        """Waits until the acquisition finishes.
+
+        Acquisition is finished when all its sub-actions are finished.
+
+        :param timeout: maximum time to wait (seconds), None means wait
+          forever
+        :type timeout: :obj:`float`
+        :return: True if the acquisition finished or False on timeout
+        :rtype: :obj:`bool`
+        """
+        if timeout is not None:
+            end_time = time.time() + timeout
+        # synchronization starts the software acquisitions so it is waited
+        # first - afterwards the triggered sub-actions are already busy
+        for action in (self._synch, self._hw_acq, self._sw_start_acq,
+                       self._sw_acq, self._0d_acq):
+            if timeout is not None:
+                timeout = max(end_time - time.time(), 0)
+            if not action._wait(timeout):
+                return False
+        return True
+
     def run(self, *args, **kwargs):
         """Runs acquisition according to previous preparation."""
         for elem in self.get_elements():
@@ -726,6 +749,13 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
         PoolAcquisitionBase.__init__(self, main_element, name)
         self._nb_states_per_value = None
         self._acq_sleep_time = None
+        self._acq_wait_time = None
+        self._notification = threading.Event()
+        self._notification_lock = threading.Lock()
+        self._notified_data = False
+        self._notification_only = False
+        self._value_read_due = True
+        self._notifier_ctrls = []
         self._pool_ctrl_dict_loop = None
         self._pool_ctrl_dict_ref = None
         self._pool_ctrl_dict_value = None
@@ -797,10 +827,8 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
 
     def _raw_read_value_ref_concurrent(self, ret):
         """Internal method. Read value ref in a concurrent mode"""
-        th_pool = get_thread_pool()
-        for pool_ctrl in self.get_read_value_ref_ctrls():
-            th_pool.add(self._raw_read_ctrl_value_ref, None, ret, pool_ctrl)
-        return ret
+        return self._read_concurrent(self._raw_read_ctrl_value_ref, ret,
+                                     self.get_read_value_ref_ctrls())
 
     def _raw_read_ctrl_value_ref(self, ret, pool_ctrl):
         """Internal method. Read controller value ref information and store
@@ -943,12 +971,18 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
             for channel in self._channels:
                 channel.set_state(State.Moving, propagate=2)
 
+            # connect to notifier controllers before starting them so no
+            # notification is lost
+            self._connect_notifications(ctrls)
+
             # StartAll on all enabled controllers
             for ctrl in ctrls:
                 try:
                     pool_ctrl = ctrl.element
                     pool_ctrl.ctrl.StartAll()
                 except Exception as e:
+                    # the action loop will not run and disconnect
+                    self._disconnect_notifications()
                     channels = ctrl.get_channels(enabled=True)
                     self.debug(e, exc_info=True)
                     for channel in channels:
@@ -956,6 +990,75 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
                     msg = ("%s.StartAll() failed" % ctrl.name)
                     raise Exception(msg)
 
+    def stop_action(self, *args, **kwargs):
+        """Stop procedure for this action."""
+        PoolAcquisitionBase.stop_action(self, *args, **kwargs)
+        # do not wait for notification or timeout in the action loop
+        self._notification.set()
+
+    def abort_action(self, *args, **kwargs):
+        """Aborts procedure for this action"""
+        PoolAcquisitionBase.abort_action(self, *args, **kwargs)
+        # do not wait for notification or timeout in the action loop
+        self._notification.set()
+
+    def _notification_received(self, notification, axis):
+        """Internal method. Callback for the notifier controllers. It may be
+        called from any thread."""
+        if notification == AcqNotification.DataReady:
+            with self._notification_lock:
+                self._notified_data = True
+        self._notification.set()
+
+    def _connect_notifications(self, ctrls):
+        """Internal method. Connect to the notifier controllers.
+
+        If all the controllers notify, the action loop waits for the
+        notifications for at most the pool's acquisition loop notification
+        timeout and reads values only when new data are notified. Otherwise
+        the notifications just shorten the acquisition loop sleep time."""
+        self._notification.clear()
+        self._notified_data = False
+        self._value_read_due = True
+        self._notifier_ctrls = notifier_ctrls = []
+        notification_only = len(ctrls) > 0
+        for ctrl in ctrls:
+            pool_ctrl = ctrl.element
+            if pool_ctrl.is_notifier() and pool_ctrl.ctrl.IsNotifying():
+                pool_ctrl.ctrl._setNotificationCallback(
+                    self._notification_received)
+                notifier_ctrls.append(pool_ctrl)
+            else:
+                notification_only = False
+        self._notification_only = notification_only
+        if notification_only:
+            self._acq_wait_time = self.pool.acq_loop_notification_timeout
+        else:
+            self._acq_wait_time = self._acq_sleep_time
+
+    def _disconnect_notifications(self):
+        """Internal method. Disconnect from the notifier controllers."""
+        for pool_ctrl in self._notifier_ctrls:
+            pool_ctrl.ctrl._setNotificationCallback(None)
+        self._notifier_ctrls = []
+
+    def _wait_notification(self):
+        """Internal method. Block until any of the notifier controllers
+        signals a state change or new data or until the wait time elapses."""
+        notified = self._notification.wait(self._acq_wait_time)
+        self._notification.clear()
+        with self._notification_lock:
+            notified_data, self._notified_data = self._notified_data, False
+        # on timeout values are read as a fallback
+        self._value_read_due = notified_data or not notified
+
+    def _is_value_read_due(self, i):
+        """Internal method. Determines if values should be read in the
+        i-th iteration of the action loop."""
+        if self._notification_only:
+            return self._value_read_due
+        return not i % self._nb_states_per_value
+
     def _set_pool_ctrl_dict_loop(self, ctrls):
         ctrl_channels = {}
         for ctrl in ctrls:
@@ -1044,30 +1147,30 @@ class PoolAcquisitionHardware(PoolAcquisitionTimerable):
             element = channel.element
             states[element] = None
 
-        nap = self._acq_sleep_time
-        nb_states_per_value = self._nb_states_per_value
-
-        while True:
-            self.read_state_info(ret=states)
-            if not self.in_acquisition(states):
-                break
-
-            # read value every n times
-            if not i % nb_states_per_value:
-                self.read_value(ret=values)
-                for acquirable, value in list(values.items()):
-                    if is_value_error(value):
-                        self.error("Loop read value error for %s" %
-                                   acquirable.name)
-                        msg = "Details: " + "".join(
-                            traceback.format_exception(*value.exc_info))
-                        self.debug(msg)
-                        acquirable.put_value(value)
-                    else:
-                        acquirable.extend_value_buffer(value)
-
-            time.sleep(nap)
-            i += 1
+        try:
+            while True:
+                self.read_state_info(ret=states)
+                if not self.in_acquisition(states):
+                    break
+
+                # read value every n times (or when notified)
+                if self._is_value_read_due(i):
+                    self.read_value(ret=values)
+                    for acquirable, value in list(values.items()):
+                        if is_value_error(value):
+                            self.error("Loop read value error for %s" %
+                                       acquirable.name)
+                            msg = "Details: " + "".join(
+                                traceback.format_exception(*value.exc_info))
+                            self.debug(msg)
+                            acquirable.put_value(value)
+                        else:
+                            acquirable.extend_value_buffer(value)
+
+                self._wait_notification()
+                i += 1
+        finally:
+            self._disconnect_notifications()
 
         with ActionContext(self):
             self.raw_read_value(ret=values)
@@ -1151,23 +1254,24 @@ class PoolAcquisitionSoftware(PoolAcquisitionTimerable):
             element = channel.element
             states[element] = None
 
-        nap = self._acq_sleep_time
-        nb_states_per_value = self._nb_states_per_value
-
         i = 0
-        while True:
-            self.read_state_info(ret=states)
-            if not self.in_acquisition(states):
-                break
-
-            # read value every n times
-            if not i % nb_states_per_value:
-                self.read_value_loop(ret=values)
-                for acquirable, value in list(values.items()):
-                    acquirable.put_value(value, quality=AttrQuality.Changing)
-
-            time.sleep(nap)
-            i += 1
+        try:
+            while True:
+                self.read_state_info(ret=states)
+                if not self.in_acquisition(states):
+                    break
+
+                # read value every n times (or when notified)
+                if self._is_value_read_due(i):
+                    self.read_value_loop(ret=values)
+                    for acquirable, value in list(values.items()):
+                        acquirable.put_value(value,
+                                             quality=AttrQuality.Changing)
+
+                self._wait_notification()
+                i += 1
+        finally:
+            self._disconnect_notifications()
 
         for slave in self._slaves:
             try:
@@ -1249,40 +1353,40 @@ class PoolAcquisitionSoftwareStart(PoolAcquisitionTimerable):
             element = channel.element
             states[element] = None
 
-        nap = self._acq_sleep_time
-        nb_states_per_value = self._nb_states_per_value
-
-        while True:
-            self.read_state_info(ret=states)
-            if not self.in_acquisition(states):
-                break
-
-            # read value every n times
-            if not i % nb_states_per_value:
-                self.read_value(ret=values)
-                for acquirable, value in list(values.items()):
-                    if is_value_error(value):
-                        self.error("Loop read value error for %s" %
-                                   acquirable.name)
-                        msg = "Details: " + "".join(
-                            traceback.format_exception(*value.exc_info))
-                        self.debug(msg)
-                        acquirable.put_value(value)
-                    else:
-                        acquirable.extend_value_buffer(value)
-                self.read_value_ref(ret=value_refs)
-                for acquirable, value_ref in list(value_refs.items()):
-                    if is_value_error(value_ref):
-                        self.error("Loop read value ref error for %s" %
-                                   acquirable.name)
-                        msg = "Details: " + "".join(
-                            traceback.format_exception(*value.exc_info))
-                        self.debug(msg)
-                        acquirable.put_value_ref(value)
-                    else:
-                        acquirable.extend_value_ref_buffer(value_ref)
-            time.sleep(nap)
-            i += 1
+        try:
+            while True:
+                self.read_state_info(ret=states)
+                if not self.in_acquisition(states):
+                    break
+
+                # read value every n times (or when notified)
+                if self._is_value_read_due(i):
+                    self.read_value(ret=values)
+                    for acquirable, value in list(values.items()):
+                        if is_value_error(value):
+                            self.error("Loop read value error for %s" %
+                                       acquirable.name)
+                            msg = "Details: " + "".join(
+                                traceback.format_exception(*value.exc_info))
+                            self.debug(msg)
+                            acquirable.put_value(value)
+                        else:
+                            acquirable.extend_value_buffer(value)
+                    self.read_value_ref(ret=value_refs)
+                    for acquirable, value_ref in list(value_refs.items()):
+                        if is_value_error(value_ref):
+                            self.error("Loop read value ref error for %s" %
+                                       acquirable.name)
+                            msg = "Details: " + "".join(
+                                traceback.format_exception(*value.exc_info))
+                            self.debug(msg)
+                            acquirable.put_value_ref(value)
+                        else:
+                            acquirable.extend_value_ref_buffer(value_ref)
+                self._wait_notification()
+                i += 1
+        finally:
+            self._disconnect_notifications()
 
         with ActionContext(self):
             self.raw_read_value(ret=values)
@@ -1358,28 +1462,28 @@ class PoolCTAcquisition(PoolAcquisitionTimerable):
             states[element] = None
             # values[element] = None
 
-        nap = self._acq_sleep_time
-        nb_states_per_value = self._nb_states_per_value
-
         # read values to send a first event when starting to acquire
         with ActionContext(self):
             self.raw_read_value_loop(ret=values)
             for acquirable, value in list(values.items()):
                 acquirable.put_value(value, propagate=2)
 
-        while True:
-            self.read_state_info(ret=states)
-            if not self.in_acquisition(states):
-                break
-
-            # read value every n times
-            if not i % nb_states_per_value:
-                self.read_value_loop(ret=values)
-                for acquirable, value in list(values.items()):
-                    acquirable.put_value(value)
+        try:
+            while True:
+                self.read_state_info(ret=states)
+                if not self.in_acquisition(states):
+                    break
+
+                # read value every n times (or when notified)
+                if self._is_value_read_due(i):
+                    self.read_value_loop(ret=values)
+                    for acquirable, value in list(values.items()):
+                        acquirable.put_value(value)
 
-            time.sleep(nap)
-            i += 1
+                self._wait_notification()
+                i += 1
+        finally:
+            self._disconnect_notifications()
 
         for slave in self._slaves:
             try:
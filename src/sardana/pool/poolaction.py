@@ -27,11 +27,12 @@
 abstract action over a set of pool elements"""
 
 __all__ = ["PoolActionItem", "OperationInfo", "ActionContext", "PoolAction",
-           "get_thread_pool"]
+           "ControllerReader", "get_thread_pool"]
 
 __docformat__ = 'restructuredtext'
 
 import sys
+import queue
 import weakref
 import traceback
 import threading
@@ -40,8 +41,8 @@ from collections import OrderedDict
 
 from taurus.core.util.log import Logger
 
-from sardana import State
-from sardana.sardanathreadpool import get_thread_pool
+from sardana import State, sardanacustomsettings
+from sardana.sardanathreadpool import get_thread_pool, OmniThread
 from sardana.pool.poolobject import PoolObject
 
 
@@ -106,6 +107,57 @@ class OperationInfo(object):
         return self.release()
 
 
+class ControllerReader(Logger):
+    """Persistent worker of a controller executing its hardware requests
+    (e.g. reading state or value of its axes) in a dedicated thread.
+
+    Actions involving many controllers fan out the requests to the readers
+    of the controllers, so all the controllers are accessed in parallel
+    regardless of the size of the global thread pool.
+
+    .. note::
+        The ControllerReader class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    def __init__(self, name):
+        Logger.__init__(self, name)
+        self._jobs = queue.Queue()
+        self._thread = OmniThread(name=name, target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def add(self, job, *args):
+        """Queue a job to be executed by the reader.
+
+        :param job: callable executed in the reader thread
+        :type job: callable
+        :param args: positional arguments of the job"""
+        self._jobs.put((job, args))
+
+    def stop(self):
+        """Stop the reader thread once the queued jobs are executed"""
+        self._jobs.put(None)
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def _run(self):
+        jobs = self._jobs
+        while True:
+            item = jobs.get()
+            if item is None:
+                break
+            job, args = item
+            try:
+                job(*args)
+            except Exception:
+                self.error("Job %s failed", job)
+                self.debug("Details:", exc_info=1)
+
+
 class BaseOperationContext(object):
     """Stores operation context"""
 
@@ -206,6 +258,7 @@ class PoolAction(Logger):
         self._elements = []
         self._pool_ctrl_dict = {}
         self._pool_ctrl_list = []
+        self._pool_ctrl_axes = {}
         self._finish_hooks = OrderedDict()
         self._started = False
         self._running = False
@@ -233,6 +286,7 @@ class PoolAction(Logger):
         self._elements = []
         self._pool_ctrl_dict = {}
         self._pool_ctrl_list = []
+        self._pool_ctrl_axes = {}
 
     def add_element(self, element):
         """Adds a new element to this action.
@@ -249,6 +303,7 @@ class PoolAction(Logger):
 
         self._elements.append(element)
         ctrl_items.append(element)
+        self._pool_ctrl_axes.pop(ctrl, None)
         # make sure elements are ordered by ID so that a multiple lock always
         # locks and unlocks in the same order
         self._elements.sort(key=PoolObject.get_id)
@@ -269,6 +324,7 @@ class PoolAction(Logger):
         except ValueError:
             raise ValueError("action doesn't contain %s" % element.name)
         del self._elements[idx]
+        self._pool_ctrl_axes.pop(ctrl, None)
         ctrl_items = self._pool_ctrl_dict[ctrl]
         del ctrl_items[ctrl_items.index(element)]
         if not len(ctrl_items):
@@ -304,6 +360,33 @@ class PoolAction(Logger):
                      seq<sardana.pool.poolelement.PoolElement>>"""
         return self._pool_ctrl_dict
 
+    def _get_ctrl_axes(self, pool_ctrl):
+        """Internal method. Returns the axes of the controller elements
+        involved in this action (resolved once per elements change)"""
+        axes = self._pool_ctrl_axes.get(pool_ctrl)
+        if axes is None:
+            axes = [elem.axis for elem in self._pool_ctrl_dict[pool_ctrl]]
+            self._pool_ctrl_axes[pool_ctrl] = axes
+        return axes
+
+    def _read_concurrent(self, read_ctrl, ret, pool_ctrls):
+        """Internal method. Execute the controller read in parallel for all
+        the controllers, either in the persistent controller readers (see
+        :data:`~sardana.sardanacustomsettings.POOL_CONTROLLER_READERS`) or in
+        the global thread pool"""
+        if getattr(sardanacustomsettings, "POOL_CONTROLLER_READERS", False):
+            pool_ctrls = list(pool_ctrls)
+            if len(pool_ctrls) == 1:
+                read_ctrl(ret, pool_ctrls[0])
+                return ret
+            for pool_ctrl in pool_ctrls:
+                pool_ctrl.get_reader().add(read_ctrl, ret, pool_ctrl)
+        else:
+            th_pool = get_thread_pool()
+            for pool_ctrl in pool_ctrls:
+                th_pool.add(read_ctrl, None, ret, pool_ctrl)
+        return ret
+
     def _is_in_action(self, state):
         """Determines if the given state is a busy state (Moving or Running) or
         not.
@@ -512,10 +595,8 @@ class PoolAction(Logger):
 
     def _raw_read_state_info_concurrent(self, ret):
         """Internal method. Read state in a concurrent mode"""
-        th_pool = get_thread_pool()
-        for pool_ctrl in self._pool_ctrl_dict:
-            th_pool.add(self._raw_read_ctrl_state_info, None, ret, pool_ctrl)
-        return ret
+        return self._read_concurrent(self._raw_read_ctrl_state_info, ret,
+                                     self._pool_ctrl_dict)
 
     def _get_ctrl_error_state_info(self, pool_ctrl):
         """Internal method. Returns the controller error in form of a
@@ -535,7 +616,7 @@ class PoolAction(Logger):
         """Internal method. Read controller information and store it in ret
         parameter"""
         try:
-            axes = [elem.axis for elem in self._pool_ctrl_dict[pool_ctrl]]
+            axes = self._get_ctrl_axes(pool_ctrl)
             state_infos, error = pool_ctrl.raw_read_axis_states(axes)
             if error:
                 pool_ctrl.warning("Read state error")
@@ -611,16 +692,14 @@ class PoolAction(Logger):
 
     def _raw_read_value_concurrent(self, ret):
         """Internal method. Read value in a concurrent mode"""
-        th_pool = get_thread_pool()
-        for pool_ctrl in self.get_read_value_ctrls():
-            th_pool.add(self._raw_read_ctrl_value, None, ret, pool_ctrl)
-        return ret
+        return self._read_concurrent(self._raw_read_ctrl_value, ret,
+                                     self.get_read_value_ctrls())
 
     def _raw_read_ctrl_value(self, ret, pool_ctrl):
         """Internal method. Read controller value information and store it in
         ret parameter"""
         try:
-            axes = [elem.axis for elem in self._pool_ctrl_dict[pool_ctrl]]
+            axes = self._get_ctrl_axes(pool_ctrl)
             value_infos = pool_ctrl.raw_read_axis_values(axes)
             ret.update(value_infos)
         finally:
@@ -683,7 +762,5 @@ class PoolAction(Logger):
 
     def _raw_read_value_concurrent_loop(self, ret):
         """Internal method. Read value in a concurrent mode"""
-        th_pool = get_thread_pool()
-        for pool_ctrl in self.get_read_value_loop_ctrls():
-            th_pool.add(self._raw_read_ctrl_value, None, ret, pool_ctrl)
-        return ret
+        return self._read_concurrent(self._raw_read_ctrl_value, ret,
+                                     self.get_read_value_loop_ctrls())
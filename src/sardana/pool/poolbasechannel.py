@@ -30,6 +30,7 @@ __all__ = ["Value", "PoolBaseChannel"]
 
 __docformat__ = 'restructuredtext'
 
+from sardana import sardanacustomsettings
 from sardana.sardanadefs import AttrQuality
 from sardana.sardanaattribute import SardanaAttribute
 from sardana.sardanabuffer import SardanaBuffer
@@ -43,6 +44,25 @@ from sardana.pool import AcqSynch, AcqMode
 
 class ValueBuffer(SardanaBuffer):
 
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("capacity", getattr(sardanacustomsettings,
+                                              "VALUE_BUFFER_CAPACITY", None))
+        super(ValueBuffer, self).__init__(*args, **kwargs)
+
+    def get_first_required_idx(self):
+        """Return the first index which is still required by any of pseudo
+        elements (values of this and the following indexes can not be
+        removed).
+
+        :return: first required index (None if no value is required)
+        :rtype: int or None
+        """
+        idxs = [element.get_value_buffer().next_idx
+                for element in self.obj.get_pseudo_elements()]
+        if len(idxs) == 0:
+            return None
+        return min(idxs)
+
     def is_value_required(self, idx):
         """Check whether any of pseudo elements still still requires
         this value.
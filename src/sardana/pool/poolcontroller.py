@@ -36,6 +36,9 @@ import weakref
 import io
 import traceback
 import functools
+import threading
+
+import numpy
 
 from taurus.core.util.containers import CaselessDict
 
@@ -47,8 +50,9 @@ from sardana.sardanautils import is_non_str_seq, is_number
 
 from sardana.pool.poolextension import translate_ctrl_value
 from sardana.pool.poolbaseelement import PoolBaseElement
-from sardana.pool.controller import Referable, Access, DataAccess,\
-    Description, Type
+from sardana.pool.poolaction import ControllerReader
+from sardana.pool.controller import Referable, Notifier, Access, DataAccess,\
+    Description, Type, VectorizedPseudoCounter, VectorizedPseudoMotor
 
 
 class PoolBaseController(PoolBaseElement):
@@ -64,9 +68,26 @@ class PoolBaseController(PoolBaseElement):
         self._element_names = CaselessDict()
         self._pending_element_names = CaselessDict()
         self._operator = None
+        self._reader = None
+        self._reader_lock = threading.Lock()
         kwargs['elem_type'] = ElementType.Controller
         super(PoolBaseController, self).__init__(**kwargs)
 
+    def get_reader(self):
+        """Returns the persistent reader executing the concurrent hardware
+        requests of this controller (created on the first call).
+
+        :return: the controller reader
+        :rtype: :class:`~sardana.pool.poolaction.ControllerReader`"""
+        with self._reader_lock:
+            reader = self._reader
+            if reader is None:
+                reader = ControllerReader("%s.Reader" % self.name)
+                # stop the reader thread together with the controller
+                weakref.finalize(self, reader.stop)
+                self._reader = reader
+        return reader
+
     def get_ctrl_types(self):
         raise NotImplementedError
 
@@ -405,6 +426,9 @@ class PoolController(PoolBaseController):
     def is_referable(self):
         return isinstance(self.ctrl, Referable)
 
+    def is_notifier(self):
+        return isinstance(self.ctrl, Notifier)
+
     def is_pseudo(self):
         for t in self._ctrl_info.types:
             if t in TYPE_PSEUDO_ELEMENTS:
@@ -1089,6 +1113,79 @@ class PoolPseudoMotorController(PoolController):
             value = SardanaValue(exc_info=sys.exc_info())
         return value
 
+    def is_vectorized(self):
+        return isinstance(self.ctrl, VectorizedPseudoMotor)
+
+    def _calc_array(self, name, positions, curr_positions):
+        positions = numpy.array(positions, dtype=float, ndmin=2)
+        ctrl = self.ctrl
+        if self.is_vectorized():
+            name += "Array"
+            ctrl_values = getattr(ctrl, name)(positions, curr_positions)
+        else:
+            calc = getattr(ctrl, name)
+            ctrl_values = [calc(pos, curr_positions)
+                           for pos in positions.tolist()]
+        if ctrl_values is None:
+            msg = '%s.%s() return error: Expected value, ' \
+                  'got None instead' % (self.name, name)
+            raise ValueError(msg)
+        ctrl_values = numpy.array(ctrl_values, dtype=float, ndmin=2)
+        if ctrl_values.ndim != 2 or len(ctrl_values) != len(positions):
+            msg = '%s.%s() return error: Expected %d rows of positions, ' \
+                  'got %s shape instead' % (self.name, name, len(positions),
+                                            ctrl_values.shape)
+            raise ValueError(msg)
+        return SardanaValue(value=ctrl_values)
+
+    @check_ctrl
+    def calc_all_pseudo_array(self, physical_pos, curr_pseudo_pos):
+        """Calculate the positions of all the pseudo motors for many points
+        at once. Uses the ``CalcAllPseudoArray`` method of
+        :class:`~sardana.pool.controller.VectorizedPseudoMotor`
+        if the controller implements it or
+        :meth:`~sardana.pool.controller.PseudoMotorController.CalcAllPseudo`
+        point by point otherwise.
+
+        :param physical_pos: (N, number of motors) physical positions
+        :type physical_pos: seq<seq<float>> or numpy.ndarray
+        :param curr_pseudo_pos: current pseudo positions or None
+        :type curr_pseudo_pos: seq<float>
+        :return: value with the (N, number of pseudo motors) array of the
+            pseudo positions or with the error
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`
+        """
+        try:
+            value = self._calc_array("CalcAllPseudo", physical_pos,
+                                     curr_pseudo_pos)
+        except:
+            value = SardanaValue(exc_info=sys.exc_info())
+        return value
+
+    @check_ctrl
+    def calc_all_physical_array(self, pseudo_pos, curr_physical_pos):
+        """Calculate the positions of all the physical motors for many points
+        at once. Uses the ``CalcAllPhysicalArray`` method of
+        :class:`~sardana.pool.controller.VectorizedPseudoMotor`
+        if the controller implements it or
+        :meth:`~sardana.pool.controller.PseudoMotorController.CalcAllPhysical`
+        point by point otherwise.
+
+        :param pseudo_pos: (N, number of pseudo motors) pseudo positions
+        :type pseudo_pos: seq<seq<float>> or numpy.ndarray
+        :param curr_physical_pos: current physical positions or None
+        :type curr_physical_pos: seq<float>
+        :return: value with the (N, number of motors) array of the physical
+            positions or with the error
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`
+        """
+        try:
+            value = self._calc_array("CalcAllPhysical", pseudo_pos,
+                                     curr_physical_pos)
+        except:
+            value = SardanaValue(exc_info=sys.exc_info())
+        return value
+
     @check_ctrl
     def calc_pseudo(self, axis, physical_pos, curr_pseudo_pos):
         ctrl = self.ctrl
@@ -1149,6 +1246,37 @@ class PoolPseudoCounterController(PoolController):
             value = SardanaValue(exc_info=sys.exc_info())
         return value
 
+    def is_vectorized(self):
+        return isinstance(self.ctrl, VectorizedPseudoCounter)
+
+    @check_ctrl
+    def calc_array(self, axis, values):
+        """Calculate the pseudo counter values of the given axis from the
+        arrays of the physical values.
+
+        :param axis: the pseudo counter axis
+        :type axis: int
+        :param values: arrays of the physical values (one for each counter
+            role)
+        :type values: seq<numpy.ndarray>
+        :return: array of the pseudo counter values
+        :rtype: numpy.ndarray
+        :raises: Exception if the controller fails to calculate
+            (the caller is expected to fallback to :meth:`calc`)
+        """
+        ctrl_values = self.ctrl.CalcArray(axis, values)
+        if ctrl_values is None:
+            msg = '%s.CalcArray() return error: Expected values, ' \
+                  'got None instead' % (self.name,)
+            raise ValueError(msg)
+        ctrl_values = numpy.asarray(ctrl_values)
+        n = len(values[0]) if len(values) else 0
+        if ctrl_values.shape[:1] != (n,):
+            msg = '%s.CalcArray() return error: Expected %d values, ' \
+                  'got %s instead' % (self.name, n, ctrl_values.shape[:1])
+            raise ValueError(msg)
+        return ctrl_values
+
     def calc_all(self, values):
         ctrl = self.ctrl
         try:
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module is part of the Python Pool library. It defines the class of
+the controller library metadata cache"""
+
+__all__ = ["ControllerLibraryCache"]
+
+__docformat__ = 'restructuredtext'
+
+from sardana.sardanalibrarycache import LibraryCache
+
+
+class ControllerLibraryCache(LibraryCache):
+    """Persistent cache of the controller libraries metadata: controller
+    class names, descriptions, source code, properties, attributes, types,
+    roles, etc.
+
+    .. note::
+        The ControllerLibraryCache class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    #: :class:`~sardana.pool.poolmetacontroller.ControllerClass` attributes
+    #: built from the controller class
+    ATTRIBUTES = ("types", "type_names", "dict_extra", "api_version",
+                  "ctrl_features", "ctrl_properties",
+                  "ctrl_properties_descriptions", "ctrl_attributes",
+                  "axis_attributes", "motor_roles", "pseudo_motor_roles",
+                  "counter_roles", "pseudo_counter_roles")
+
+    def __init__(self, filename, name="ControllerLibraryCache"):
+        LibraryCache.__init__(self, filename, name)
+
+    def getMetadata(self, controller_lib):
+        controllers = []
+        for ctrl_class in controller_lib.get_controllers():
+            attributes = {}
+            for name in self.ATTRIBUTES:
+                if hasattr(ctrl_class, name):
+                    attributes[name] = getattr(ctrl_class, name)
+            controllers.append(dict(name=ctrl_class.name,
+                                    description=ctrl_class.description,
+                                    code=ctrl_class.code,
+                                    gender=ctrl_class.gender,
+                                    model=ctrl_class.model,
+                                    organization=ctrl_class.organization,
+                                    attributes=attributes))
+        return dict(controllers=controllers)
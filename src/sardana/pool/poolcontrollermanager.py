@@ -34,8 +34,10 @@ import os
 import re
 import sys
 import copy
+import time
 import types
 import inspect
+import threading
 
 from collections import OrderedDict
 
@@ -46,7 +48,9 @@ from taurus.core.util.singleton import Singleton
 from sardana.sardanamodulemanager import ModuleManager
 from sardana.pool import controller
 from sardana.pool.poolexception import UnknownController
-from sardana.pool.poolmetacontroller import ControllerLibrary, ControllerClass
+from sardana.pool.poolmetacontroller import ControllerLibrary, \
+    ControllerClass, LazyControllerLibrary, LazyControllerClass
+from sardana.pool.poolcontrollercache import ControllerLibraryCache
 
 CONTROLLER_TEMPLATE = '''
 
@@ -102,6 +106,12 @@ class ControllerManager(Singleton, Logger):
         #: elements are absolute paths
         self._controller_path = []
 
+        #: controller libraries metadata cache (None means disabled)
+        self._controller_cache = None
+
+        #: protects the controller libraries (re)loading
+        self._controller_lib_lock = threading.RLock()
+
         l = []
         for _, klass in inspect.getmembers(controller, inspect.isclass):
             if not issubclass(klass, controller.Controller):
@@ -122,6 +132,7 @@ class ControllerManager(Singleton, Logger):
         self._controller_path = None
         self._controller_dict = None
         self._modules = None
+        self._controller_cache = None
 
         self._state = ManagerState.CLEANED
 
@@ -158,15 +169,44 @@ class ControllerManager(Singleton, Logger):
 
         self._controller_path = p
 
-        controller_file_names = self._findControllerLibNames()
-
-        for mod_name, file_name in controller_file_names.items():
-            dir_name = os.path.dirname(file_name)
-            path = [dir_name]
-            try:
-                self.reloadControllerLib(mod_name, path, reload=reload)
-            except Exception:
-                pass
+        cache = self._controller_cache
+        with self._controller_lib_lock:
+            start_time = time.time()
+            controller_file_names = self._findControllerLibNames()
+            cached = {}
+            if cache is not None:
+                for mod_name, file_name in controller_file_names.items():
+                    entry = cache.get(file_name)
+                    if entry is not None:
+                        cached[mod_name] = entry
+            scan_time = time.time() - start_time
+            import_time = restore_time = 0
+            for mod_name, file_name in controller_file_names.items():
+                lib_start_time = time.time()
+                if mod_name in cached:
+                    try:
+                        self._addLazyControllerLib(mod_name, file_name,
+                                                   cached[mod_name])
+                    except Exception:
+                        self.warning("Failed to restore controller library "
+                                     "%s from the cache", mod_name,
+                                     exc_info=1)
+                    restore_time += time.time() - lib_start_time
+                    continue
+                dir_name = os.path.dirname(file_name)
+                path = [dir_name]
+                try:
+                    self._reloadControllerLib(mod_name, path, reload=reload)
+                except Exception:
+                    pass
+                import_time += time.time() - lib_start_time
+            if cache is not None:
+                cache.save()
+            self.info("Controller libraries loaded in %.3f s: scan %.3f s, "
+                      "%d imported in %.3f s, %d restored from the cache in "
+                      "%.3f s", time.time() - start_time, scan_time,
+                      len(controller_file_names) - len(cached), import_time,
+                      len(cached), restore_time)
 
     def getControllerPath(self):
         """Returns the current sequence of absolute paths used to look for
@@ -176,6 +216,35 @@ class ControllerManager(Singleton, Logger):
         :rtype: seq<str>"""
         return self._controller_path
 
+    def setControllerCache(self, filename):
+        """Sets the controller libraries metadata cache. Controller libraries
+        which did not change since they were cached are not imported when the
+        controller path is set but when a controller of any of their classes
+        is created.
+
+        .. note::
+            The controller cache has been included in Sardana on a
+            provisional basis. Backwards incompatible changes (up to and
+            including its removal) may occur if deemed necessary by the core
+            developers.
+
+        :param filename: cache file name or None to disable the cache
+        :type filename: :obj:`str`
+        """
+        if filename is None:
+            self._controller_cache = None
+        else:
+            self._controller_cache = ControllerLibraryCache(filename)
+
+    def getControllerCache(self):
+        """Returns the controller libraries metadata cache or None if it is
+        disabled.
+
+        :rtype:
+            :class:`~sardana.pool.poolcontrollercache.ControllerLibraryCache`
+        """
+        return self._controller_cache
+
     def _findControllerLibNames(self, path=None):
         """internal method"""
         path = path or self.getControllerPath()
@@ -400,6 +469,15 @@ class ControllerManager(Singleton, Logger):
         :return: the ControllerLib object for the reloaded controller lib
         :rtype: sardana.pool.poolmetacontroller.ControllerLibrary
         """
+        with self._controller_lib_lock:
+            try:
+                return self._reloadControllerLib(module_name, path,
+                                                 reload=reload)
+            finally:
+                if self._controller_cache is not None:
+                    self._controller_cache.save()
+
+    def _reloadControllerLib(self, module_name, path=None, reload=True):
         path = path or self.getControllerPath()
         # reverse the path order:
         # more priority elements last. This way if there are repeated elements
@@ -444,8 +522,80 @@ class ControllerManager(Singleton, Logger):
             if lib_contains_controllers:
                 self._modules[module_name] = controller_lib
 
+        cache = self._controller_cache
+        if cache is not None and controller_lib.file_path is not None:
+            if controller_lib.has_errors():
+                cache.remove(controller_lib.file_path)
+            else:
+                cache.update(controller_lib)
+
+        return controller_lib
+
+    def _addLazyControllerLib(self, module_name, file_name, entry):
+        """Registers the controller library restored from the cache without
+        importing its module"""
+        pool = self.get_pool()
+        controller_lib = LazyControllerLibrary(
+            name=module_name, file_path=file_name,
+            description=entry["description"], pool=pool)
+        for info in entry["controllers"]:
+            controller_class = LazyControllerClass(pool=pool,
+                                                   lib=controller_lib,
+                                                   info=info)
+            controller_lib.add_controller(controller_class)
+            self._controller_dict[info["name"]] = controller_class
+        self._modules.pop(module_name, None)
+        if controller_lib.has_metas():
+            self._modules[module_name] = controller_lib
         return controller_lib
 
+    def importControllerClass(self, controller_class):
+        """Imports the python module of the controller class restored from
+        the cache. If the library file has changed meanwhile it is reloaded.
+
+        :raises: :exc:`sardana.pool.poolexception.UnknownController`
+                 in case the controller class no longer exists or
+                 :exc:`ImportError` if the import is not successful
+
+        :param controller_class: controller class restored from the cache
+        :type controller_class:
+            :class:`~sardana.pool.poolmetacontroller.LazyControllerClass`
+        :return: the controller class
+        :rtype: class"""
+        controller_lib = controller_class.lib
+        module_name = controller_lib.name
+        with self._controller_lib_lock:
+            m = controller_lib.module
+            if m is None:
+                cache = self._controller_cache
+                if cache is None or cache.get(controller_lib.file_path) \
+                        is None:
+                    self.info("Controller library %s changed, reloading it",
+                              module_name)
+                    new_controller_lib = self.reloadControllerLib(
+                        module_name, [controller_lib.path])
+                    m = new_controller_lib.module
+                    if m is None:
+                        exc_info = new_controller_lib.get_error()
+                        if exc_info is not None:
+                            raise exc_info[1]
+                        raise ImportError("Error importing controller "
+                                          "library %s" % module_name)
+                else:
+                    start_time = time.time()
+                    m = ModuleManager().reloadModule(
+                        module_name, [controller_lib.path], reload=False,
+                        validate=False)
+                    controller_lib.module = m
+                    self.info("Controller library %s imported in %.3f s",
+                              module_name, time.time() - start_time)
+            klass = getattr(m, controller_class.name, None)
+            if not (inspect.isclass(klass)
+                    and issubclass(klass, controller.Controller)):
+                raise UnknownController("Unknown controller %s" %
+                                        controller_class.name)
+            return klass
+
     def addController(self, controller_lib, klass):
         """Adds a new controller class"""
         controller_name = klass.__name__
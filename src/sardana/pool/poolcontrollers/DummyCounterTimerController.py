@@ -23,10 +23,12 @@
 
 import time
 import copy
+import threading
 
 from sardana import State
 from sardana.pool import AcqSynch
-from sardana.pool.controller import CounterTimerController, Type, Description
+from sardana.pool.controller import CounterTimerController, Notifier, \
+    Type, Description, DefaultValue
 
 
 class Channel(object):
@@ -39,7 +41,7 @@ class Channel(object):
         self.buffer_values = []
 
 
-class DummyCounterTimerController(CounterTimerController):
+class DummyCounterTimerController(CounterTimerController, Notifier):
     """This class is the Tango Sardana CounterTimer controller for tests"""
 
     gender = "Simulation"
@@ -51,6 +53,18 @@ class DummyCounterTimerController(CounterTimerController):
     default_timer = 1
     default_latency_time = 0.0
 
+    ctrl_properties = {
+        "Notifications": {
+                Type: bool,
+                Description: ("Emulate notifications of the end of "
+                              "acquisition and of the new data"),
+                DefaultValue: False
+            },
+    }
+
+    # used when instantiated without properties e.g. in controller tests
+    Notifications = False
+
     ctrl_attributes = {
         "Synchronizer": {
                 Type: str,
@@ -79,6 +93,8 @@ class DummyCounterTimerController(CounterTimerController):
         self.__synchronizer_obj = None
         # flag whether the controller was armed for hardware synchronization
         self._armed = False
+        # emulated end of acquisition interrupt
+        self._notification_timer = None
 
     def AddDevice(self, axis):
         idx = axis - 1
@@ -130,6 +146,7 @@ class DummyCounterTimerController(CounterTimerController):
             self._armed = True
         else:
             self.start_time = time.time()
+            self._start_notification_timer()
 
     def StateOne(self, axis):
         self._log.debug('StateOne(%d): entering...' % axis)
@@ -248,6 +265,35 @@ class DummyCounterTimerController(CounterTimerController):
             channel.buffer_values.extend([value] * nb_new_acq)
             channel.acq_idx = channel.acq_idx + nb_new_acq
 
+    def IsNotifying(self):
+        return self.Notifications
+
+    def _start_notification_timer(self):
+        """Emulate the end of acquisition interrupt"""
+        self._stop_notification_timer()
+        if not self.Notifications or self.integ_time is None:
+            return
+        if self._synchronization == AcqSynch.SoftwareTrigger:
+            duration = self.integ_time
+        else:
+            duration = self.estimated_duration
+        end_time = self.start_time + duration
+
+        def notify():
+            # timer may fire a bit earlier than the emulated end
+            time.sleep(max(0, end_time - time.time()))
+            self.NotifyStateChange()
+
+        self._notification_timer = timer = threading.Timer(duration, notify)
+        timer.daemon = True
+        timer.start()
+
+    def _stop_notification_timer(self):
+        timer = self._notification_timer
+        if timer is not None:
+            timer.cancel()
+            self._notification_timer = None
+
     def _finish(self, elapsed_time, axis=None):
         if axis is None:
             for axis, channel in list(self.counting_channels.items()):
@@ -268,6 +314,7 @@ class DummyCounterTimerController(CounterTimerController):
     def AbortOne(self, axis):
         if axis not in self.counting_channels:
             return
+        self._stop_notification_timer()
         now = time.time()
         if self.start_time is not None:
             elapsed_time = now - self.start_time
@@ -343,8 +390,12 @@ class DummyCounterTimerController(CounterTimerController):
         e.g. start, active passive
         """
         # for the moment only react on first trigger
-        if type_.name.lower() == "start":
+        name = type_.name.lower()
+        if name == "start":
             self._armed = False
             for axis, channel in self.counting_channels.items():
                 channel.is_counting = True
             self.start_time = time.time()
+            self._start_notification_timer()
+        elif name == "passive" and self.Notifications:
+            self.NotifyDataReady()
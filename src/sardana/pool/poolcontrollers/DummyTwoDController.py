@@ -25,6 +25,7 @@ import re
 import sys
 import time
 import copy
+import threading
 
 import numpy
 try:
@@ -34,7 +35,7 @@ except ImportError:
 
 from sardana import State
 from sardana.pool import AcqSynch
-from sardana.pool.controller import TwoDController, Referable, \
+from sardana.pool.controller import TwoDController, Referable, Notifier, \
     Type, Description, MaxDimSize, FGet, FSet, DefaultValue
 
 
@@ -135,7 +136,7 @@ class TangoValue(BaseValue):
         return self.attr_proxy.read().value
 
 
-class BasicDummyTwoDController(TwoDController):
+class BasicDummyTwoDController(TwoDController, Notifier):
     """This class represents a basic, dummy Sardana TwoD controller."""
 
     gender = "Simulation"
@@ -148,6 +149,18 @@ class BasicDummyTwoDController(TwoDController):
 
     default_latency_time = 0.0
 
+    ctrl_properties = {
+        "Notifications": {
+                Type: bool,
+                Description: ("Emulate notifications of the end of "
+                              "acquisition and of the new data"),
+                DefaultValue: False
+            },
+    }
+
+    # used when instantiated without properties e.g. in controller tests
+    Notifications = False
+
     ctrl_attributes = {
         "Synchronizer": {
                 Type: str,
@@ -186,6 +199,8 @@ class BasicDummyTwoDController(TwoDController):
         self.__synchronizer_obj = None
         # flag whether the controller was armed for hardware synchronization
         self._armed = False
+        # emulated end of acquisition interrupt
+        self._notification_timer = None
 
     def GetAxisAttributes(self, axis):
         # the default max shape for 'value' is (16*1024,).
@@ -241,6 +256,7 @@ class BasicDummyTwoDController(TwoDController):
             self._armed = True
         else:
             self.start_time = time.time()
+            self._start_notification_timer()
 
     def _updateChannelState(self, axis, elapsed_time):
         if self._synchronization == AcqSynch.SoftwareTrigger:
@@ -327,6 +343,35 @@ class BasicDummyTwoDController(TwoDController):
         self._log.debug('ReadOne(%d): returning %s' % (axis, repr(ret)))
         return ret
 
+    def IsNotifying(self):
+        return self.Notifications
+
+    def _start_notification_timer(self):
+        """Emulate the end of acquisition interrupt"""
+        self._stop_notification_timer()
+        if not self.Notifications or self.integ_time is None:
+            return
+        if self._synchronization == AcqSynch.SoftwareTrigger:
+            duration = self.integ_time
+        else:
+            duration = self.estimated_duration
+        end_time = self.start_time + duration
+
+        def notify():
+            # timer may fire a bit earlier than the emulated end
+            time.sleep(max(0, end_time - time.time()))
+            self.NotifyStateChange()
+
+        self._notification_timer = timer = threading.Timer(duration, notify)
+        timer.daemon = True
+        timer.start()
+
+    def _stop_notification_timer(self):
+        timer = self._notification_timer
+        if timer is not None:
+            timer.cancel()
+            self._notification_timer = None
+
     def _finish(self, elapsed_time, axis=None):
         if axis is None:
             for axis, channel in list(self.counting_channels.items()):
@@ -347,6 +392,7 @@ class BasicDummyTwoDController(TwoDController):
     def AbortOne(self, axis):
         if axis not in self.counting_channels:
             return
+        self._stop_notification_timer()
         now = time.time()
         if self.start_time is not None:
             elapsed_time = now - self.start_time
@@ -436,11 +482,15 @@ class BasicDummyTwoDController(TwoDController):
         e.g. start, active passive
         """
         # for the moment only react on first trigger
-        if type_.name.lower() == "active" and value == 0:
+        name = type_.name.lower()
+        if name == "active" and value == 0:
             self._armed = False
             for axis, channel in self.counting_channels.items():
                 channel.is_counting = True
             self.start_time = time.time()
+            self._start_notification_timer()
+        elif name == "passive" and self.Notifications:
+            self.NotifyDataReady()
 
 
 class DummyTwoDController(BasicDummyTwoDController, Referable):
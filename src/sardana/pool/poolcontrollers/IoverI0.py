@@ -28,10 +28,13 @@ __all__ = ["IoverI0"]
 
 __docformat__ = 'restructuredtext'
 
-from sardana.pool.controller import PseudoCounterController
+import numpy
 
+from sardana.pool.controller import PseudoCounterController, \
+    VectorizedPseudoCounter
 
-class IoverI0(PseudoCounterController):
+
+class IoverI0(PseudoCounterController, VectorizedPseudoCounter):
     """ A simple pseudo counter which receives two counter values (I and I0)
         and returns I/I0"""
 
@@ -48,3 +51,9 @@ class IoverI0(PseudoCounterController):
         except ZeroDivisionError:
             pass
         return i
+
+    def CalcArray(self, axis, counter_values):
+        i, i0 = counter_values
+        result = numpy.array(i, dtype=float)
+        numpy.divide(i, i0, out=result, where=i0 != 0)
+        return result
@@ -28,12 +28,15 @@ __all__ = ["Slit"]
 
 __docformat__ = 'restructuredtext'
 
+import numpy
+
 from sardana import DataAccess
-from sardana.pool.controller import PseudoMotorController
+from sardana.pool.controller import PseudoMotorController, \
+    VectorizedPseudoMotor
 from sardana.pool.controller import DefaultValue, Description, Access, Type
 
 
-class Slit(PseudoMotorController):
+class Slit(PseudoMotorController, VectorizedPseudoMotor):
     """A Slit pseudo motor controller for handling gap and offset pseudo
        motors. The system uses to real motors sl2t (top slit) and sl2b (bottom
        slit)"""
@@ -83,6 +86,20 @@ class Slit(PseudoMotorController):
         return (self.sign * gap,
                 self.sign * (physical_pos[0] - gap / 2))
 
+    def CalcAllPseudoArray(self, physical_pos, curr_pseudo_pos):
+        """Calculates the positions of all pseudo motors for many points
+           from the arrays of positions of the physical motors."""
+        gap = physical_pos[:, 1] + physical_pos[:, 0]
+        return self.sign * numpy.column_stack((gap,
+                                               physical_pos[:, 0] - gap / 2))
+
+    def CalcAllPhysicalArray(self, pseudo_pos, curr_physical_pos):
+        """Calculates the positions of all motors for many points from the
+           arrays of positions of the pseudo motors."""
+        half_gap = pseudo_pos[:, 0] / 2
+        return self.sign * numpy.column_stack((pseudo_pos[:, 1] + half_gap,
+                                               half_gap - pseudo_pos[:, 1]))
+
     # def CalcAllPhysical(self, pseudo_pos, curr_physical_pos):
     #    """Calculates the positions of all motors that belong to the pseudo
     #       motor system from the positions of the pseudo motors."""
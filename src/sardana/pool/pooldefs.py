@@ -26,7 +26,7 @@
 """This file contains the basic pool definitions."""
 
 __all__ = ["ControllerAPI", "AcqTriggerType", "AcqMode", "SynchDomain",
-           "SynchParam", "AcqSynch", "AcqSynchType"]
+           "SynchParam", "AcqSynch", "AcqSynchType", "AcqNotification"]
 
 __docformat__ = 'restructuredtext'
 
@@ -191,3 +191,20 @@ class AcqSynch(IntEnum):
         else:
             raise ValueError("Unable to determine AcqSynch from %s" %
                              synch_type)
+
+
+class AcqNotification(IntEnum):
+    """Enumeration of notifications which an acquisition controller may send
+    to the acquisition action.
+
+    - StateChange - state of (at least) one axis has changed
+    - DataReady - new data are ready to be read from (at least) one axis
+
+    .. note::
+        The AcqNotification class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including removal of the class) may occur if
+        deemed necessary by the core developers.
+    """
+    StateChange = 0
+    DataReady = 1
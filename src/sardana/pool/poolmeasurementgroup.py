@@ -441,6 +441,7 @@ class MeasurementConfiguration(object):
         self._zerod_ctrls = []
         self._synch_ctrls = {}
         self._other_ctrls = []
+        self._channels = []
         self._master_timer_sw = None
         self._master_monitor_sw = None
         self._master_timer_sw_start = None
@@ -455,6 +456,23 @@ class MeasurementConfiguration(object):
         # config parameters created with Sardana < 3.
         self._value_ref_compat = False
 
+    def get_channels(self, enabled=None):
+        """Return channels configuration items.
+
+        :param enabled: which channels to return
+         - True - only enabled
+         - False - only disabled
+         - None - all
+
+        :type enabled: bool or None
+        :return: channels configuration items
+        :rtype: list<:class:`ChannelConfiguration`>
+        """
+        if enabled is None:
+            return list(self._channels)
+        return [channel for channel in self._channels
+                if channel.enabled == enabled]
+
     def get_acq_synch_by_channel(self, channel):
         """Return acquisition synchronization configured for this element.
 
@@ -627,6 +645,7 @@ class MeasurementConfiguration(object):
         zerod_ctrls = []
         synch_ctrls = []
         other_ctrls = []
+        channels = []
         master_timer_sw = None
         master_monitor_sw = None
         master_timer_sw_start = None
@@ -753,6 +772,7 @@ class MeasurementConfiguration(object):
                 ch_item = ChannelConfiguration(channel, ch_data)
                 ch_item.controller = ctrl_item
                 ctrl_item.add_channel(ch_item)
+                channels.append(ch_item)
                 if ch_item.enabled:
                     if external:
                         id_ = channel.full_name
@@ -873,6 +893,7 @@ class MeasurementConfiguration(object):
         self._zerod_ctrls = zerod_ctrls
         self._synch_ctrls = synch_ctrls
         self._other_ctrls = other_ctrls
+        self._channels = channels
         self._master_timer_sw = master_timer_sw
         self._master_monitor_sw = master_monitor_sw
         self._master_timer_sw_start = master_timer_sw_start
@@ -1317,6 +1338,86 @@ class PoolMeasurementGroup(PoolGroupElement):
         if not self._simulation_mode:
             self.acquisition.run()
 
+    def count(self, integration_time=None):
+        """Count and return the values of the enabled channels.
+
+        Configure the measurement group for a single acquisition of the given
+        integration time, prepare it, start it and wait until it finishes.
+        If no integration time is passed, just start the already prepared
+        acquisition (e.g. one of the prepared number of starts) and wait until
+        it finishes.
+
+        .. warning::
+            The count blocks the caller until the acquisition ends. When
+            executed by the ``Count`` command of the MeasurementGroup Tango
+            device, the device is blocked as well, so the ``Stop`` or
+            ``Abort`` commands sent during the count are executed only after
+            the acquisition finishes.
+
+        .. note::
+            The count method has been included in Sardana on
+            a provisional basis. Backwards incompatible changes (up to and
+            including removal of the method) may occur if deemed necessary by
+            the core developers.
+
+        :param integration_time: integration time (seconds)
+        :type integration_time: :obj:`float`
+        :return: channels values (or value references), where keys are the
+          channels full names
+        :rtype: :obj:`dict`
+        """
+        if integration_time is not None:
+            self.set_integration_time(integration_time)
+            self.set_moveable(None)
+            self.set_nb_starts(1)
+            self.prepare()
+        self.start_acquisition()
+        if not self._simulation_mode:
+            self.acquisition.wait_finish()
+        if self.get_state(propagate=0) == State.Fault:
+            msg = "Measurement group ended acquisition with Fault state"
+            raise RuntimeError(msg)
+        return self.get_channel_values()
+
+    def get_channel_values(self):
+        """Return the values (or value references if enabled) of the enabled
+        channels. Values of the channels in error are None.
+
+        .. note::
+            The get_channel_values method has been included in Sardana on
+            a provisional basis. Backwards incompatible changes (up to and
+            including removal of the method) may occur if deemed necessary by
+            the core developers.
+
+        :return: channels values (or value references), where keys are the
+          channels full names
+        :rtype: :obj:`dict`
+        """
+        values = {}
+        for channel in self._config.get_channels(enabled=True):
+            values[channel.full_name] = self._get_channel_value(channel)
+        return values
+
+    def _get_channel_value(self, channel):
+        try:
+            if channel.get_type() == ElementType.External:
+                device = channel.get_device()
+                return device.read_attribute(channel.attribute_name).value
+            element = channel.element
+            if getattr(channel, "value_ref_enabled", False):
+                value = element.get_value_ref()
+            elif channel.get_type() == ElementType.ZeroDExpChannel:
+                # 0D value is updated only by the acquisition
+                value = element.get_accumulated_value()
+            else:
+                value = element.get_value()
+        except Exception:
+            self.debug("Error reading %s", channel.full_name, exc_info=1)
+            return None
+        if value.error:
+            return None
+        return value.value
+
     def _get_value(self):
         if self._acquisition_mode is AcqMode.Timer:
             value = self.get_integration_time()
@@ -28,18 +28,21 @@ for"""
 
 __all__ = ["CONTROLLER_TEMPLATE", "CTRL_TYPE_MAP", "TYPE_MAP", "TYPE_MAP_OBJ",
            "TypeData", "DTYPE_MAP", "DACCESS_MAP", "DataInfo",
-           "ControllerLibrary", "ControllerClass"]
+           "ControllerLibrary", "ControllerClass", "LazyControllerLibrary",
+           "LazyControllerClass"]
 
 __docformat__ = 'restructuredtext'
 
 import types
 import inspect
+import weakref
 
 from taurus.core.util.containers import CaselessDict
 
 from sardana import DataType, DataFormat, DataAccess, \
     to_dtype_dformat, to_daccess, \
     ElementType, TYPE_ELEMENTS, InvalidId
+from sardana.sardanabase import SardanaBaseObject
 from sardana.sardanameta import SardanaLibrary, SardanaClass
 from sardana.pool.poolmotor import PoolMotor
 from sardana.pool.poolpseudomotor import PoolPseudoMotor
@@ -358,3 +361,83 @@ class ControllerClass(SardanaClass):
     @property
     def organization(self):
         return self.klass.organization
+
+
+class LazyControllerLibrary(ControllerLibrary):
+    """Object representing a controller library restored from the
+    :class:`~sardana.pool.poolcontrollercache.ControllerLibraryCache` which
+    python module has not been imported yet. The module is imported when a
+    controller of any of its classes is created.
+
+    .. note::
+        The LazyControllerLibrary class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    def __init__(self, **kwargs):
+        description = kwargs.pop('description')
+        ControllerLibrary.__init__(self, **kwargs)
+        self.description = description
+
+    @property
+    def code(self):
+        """Returns a sequence of sourcelines corresponding to the module code
+        (read from the module file).
+
+           :return: list of source code lines
+           :rtype: list<str>"""
+        with open(self.file_path) as f:
+            return f.readlines()
+
+
+class LazyControllerClass(ControllerClass):
+    """Object representing a controller class restored from the
+    :class:`~sardana.pool.poolcontrollercache.ControllerLibraryCache`. Its
+    metadata (properties, attributes, types, roles, etc.) is served from the
+    cache and the controller library is imported on the first access to the
+    class object (e.g. when a controller is created).
+
+    .. note::
+        The LazyControllerClass class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    def __init__(self, **kwargs):
+        lib = kwargs.pop('lib')
+        info = kwargs.pop('info')
+        self._lib = weakref.ref(lib)
+        self._code_obj = None
+        self._info = info
+        self.description = info['description']
+        self._code = info['code']
+        self.__dict__.update(info['attributes'])
+        name = info['name']
+        kwargs['manager'] = kwargs.pop('pool')
+        kwargs['elem_type'] = ElementType.ControllerClass
+        kwargs['name'] = name
+        kwargs['full_name'] = "{0}.{1}".format(lib.name, name)
+        kwargs['parent'] = lib
+        SardanaBaseObject.__init__(self, **kwargs)
+
+    @property
+    def code_object(self):
+        if self._code_obj is None:
+            ctrl_manager = self.get_manager().ctrl_manager
+            self._code_obj = ctrl_manager.importControllerClass(self)
+        return self._code_obj
+
+    @property
+    def gender(self):
+        return self._info['gender']
+
+    @property
+    def model(self):
+        return self._info['model']
+
+    @property
+    def organization(self):
+        return self._info['organization']
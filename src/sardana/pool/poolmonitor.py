@@ -33,19 +33,39 @@ import time
 import threading
 
 from taurus.core.util.log import Logger
+from taurus.core.util.threadpool import ThreadPool
 
 from sardana import ElementType, TYPE_PSEUDO_ELEMENTS
+from sardana.sardanathreadpool import OmniWorker
 
 from sardana.pool.poolobject import PoolObject
 
 
 class PoolMonitor(Logger, threading.Thread):
+    """Thread which periodically updates the state of the pool elements
+    which are not involved in any operation.
+
+    By default the controllers are read one after another. In the concurrent
+    mode the state of each controller is read in a pool of at most
+    :attr:`MAX_THREADS` threads owned by the monitor and the controllers
+    which do not finish within *ctrl_timeout* (by default the monitor
+    period) are skipped (until their read finishes) and flagged as slow in
+    the controller statistics (see :meth:`get_ctrl_stats`). A slow
+    controller occupies at most one of these threads and never the sardana
+    thread pool used by the operations.
+
+    .. note::
+        The concurrent mode and the controller statistics have been included
+        in Sardana on a provisional basis. Backwards incompatible changes (up
+        to and including their removal) may occur if deemed necessary by the
+        core developers.
+    """
 
     MIN_THREADS = 1
     MAX_THREADS = 10
 
     def __init__(self, pool, name='PoolMonitor', period=5.0, min_sleep=1.0,
-                 auto_start=True):
+                 auto_start=True, concurrent=False, ctrl_timeout=None):
         Logger.__init__(self, name)
         threading.Thread.__init__(self, name=name)
         self.daemon = True
@@ -57,6 +77,14 @@ class PoolMonitor(Logger, threading.Thread):
         self._thread_pool = None
         self._ctrl_ids = []
         self._elem_ids = []
+        self._concurrent = concurrent
+        self._ctrl_timeout = ctrl_timeout
+        # dict<PoolController, threading.Event> of controllers being read
+        # in the concurrent mode
+        self._pending_ctrls = {}
+        # dict<str, dict> of statistics per controller name
+        self._ctrl_stats = {}
+        self._stats_lock = threading.Lock()
         pool.add_listener(self.on_pool_changed)
         if not auto_start:
             self.pause()
@@ -81,8 +109,75 @@ class PoolMonitor(Logger, threading.Thread):
             self._elem_ids = elem_ids
             self._ctrl_ids = ctrl_ids
 
+    def get_concurrent(self):
+        return self._concurrent
+
+    def set_concurrent(self, concurrent):
+        self._concurrent = concurrent
+
+    concurrent = property(get_concurrent, set_concurrent,
+                          doc="whether the controllers are read concurrently")
+
+    def get_ctrl_timeout(self):
+        return self._ctrl_timeout
+
+    def set_ctrl_timeout(self, ctrl_timeout):
+        self._ctrl_timeout = ctrl_timeout
+
+    ctrl_timeout = property(get_ctrl_timeout, set_ctrl_timeout,
+                            doc="time (s) to wait for a controller in the "
+                                "concurrent mode (None means the period)")
+
+    def get_ctrl_stats(self):
+        """Returns the state read statistics of the controllers.
+
+        :return: dictionary with controller names as keys and dictionaries
+            with the following keys as values: *count* (number of reads),
+            *last*, *mean* and *max* (read latency in s), *timeouts* (number
+            of cycles in which the controller was skipped or did not finish
+            in time) and *slow* (whether the controller did not finish in
+            time in the last cycle)
+        :rtype: dict<str, dict>
+        """
+        with self._stats_lock:
+            ctrl_stats = {}
+            for name, stats in self._ctrl_stats.items():
+                stats = dict(stats)
+                count = stats.pop("count")
+                total = stats.pop("total")
+                stats["count"] = count
+                stats["mean"] = total / count if count else None
+                ctrl_stats[name] = stats
+            return ctrl_stats
+
+    def _get_ctrl_stats(self, pool_ctrl):
+        stats = self._ctrl_stats.get(pool_ctrl.name)
+        if stats is None:
+            stats = dict(count=0, total=0.0, last=None, max=0.0, timeouts=0,
+                         slow=False)
+            self._ctrl_stats[pool_ctrl.name] = stats
+        return stats
+
+    def _add_ctrl_latency(self, pool_ctrl, latency):
+        with self._stats_lock:
+            stats = self._get_ctrl_stats(pool_ctrl)
+            stats["count"] += 1
+            stats["total"] += latency
+            stats["last"] = latency
+            stats["max"] = max(stats["max"], latency)
+
+    def _set_ctrl_slow(self, pool_ctrl, slow):
+        with self._stats_lock:
+            stats = self._get_ctrl_stats(pool_ctrl)
+            stats["slow"] = slow
+            if slow:
+                stats["timeouts"] += 1
+
     def update_state_info(self):
         """Update state information of every element."""
+        if self._concurrent:
+            self._update_state_info_concurrent()
+            return
 
         pool = self._pool
         elems, ctrls, ctrl_items = [], [], {}
@@ -126,11 +221,103 @@ class PoolMonitor(Logger, threading.Thread):
         for pool_ctrl, elems in list(pool_ctrls.items()):
             self._update_ctrl_state_info(pool_ctrl, elems)
 
+    def _update_state_info_concurrent(self):
+        pool = self._pool
+        ctrl_items, blocked_ctrls = {}, set()
+        for elem_id in self._elem_ids:
+            elem = pool.get_element_by_id(elem_id)
+            ctrl = elem.controller
+            if elem.is_in_operation():
+                blocked_ctrls.add(ctrl)
+                continue
+            ctrl_elems = ctrl_items.get(ctrl)
+            if ctrl_elems is None:
+                ctrl_items[ctrl] = ctrl_elems = []
+            ctrl_elems.append(elem)
+
+        timeout = self._ctrl_timeout
+        if timeout is None:
+            timeout = self._period
+        deadline = time.time() + timeout
+        th_pool = self._get_thread_pool()
+        started = {}
+        for ctrl, ctrl_elems in list(ctrl_items.items()):
+            if ctrl in blocked_ctrls:
+                continue
+            with self._stats_lock:
+                # still reading since one of the previous cycles
+                if ctrl in self._pending_ctrls:
+                    skip = True
+                else:
+                    skip = False
+                    done = threading.Event()
+                    self._pending_ctrls[ctrl] = done
+            if skip:
+                self.debug("Skipping %s (previous state read pending)",
+                           ctrl.name)
+                self._set_ctrl_slow(ctrl, True)
+                continue
+            started[ctrl] = done
+            th_pool.add(self._update_ctrl_state_info_job, None, ctrl,
+                        ctrl_elems, done)
+
+        for ctrl, done in started.items():
+            if done.wait(max(deadline - time.time(), 0)):
+                self._set_ctrl_slow(ctrl, False)
+            else:
+                self.warning("%s state read did not finish in %fs",
+                             ctrl.name, timeout)
+                self._set_ctrl_slow(ctrl, True)
+
+    def _get_thread_pool(self):
+        """Returns the pool of threads reading the controllers in the
+        concurrent mode (created on the first use)"""
+        if self._thread_pool is None:
+            # protect older versions of Taurus (without the worker_cls
+            # argument) remove it whenever we bump Taurus dependency
+            try:
+                self._thread_pool = ThreadPool(name=self.name + "TP",
+                                               Psize=self.MAX_THREADS,
+                                               Qsize=0,
+                                               worker_cls=OmniWorker)
+            except TypeError:
+                self._thread_pool = ThreadPool(name=self.name + "TP",
+                                               Psize=self.MAX_THREADS,
+                                               Qsize=0)
+        return self._thread_pool
+
+    def _update_ctrl_state_info_job(self, pool_ctrl, elems, done):
+        """Locks the controller and its elements (without blocking) and
+        updates their state info. Executed in the monitor thread pool."""
+        locked_elems = []
+        try:
+            for elem in elems:
+                if not elem.lock(blocking=False):
+                    return
+                locked_elems.append(elem)
+            if not pool_ctrl.lock(blocking=False):
+                return
+            try:
+                self._update_ctrl_state_info(pool_ctrl, elems)
+            finally:
+                pool_ctrl.unlock()
+        except Exception:
+            self.warning("Failed to update %s state", pool_ctrl.name)
+            self.debug("Details:", exc_info=1)
+        finally:
+            for elem in reversed(locked_elems):
+                elem.unlock()
+            with self._stats_lock:
+                self._pending_ctrls.pop(pool_ctrl, None)
+            done.set()
+
     def _update_ctrl_state_info(self, pool_ctrl, elems):
         axes = [elem.axis for elem in elems]
-        state_infos, exc_info = pool_ctrl.raw_read_axis_states(axes)
-        if len(exc_info):
-            self.info("STATE ERROR %s", exc_info)
+        start = time.time()
+        state_infos, error = pool_ctrl.raw_read_axis_states(axes)
+        self._add_ctrl_latency(pool_ctrl, time.time() - start)
+        if error:
+            self.info("STATE ERROR in %s", pool_ctrl.name)
         for elem, state_info in list(state_infos.items()):
             state_info = elem._from_ctrl_state_info(state_info)
             elem.set_state_info(state_info)
@@ -26,7 +26,8 @@
 """This module is part of the Python Pool libray. It defines the class for a
 motion"""
 
-__all__ = ["MotionState", "MotionMap", "PoolMotion", "PoolMotionItem"]
+__all__ = ["MotionState", "MotionMap", "MotionLoopPolicy",
+           "MotionSleepScheduler", "PoolMotion", "PoolMotionItem"]
 
 __docformat__ = 'restructuredtext'
 
@@ -38,6 +39,7 @@ from taurus.core.util.enumeration import Enumeration
 
 from sardana import State
 from sardana.pool.poolaction import ActionContext, PoolActionItem, PoolAction
+from sardana.util.motion import Motor, MotionPath
 
 #: enumeration representing possible motion states
 MotionState = Enumeration("MotionSate", (
@@ -70,6 +72,94 @@ MotionMap = {
     MS.Invalid: State.Invalid,
 }
 
+#: enumeration representing possible motion loop sleep time policies
+MotionLoopPolicy = Enumeration("MotionLoopPolicy", (
+    "Fixed",
+    "Adaptive"))
+
+
+class MotionSleepScheduler(object):
+    """Calculates how long the motion loop sleeps between the state reads
+    and when it reads the position.
+
+    With the *Fixed* policy the loop always sleeps the motion loop sleep time
+    and reads the position every *n* state reads.
+
+    With the *Adaptive* policy the loop sleeps a fraction of the remaining
+    time to the expected end of the motion, so it polls quickly for short
+    motions and close to the arrival, and backs off during long motions
+    (up to the period between two position reads). Once the expected end is
+    overdue the sleep time grows again from the minimum up to the motion loop
+    sleep time. The position is read with the same period as with the
+    *Fixed* policy."""
+
+    #: minimum sleep time (s) of the adaptive policy
+    MinSleepTime = 0.001
+
+    #: fraction of the remaining motion time the adaptive policy sleeps
+    RemainingTimeFraction = 0.5
+
+    def __init__(self, sleep_time, nb_states_per_position,
+                 policy=MotionLoopPolicy.Fixed, duration=None,
+                 start_time=None):
+        self.sleep_time = sleep_time
+        self.nb_states_per_position = nb_states_per_position
+        # time between position reads
+        self.position_period = sleep_time * nb_states_per_position
+        if duration is None:
+            policy = MotionLoopPolicy.Fixed
+        self.policy = policy
+        if start_time is None:
+            start_time = time.time()
+        self.start_time = start_time
+        self.end_time = None
+        if duration is not None:
+            self.end_time = start_time + duration
+        self._overdue_sleep_time = self.MinSleepTime
+        self._last_position_time = None
+
+    def is_adaptive(self):
+        return self.policy == MotionLoopPolicy.Adaptive
+
+    def get_sleep_time(self, timestamp=None):
+        """Returns the time the loop should sleep now.
+
+        :param timestamp: current time [default: None meaning now]
+        :type timestamp: float
+        :return: sleep time (s)
+        :rtype: float"""
+        if not self.is_adaptive():
+            return self.sleep_time
+        if timestamp is None:
+            timestamp = time.time()
+        remaining = self.end_time - timestamp
+        if remaining <= 0:
+            nap = self._overdue_sleep_time
+            self._overdue_sleep_time = min(2 * nap, self.sleep_time)
+            return nap
+        nap = remaining * self.RemainingTimeFraction
+        return min(max(nap, self.MinSleepTime), self.position_period)
+
+    def is_position_read_due(self, i, timestamp=None):
+        """Determines if the position should be read in the i-th iteration of
+        the motion loop.
+
+        :param i: iteration number
+        :type i: int
+        :param timestamp: current time [default: None meaning now]
+        :type timestamp: float
+        :return: True if position should be read or False otherwise
+        :rtype: bool"""
+        if not self.is_adaptive():
+            return not i % self.nb_states_per_position
+        if timestamp is None:
+            timestamp = time.time()
+        last = self._last_position_time
+        if last is None or timestamp - last >= self.position_period:
+            self._last_position_time = timestamp
+            return True
+        return False
+
 
 class PoolMotionItem(PoolActionItem):
     """An item involved in the motion. Maps directly to a motor object"""
@@ -175,6 +265,7 @@ class PoolMotion(PoolAction):
         self._motion_info = None
         self._motion_sleep_time = None
         self._nb_states_per_position = None
+        self._sleep_scheduler = None
 
     def _recover_start_error(self, ctrl, meth_name, read_state=False):
         self.error("%s throws exception on %s. Stopping...", ctrl, meth_name)
@@ -271,12 +362,59 @@ class PoolMotion(PoolAction):
         pool_ctrls = self.get_pool_controller_list()
         moveables = self.get_elements()
 
+        policy = self._get_motion_loop_policy(moveables)
+        duration = None
+        if policy == MotionLoopPolicy.Adaptive:
+            duration = self._estimate_motion_duration(items)
+
         with ActionContext(self):
             self.pre_start_all(pool_ctrls)
             self.pre_start_one(moveables, items)
             self.start_one(moveables, motion_info)
             self.start_all(pool_ctrls, moveables, motion_info)
 
+        self._sleep_scheduler = MotionSleepScheduler(
+            self._motion_sleep_time, self._nb_states_per_position,
+            policy=policy, duration=duration)
+
+    def _get_motion_loop_policy(self, moveables):
+        """Returns the adaptive policy only if all the moveables use it"""
+        for moveable in moveables:
+            if moveable.motion_loop_policy != MotionLoopPolicy.Adaptive:
+                return MotionLoopPolicy.Fixed
+        return MotionLoopPolicy.Adaptive
+
+    def _estimate_motion_duration(self, items):
+        """Estimates how long the motion will take based on the current dial
+        positions and the motion parameters of the moveables.
+
+        :param items: dict<moveable, (pos, dial, do_backlash, backlash)>
+        :type items: dict
+        :return: estimated duration (s) or None if it could not be estimated
+        :rtype: float"""
+        duration = 0
+        for moveable, motion_data in list(items.items()):
+            _, dial, do_backlash, backlash = motion_data
+            try:
+                motor = Motor(min_vel=moveable.get_base_rate(),
+                              max_vel=moveable.get_velocity(),
+                              accel_time=moveable.get_acceleration(),
+                              decel_time=moveable.get_deceleration())
+                old_dial = moveable.get_dial_position(propagate=0).value
+                moveable_duration = MotionPath(motor, old_dial, dial).duration
+                if do_backlash:
+                    moveable_duration += MotionPath(motor, dial,
+                                                    backlash).duration
+            except Exception:
+                self.debug("Can not estimate motion duration of %s",
+                           moveable.name, exc_info=1)
+                return None
+            instability_time = moveable.instability_time
+            if instability_time is not None:
+                moveable_duration += instability_time
+            duration = max(duration, moveable_duration)
+        return duration
+
     def backlash_item(self, motion_item):
         moveable = motion_item.moveable
         controller = moveable.controller
@@ -296,8 +434,7 @@ class PoolMotion(PoolAction):
             states[k] = None
             positions[k] = None
 
-        nap = self._motion_sleep_time
-        nb_states_per_pos = self._nb_states_per_position
+        scheduler = self._sleep_scheduler
         motion_info = self._motion_info
         emergency_stop = set()
 
@@ -437,8 +574,8 @@ class PoolMotion(PoolAction):
                                                     propagate=2)
                 break
 
-            # read position every n times
-            if not i % nb_states_per_pos:
+            # read position every n times (or every period if adaptive)
+            if scheduler.is_position_read_due(i):
                 self.read_dial_position(ret=positions)
                 # send position
                 for moveable, position_value in list(positions.items()):
@@ -447,7 +584,7 @@ class PoolMotion(PoolAction):
                                    moveable.name)
                     moveable.put_dial_position(position_value)
             i += 1
-            time.sleep(nap)
+            time.sleep(scheduler.get_sleep_time())
 
     def _state_error_occured(self, d):
         for _, (state_info, exc_info) in list(d.items()):
@@ -39,7 +39,8 @@ from sardana.sardanaattribute import SardanaAttribute, ScalarNumberAttribute, \
 from sardana.sardanaevent import EventType
 from sardana.sardanautils import assert_type, is_number, py2_round
 from sardana.pool.poolelement import PoolElement
-from sardana.pool.poolmotion import PoolMotion, MotionState
+from sardana.pool.poolmotion import PoolMotion, MotionState, \
+    MotionLoopPolicy
 
 
 class Position(SardanaAttribute):
@@ -227,6 +228,7 @@ class PoolMotor(PoolElement):
         self._velocity = None
         self._base_rate = None
         self._instability_time = None
+        self._motion_loop_policy = None
         self._in_start_move = False
         motion_name = "%s.Motion" % self._name
         self.set_action_cache(PoolMotion(self, motion_name))
@@ -367,6 +369,30 @@ class PoolMotor(PoolElement):
     instability_time = property(get_instability_time, set_instability_time,
                                 doc="motor instability time")
 
+    # -------------------------------------------------------------------------
+    # motion loop policy
+    # -------------------------------------------------------------------------
+
+    def get_motion_loop_policy(self):
+        policy = self._motion_loop_policy
+        if policy is None:
+            policy = self.pool.motion_loop_policy
+        return policy
+
+    def set_motion_loop_policy(self, policy):
+        """Sets the motion loop sleep time policy of this motor.
+
+        :param policy: policy (or its name) or None to use the pool's policy
+        :type policy: :obj:`~sardana.pool.poolmotion.MotionLoopPolicy` or str
+        """
+        if isinstance(policy, str):
+            policy = MotionLoopPolicy[policy]
+        self._motion_loop_policy = policy
+
+    motion_loop_policy = property(get_motion_loop_policy,
+                                  set_motion_loop_policy,
+                                  doc="motion loop sleep time policy")
+
     # -------------------------------------------------------------------------
     # backlash
     # -------------------------------------------------------------------------
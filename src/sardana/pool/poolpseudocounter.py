@@ -33,9 +33,12 @@ __docformat__ = 'restructuredtext'
 import sys
 import time
 
+import numpy
+
 from sardana import State, ElementType, TYPE_PHYSICAL_ELEMENTS
 from sardana.sardanaattribute import SardanaAttribute
-from sardana.sardanabuffer import EarlyValueException, LateValueException
+from sardana.sardanabuffer import BufferChunk, EarlyValueException, \
+    LateValueException
 from sardana.sardanaexception import SardanaException
 from sardana.sardanavalue import SardanaValue
 from sardana.pool.poolexception import PoolException
@@ -53,7 +56,46 @@ class ValueBuffer(ValueBuffer_):
             value_buf.add_listener(self.on_change)
 
     def on_change(self, evt_src, evt_type, evt_value):
-        for idx in evt_value.keys():
+        if len(evt_value) == 0:
+            return
+        if isinstance(evt_value, BufferChunk):
+            start, stop = evt_value.start, evt_value.stop
+        else:
+            idxs = list(evt_value.keys())
+            start, stop = idxs[0], idxs[-1] + 1
+        # calculate the whole chunk at once if all the physical values
+        # are available, otherwise fallback to value by value calculation
+        physical_values = []
+        try:
+            for value_buf in self.obj.get_physical_value_buffer_iterator():
+                physical_values.append(value_buf.get_values(start, stop))
+        except (EarlyValueException, LateValueException):
+            self._calc_values(evt_value.keys())
+            return
+        values = None
+        if self.obj.controller.is_vectorized():
+            values = self._calc_array(physical_values)
+        if values is None:
+            values = [self.obj.calc(list(values))
+                      for values in zip(*physical_values)]
+        self.extend(values, start)
+        self.remove_physical_values_range(start, stop)
+
+    def _calc_array(self, physical_values):
+        """Calculate the chunk of values in one call to the controller.
+        Return None if the controller failed so the caller can fallback to
+        value by value calculation."""
+        obj = self.obj
+        try:
+            arrays = [numpy.asarray(values) for values in physical_values]
+            return obj.controller.calc_array(obj.axis, arrays)
+        except Exception:
+            obj.debug("Vectorized calculation failed, falling back to value "
+                      "by value calculation", exc_info=1)
+            return None
+
+    def _calc_values(self, idxs):
+        for idx in idxs:
             physical_values = []
             for value_buf in self.obj.get_physical_value_buffer_iterator():
                 try:
@@ -75,6 +117,14 @@ class ValueBuffer(ValueBuffer_):
             if force or not value_buf.is_value_required(idx):
                 value_buf.remove(idx)
 
+    def remove_physical_values_range(self, start, stop):
+        for value_buf in self.obj.get_physical_value_buffer_iterator():
+            first_required = value_buf.get_first_required_idx()
+            if first_required is not None:
+                value_buf.discard(start, min(stop, first_required))
+            else:
+                value_buf.discard(start, stop)
+
 class Value(SardanaAttribute):
 
     def __init__(self, *args, **kwargs):
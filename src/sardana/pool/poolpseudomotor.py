@@ -34,6 +34,8 @@ import sys
 import time
 import collections
 
+import numpy
+
 from sardana import State, ElementType, TYPE_PHYSICAL_ELEMENTS
 from sardana.sardanavalue import SardanaValue
 from sardana.sardanaattribute import SardanaAttribute
@@ -212,6 +214,48 @@ class Position(SardanaAttribute):
             result = SardanaValue(exc_info=sys.exc_info())
         return result
 
+    def calc_all_pseudo_array(self, physical_positions):
+        try:
+            obj = self.obj
+            physical_positions = numpy.array(physical_positions, dtype=float,
+                                             ndmin=2)
+            l_p, l_u = physical_positions.shape[1], len(
+                obj.get_user_elements())
+            if l_p != l_u:
+                raise IndexError("CalcAllPseudoArray(%s): must give %d "
+                                 "physical positions per point (you gave %d)"
+                                 % (obj.name, l_u, l_p))
+            result = obj.controller.calc_all_pseudo_array(physical_positions,
+                                                          None)
+        except SardanaException as se:
+            result = SardanaValue(exc_info=se.exc_info)
+        except:
+            result = SardanaValue(exc_info=sys.exc_info())
+        return result
+
+    def calc_physical_array(self, new_positions):
+        try:
+            obj = self.obj
+            curr_physical_positions = self.get_physical_positions()
+            new_positions = numpy.array(new_positions, dtype=float)
+            if new_positions.ndim == 1:
+                # positions of this pseudo motor, the siblings stay at their
+                # last set points
+                positions = obj.get_siblings_positions()
+                positions[obj] = new_positions
+                pseudo_positions = numpy.empty((len(new_positions),
+                                                len(positions)))
+                for pseudo, position in list(positions.items()):
+                    pseudo_positions[:, pseudo.axis - 1] = position
+                new_positions = pseudo_positions
+            result = obj.controller.calc_all_physical_array(
+                new_positions, curr_physical_positions)
+        except SardanaException as se:
+            result = SardanaValue(exc_info=se.exc_info)
+        except:
+            result = SardanaValue(exc_info=sys.exc_info())
+        return result
+
     def on_change(self, evt_src, evt_type, evt_value):
         self.fire_read_event(propagate=evt_type.priority)
 
@@ -342,6 +386,36 @@ class PoolPseudoMotor(PoolBaseGroup, PoolElement):
     def calc_all_pseudo(self, physical_positions=None):
         return self.get_position_attribute().calc_all_pseudo(physical_positions=physical_positions)
 
+    def calc_all_pseudo_array(self, physical_positions):
+        """Calculate the positions of all the sibling pseudo motors for many
+        points at once.
+
+        :param physical_positions: (N, number of physical elements) physical
+            positions
+        :type physical_positions: seq<seq<float>> or numpy.ndarray
+        :return: value with the (N, number of pseudo motors) array of the
+            pseudo positions or with the error
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`
+        """
+        return self.get_position_attribute().calc_all_pseudo_array(
+            physical_positions)
+
+    def calc_physical_array(self, new_positions):
+        """Calculate the positions of the physical elements for many points
+        at once.
+
+        :param new_positions: either N positions of this pseudo motor (the
+            sibling pseudo motors stay at their last set points) or
+            (N, number of pseudo motors) positions of all the sibling pseudo
+            motors
+        :type new_positions: seq<float> or seq<seq<float>> or numpy.ndarray
+        :return: value with the (N, number of physical elements) array of the
+            physical positions or with the error
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`
+        """
+        return self.get_position_attribute().calc_physical_array(
+            new_positions)
+
     def get_position_attribute(self):
         return self._position
 
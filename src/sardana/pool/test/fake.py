@@ -26,6 +26,7 @@
 __all__ = ['FakePool', 'FakeElement']
 
 from sardana.pool.poolcontrollermanager import ControllerManager
+from sardana.pool.poolmotion import MotionLoopPolicy
 
 
 class FakePool(object):
@@ -33,8 +34,10 @@ class FakePool(object):
     '''
     acq_loop_sleep_time = 0.1
     acq_loop_states_per_value = 10
+    acq_loop_notification_timeout = 0.5
     motion_loop_sleep_time = 0.1
     motion_loop_states_per_position = 10
+    motion_loop_policy = MotionLoopPolicy.Fixed
     drift_correction = True
 
     def __init__(self, poolpath=[], loglevel=None):
@@ -57,6 +60,15 @@ class FakePool(object):
     def get_element_by_full_name(self, full_name):
         return self.elements_by_full_name[full_name]
 
+    get_element_by_id = get_element
+
+    def get_elements_by_type(self, t):
+        return [elem for elem in self.elements.values()
+                if elem.get_type() == t]
+
+    def add_listener(self, listener):
+        pass
+
     def get_free_id(self):
         while True:
             try:
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+from unittest import TestCase, mock
+from taurus.test import insertTest
+
+from sardana import State
+from sardana.pool import AcqSynch, AcqMode
+from sardana.pool.poolacquisition import PoolAcquisitionSoftware, \
+    get_timerable_ctrls
+from sardana.pool.test import createTimerableControllerConfiguration, \
+    BasePoolTestCase, FakeElement
+
+
+@insertTest(helper_name="disconnect_notifications",
+            channel_name="_test_ct_1_1")
+@insertTest(helper_name="disconnect_notifications",
+            channel_name="_test_2d_1_1")
+class AcquisitionNotificationTestCase(BasePoolTestCase, TestCase):
+    """Tests of the software synchronized acquisition action with the
+    dummy controllers notifying the end of acquisition.
+    """
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        TestCase.setUp(self)
+        self.main_element = FakeElement(self.pool)
+
+    def _acquire(self, channel, integ_time):
+        pool_ctrl = channel.get_controller()
+        pool_ctrl.set_ctrl_par("synchronization", AcqSynch.SoftwareTrigger)
+        pool_ctrl.ctrl.PrepareOne(channel.axis, integ_time, 1, 0, 1)
+        conf_ctrl = createTimerableControllerConfiguration(pool_ctrl,
+                                                           [channel])
+        acquisition = PoolAcquisitionSoftware(self.main_element)
+        acquisition.add_element(channel)
+        ctrls = get_timerable_ctrls([conf_ctrl], AcqMode.Timer)
+        master = ctrls[0].master
+        acquisition.run(ctrls, integ_time, master, index=0, synch=True)
+
+    def disconnect_notifications(self, channel_name, integ_time=0.01):
+        """Test that the action disconnects from the notifier controller
+        when the acquisition finishes and when its start fails"""
+        channel = self.exp_channels[channel_name]
+        plugin_ctrl = channel.get_controller().ctrl
+        plugin_ctrl.Notifications = True
+        try:
+            self._acquire(channel, integ_time)
+            self.assertEqual(channel.get_state(cache=False), State.On)
+            self.assertIsNone(plugin_ctrl._notification_cb)
+            with mock.patch.object(plugin_ctrl, "StartAll",
+                                   side_effect=RuntimeError("StartAll")):
+                with self.assertRaises(Exception):
+                    self._acquire(channel, integ_time)
+            self.assertIsNone(plugin_ctrl._notification_cb)
+        finally:
+            plugin_ctrl.Notifications = False
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
+        TestCase.tearDown(self)
+        self.main_element = None
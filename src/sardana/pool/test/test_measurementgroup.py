@@ -251,6 +251,36 @@ class BaseAcquisition(object):
         # time.sleep(3)
         self.acq_asserts(channel_names, repetitions)
 
+    def meas_count(self, config, integ_time, nb_counts=10):
+        """Count with the given integration time and check the values
+        returned by the count.
+        """
+        channel_names = self.prepare_meas(config)
+        for _ in range(nb_counts):
+            values = self.pmg.count(integ_time)
+            self.assertEqual(len(values), len(channel_names))
+            for name, value in values.items():
+                msg = "no value for channel %s" % name
+                self.assertIsNotNone(value, msg)
+            self.assertFalse(self.pmg.acquisition.is_running())
+        self.assertEqual(self.pmg.integration_time, integ_time)
+        self.assertEqual(self.pmg.nb_starts, 1)
+
+    def meas_count_prepared(self, config, integ_time, nb_starts):
+        """Count the prepared number of starts (as the deterministic
+        step scans) and check the values returned by the count.
+        """
+        channel_names = self.prepare_meas(config)
+        self.pmg.integration_time = integ_time
+        self.pmg.nb_starts = nb_starts
+        self.pmg.prepare()
+        for _ in range(nb_starts):
+            values = self.pmg.count()
+            self.assertEqual(len(values), len(channel_names))
+            for name, value in values.items():
+                msg = "no value for channel %s" % name
+                self.assertIsNotNone(value, msg)
+
     def tearDown(self):
         self.attr_listener = None
         self.pmg = None
@@ -403,6 +433,11 @@ config_15 = [[('_test_2d_1_1', 'software', AcqSynchType.Trigger)]]
 @insertTest(helper_name='meas_cont_acquisition', test_method_doc=doc_13,
             config=config_13,
             synch_description=synch_description1)
+@insertTest(helper_name='meas_count', config=config_12, integ_time=0.01)
+@insertTest(helper_name='meas_count', config=config_4, integ_time=0.01)
+@insertTest(helper_name='meas_count', config=config_13, integ_time=0.01)
+@insertTest(helper_name='meas_count_prepared', config=config_12,
+            integ_time=0.01, nb_starts=5)
 class AcquisitionTestCase(BasePoolTestCase, BaseAcquisition, unittest.TestCase):
     """Integration test of TGGeneration and Acquisition actions."""
 
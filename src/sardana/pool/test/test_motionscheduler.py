@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+from unittest import TestCase
+from taurus.test import insertTest
+
+from sardana import State
+from sardana.pool.poolmotion import MotionLoopPolicy, MotionSleepScheduler
+from sardana.pool.test import BasePoolTestCase
+
+
+class MotionSleepSchedulerTestCase(TestCase):
+    """Unittest of MotionSleepScheduler class"""
+
+    def test_fixed(self):
+        scheduler = MotionSleepScheduler(0.01, 10, duration=1, start_time=0)
+        self.assertFalse(scheduler.is_adaptive())
+        self.assertEqual(scheduler.get_sleep_time(timestamp=0.5), 0.01)
+        due = [scheduler.is_position_read_due(i) for i in range(21)]
+        self.assertEqual(due.count(True), 3)
+
+    def test_adaptive_without_duration(self):
+        scheduler = MotionSleepScheduler(0.01, 10,
+                                         policy=MotionLoopPolicy.Adaptive)
+        self.assertFalse(scheduler.is_adaptive())
+
+    def test_adaptive_sleep_time(self):
+        scheduler = MotionSleepScheduler(0.01, 10,
+                                         policy=MotionLoopPolicy.Adaptive,
+                                         duration=1, start_time=0)
+        # long remaining time: bounded by the position period
+        self.assertAlmostEqual(scheduler.get_sleep_time(timestamp=0), 0.1)
+        # close to the end: fraction of the remaining time
+        self.assertAlmostEqual(scheduler.get_sleep_time(timestamp=0.99),
+                               0.005)
+        # very close to the end: bounded by the minimum
+        self.assertAlmostEqual(scheduler.get_sleep_time(timestamp=0.9999),
+                               MotionSleepScheduler.MinSleepTime)
+        # overdue: grows from the minimum up to the sleep time
+        naps = [scheduler.get_sleep_time(timestamp=2) for _ in range(6)]
+        self.assertEqual(naps[0], MotionSleepScheduler.MinSleepTime)
+        self.assertEqual(naps, sorted(naps))
+        self.assertEqual(naps[-1], 0.01)
+
+    def test_adaptive_position_read(self):
+        scheduler = MotionSleepScheduler(0.01, 10,
+                                         policy=MotionLoopPolicy.Adaptive,
+                                         duration=1, start_time=0)
+        self.assertTrue(scheduler.is_position_read_due(0, timestamp=0))
+        self.assertFalse(scheduler.is_position_read_due(1, timestamp=0.05))
+        self.assertTrue(scheduler.is_position_read_due(2, timestamp=0.1))
+
+
+@insertTest(helper_name="adaptive_motion", motor_name="_test_mot_1_1")
+class MotionLoopPolicyTestCase(BasePoolTestCase, TestCase):
+    """Tests of the motion with the adaptive motion loop policy"""
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        TestCase.setUp(self)
+
+    def adaptive_motion(self, motor_name, displacement=0.5):
+        """Test that the motion with the adaptive policy reaches the final
+        position"""
+        motor = self.mots[motor_name]
+        motor.set_velocity(10)
+        motor.set_acceleration(0.01)
+        motor.set_deceleration(0.01)
+        motor.set_motion_loop_policy(MotionLoopPolicy.Adaptive)
+        items = motor.calculate_motion(displacement)
+        motor.motion.run(items=items, synch=True)
+        self.assertEqual(motor.state, State.On)
+        self.assertAlmostEqual(motor.position.value, displacement)
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
+        TestCase.tearDown(self)
@@ -23,8 +23,15 @@
 ##
 ##############################################################################
 
+import os
+import shutil
+import tempfile
 import unittest
+
 from sardana.pool.poolcontrollermanager import ControllerManager
+from sardana.pool.poolmetacontroller import LazyControllerLibrary, \
+    LazyControllerClass
+from sardana.pool.test import FakePool, createCtrlConf, createPoolController
 
 
 class ControllerManagerTestCase(unittest.TestCase):
@@ -44,3 +51,71 @@ class ControllerManagerTestCase(unittest.TestCase):
     def tearDown(self):
         unittest.TestCase.tearDown(self)
         self.cm = None
+
+
+class ControllerManagerCacheTestCase(unittest.TestCase):
+    """Unittest of the ControllerManager controller libraries cache"""
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.cache_name = os.path.join(self.dir_name, "pool.ctrlcache")
+        self.pool = FakePool()
+        self.pool.name = "pool"
+        self.cm = self.pool.ctrl_manager
+
+    def tearDown(self):
+        self.pool.cleanup()
+        shutil.rmtree(self.dir_name)
+
+    def _setControllerPath(self, cache=True):
+        if cache:
+            self.cm.setControllerCache(self.cache_name)
+        else:
+            self.cm.setControllerCache(None)
+        self.cm.setControllerPath([])
+
+    def _serialize(self):
+        return {ctrl_class.name: ctrl_class.serialize()
+                for ctrl_class in self.cm.getControllers()}
+
+    def test_lazy_metadata(self):
+        """Verify that the controller classes restored from the cache are
+        described as the imported ones."""
+        self._setControllerPath()
+        self.assertTrue(os.path.exists(self.cache_name))
+        imported = self._serialize()
+        ctrl_class = self.cm.getControllerMetaClass(
+            "DummyMotorController")
+        self.assertNotIsInstance(ctrl_class, LazyControllerClass)
+        self._setControllerPath()
+        lazy_ctrl_class = self.cm.getControllerMetaClass(
+            "DummyMotorController")
+        self.assertIsInstance(lazy_ctrl_class, LazyControllerClass)
+        self.assertIsInstance(lazy_ctrl_class.lib, LazyControllerLibrary)
+        self.assertIsNone(lazy_ctrl_class.lib.module)
+        self.assertEqual(self._serialize(), imported)
+        self.assertEqual(lazy_ctrl_class.axis_attributes.keys(),
+                         ctrl_class.axis_attributes.keys())
+        self.assertEqual(lazy_ctrl_class.ctrl_properties.keys(),
+                         ctrl_class.ctrl_properties.keys())
+
+    def test_first_use(self):
+        """Verify that the controller library is imported when a controller
+        is created."""
+        self._setControllerPath()
+        self._setControllerPath()
+        lib = self.cm.getControllerLib("DummyCounterTimerController.py")
+        self.assertIsInstance(lib, LazyControllerLibrary)
+        self.assertIsNone(lib.module)
+        conf = createCtrlConf(self.pool, "_test_ct_ctrl_1",
+                              "DummyCounterTimerController",
+                              "DummyCounterTimerController.py")
+        ctrl = createPoolController(self.pool, conf)
+        self.assertIsNotNone(lib.module)
+        self.assertIsNotNone(ctrl.ctrl)
+        self.assertIsNone(ctrl.get_ctrl_error())
+        self.assertIs(ctrl.ctrl.__class__,
+                      lib.module.DummyCounterTimerController)
+        # other libraries are not imported
+        lib = self.cm.getControllerLib("DummyMotorController.py")
+        self.assertIsNone(lib.module)
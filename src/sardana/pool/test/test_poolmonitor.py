@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+
+import threading
+
+from unittest import TestCase
+from taurus.test import insertTest
+
+from sardana.sardanaevent import EventType
+from sardana.pool.poolmonitor import PoolMonitor
+from sardana.pool.test import BasePoolTestCase
+
+
+class SlowStateAll(object):
+    """Replaces the controller StateAll with one counting the calls and,
+    if *blocked*, blocking until it is released"""
+
+    def __init__(self, ctrl, blocked=False):
+        self._state_all = ctrl.StateAll
+        self.count = 0
+        self.released = threading.Event()
+        if not blocked:
+            self.released.set()
+        ctrl.StateAll = self
+
+    def __call__(self):
+        self.count += 1
+        self.released.wait()
+        self._state_all()
+
+
+@insertTest(helper_name="slow_ctrl", timeout=0.1)
+@insertTest(helper_name="update_state_info", concurrent=True)
+@insertTest(helper_name="update_state_info", concurrent=False)
+class PoolMonitorTestCase(BasePoolTestCase, TestCase):
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        TestCase.setUp(self)
+        self.monitor = PoolMonitor(self.pool, auto_start=False)
+        self.monitor.on_pool_changed(self.pool, EventType("ElementCreated"),
+                                     None)
+        self.state_alls = {}
+
+    def _countStateAlls(self):
+        for ctrl_id in self.monitor._ctrl_ids:
+            pool_ctrl = self.pool.get_element_by_id(ctrl_id)
+            self.state_alls[pool_ctrl.name] = SlowStateAll(pool_ctrl.ctrl)
+
+    def update_state_info(self, concurrent):
+        self.monitor.concurrent = concurrent
+        self._countStateAlls()
+        self.monitor.update_state_info()
+        for name, state_all in self.state_alls.items():
+            self.assertEqual(state_all.count, 1,
+                             "%s state was not read" % name)
+        stats = self.monitor.get_ctrl_stats()
+        self.assertEqual(set(stats.keys()), set(self.state_alls.keys()))
+        for ctrl_stats in stats.values():
+            self.assertEqual(ctrl_stats["count"], 1)
+            self.assertFalse(ctrl_stats["slow"])
+
+    def slow_ctrl(self, timeout):
+        """Test that a controller which does not answer does not block the
+        monitor and the others and is flagged as slow"""
+        self.monitor.concurrent = True
+        self.monitor.ctrl_timeout = timeout
+        slow = self.ctrls["_test_mot_ctrl_1"]
+        self._countStateAlls()
+        state_all = SlowStateAll(slow.ctrl, blocked=True)
+        self.state_alls[slow.name] = state_all
+        try:
+            self.monitor.update_state_info()
+            stats = self.monitor.get_ctrl_stats()
+            self.assertTrue(stats[slow.name]["slow"])
+            self.assertEqual(stats[slow.name]["timeouts"], 1)
+            self.assertEqual(stats["_test_mot_ctrl_2"]["count"], 1)
+            # the pending controller is skipped in the next cycle
+            self.monitor.update_state_info()
+            self.assertEqual(state_all.count, 1)
+            self.assertEqual(self.state_alls["_test_mot_ctrl_2"].count, 2)
+            done = self.monitor._pending_ctrls[slow]
+        finally:
+            state_all.released.set()
+        done.wait()
+        self.assertEqual(self.monitor.get_ctrl_stats()[slow.name]["count"],
+                         1)
+        # the controller answers again
+        self.monitor.update_state_info()
+        self.assertFalse(self.monitor.get_ctrl_stats()[slow.name]["slow"])
+
+    def tearDown(self):
+        self.monitor.stop()
+        self.monitor = None
+        BasePoolTestCase.tearDown(self)
+        TestCase.tearDown(self)
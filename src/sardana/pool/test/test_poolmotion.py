@@ -23,9 +23,13 @@
 ##
 ##############################################################################
 
+import time
 import unittest
+from unittest import mock
 
+from sardana import sardanacustomsettings
 from sardana.pool.poolmotion import PoolMotion
+from sardana.pool.test.base import BasePoolTestCase
 from sardana.sardanadefs import State
 from sardana.pool.test import (FakePool, createPoolController,
                                createPoolMotor, dummyPoolMotorCtrlConf01,
@@ -121,3 +125,74 @@ class PoolMotionTestCase(unittest.TestCase):
         self.cfg = None
         self.dummy_mot = None
         unittest.TestCase.tearDown(self)
+
+
+def _slow(method, latency):
+    def slow_method(*args, **kwargs):
+        time.sleep(latency)
+        return method(*args, **kwargs)
+    return slow_method
+
+
+class PoolMotionReadersTestCase(BasePoolTestCase, unittest.TestCase):
+    """Test the concurrent reads of the motion involving many controllers
+    with artificial per-call latency"""
+
+    nb_ctrls = 20
+    latency = 0.01
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        motors = []
+        for i in range(self.nb_ctrls):
+            ctrl = self.createController("_test_readers_ctrl_%d" % i,
+                                         "DummyMotorController",
+                                         "DummyMotorController.py")
+            motors.append(self.createMotorElement(ctrl,
+                                                  "_test_readers_mot_%d" % i,
+                                                  1))
+            ctrl.ctrl.StateOne = _slow(ctrl.ctrl.StateOne, self.latency)
+            ctrl.ctrl.ReadOne = _slow(ctrl.ctrl.ReadOne, self.latency)
+        self.motors = motors
+        self.motion = PoolMotion(motors[0])
+        for motor in motors:
+            self.motion.add_element(motor)
+
+    def _readers(self, enabled):
+        return mock.patch.object(sardanacustomsettings,
+                                 "POOL_CONTROLLER_READERS", enabled,
+                                 create=True)
+
+    def _read(self, serial=False):
+        states = self.motion.read_state_info(serial=serial)
+        positions = self.motion.read_dial_position(serial=serial)
+        return ({motor: state[0] for motor, state in states.items()},
+                {motor: position.value
+                 for motor, position in positions.items()})
+
+    def test_read(self):
+        """Test that the readers read the same states and positions as the
+        serial and thread pool reads"""
+        expected = self._read(serial=True)
+        self.assertEqual(len(expected[0]), self.nb_ctrls)
+        self.assertEqual(len(expected[1]), self.nb_ctrls)
+        self.assertEqual(self._read(), expected)
+        with self._readers(True):
+            self.assertEqual(self._read(), expected)
+            self.assertEqual(self._read(), expected)
+
+    def test_persistent_readers(self):
+        """Test that the controller readers are created once"""
+        with self._readers(True):
+            self._read()
+            readers = [motor.controller.get_reader()
+                       for motor in self.motors]
+            self._read()
+        for motor, reader in zip(self.motors, readers):
+            self.assertIs(motor.controller.get_reader(), reader)
+            self.assertTrue(reader.is_alive())
+
+    def tearDown(self):
+        self.motion = None
+        self.motors = None
+        BasePoolTestCase.tearDown(self)
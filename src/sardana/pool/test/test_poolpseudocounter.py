@@ -23,8 +23,9 @@
 ##
 ##############################################################################
 
-from unittest import TestCase
+from unittest import TestCase, mock
 
+from sardana import sardanacustomsettings
 from sardana.pool.test.base import BasePoolTestCase
 
 
@@ -68,3 +69,59 @@ class PseudoCounterTestCase(BasePoolTestCase, TestCase):
         self.ct2.append_value_buffer(10., idx=9)
         self.assertEqual(len(pc_value_buffer.last_chunk), 1)
         self.assertEqual(pc_value_buffer.last_chunk[9].value, 1)
+
+    def test_pseudocounter_calc_array_fallback(self):
+        """Test that the pseudo counter values are calculated value by value
+        if the vectorized calculation fails"""
+        pc_value_buffer = self.pc.get_value_buffer()
+        ctrl = self.pc.controller.ctrl
+        with mock.patch.object(ctrl, "CalcArray",
+                               side_effect=ValueError) as calc_array:
+            self.ct2.extend_value_buffer([10.] * 3)
+            self.ct1.extend_value_buffer([1., 2., 3.])
+        self.assertEqual(calc_array.call_count, 1)
+        chunk = pc_value_buffer.last_chunk
+        self.assertEqual([chunk[idx].value for idx in range(3)],
+                         [.1, .2, .3])
+
+
+class ArrayBackedPseudoCounterTestCase(PseudoCounterTestCase):
+    """PseudoCounterTestCase with array backed value buffers."""
+
+    def setUp(self):
+        self._capacity = getattr(sardanacustomsettings,
+                                 "VALUE_BUFFER_CAPACITY", None)
+        sardanacustomsettings.VALUE_BUFFER_CAPACITY = 2
+        PseudoCounterTestCase.setUp(self)
+
+    def test_pseudocounter_calc_chunk(self):
+        """Test that the pseudo counter calculates the chunks of physical
+        values in one go"""
+        pc_value_buffer = self.pc.get_value_buffer()
+        self.ct2.extend_value_buffer([10.] * 5)
+        self.ct1.extend_value_buffer([1., 2., 3., 4., 5.])
+        chunk = pc_value_buffer.last_chunk
+        self.assertEqual((chunk.start, chunk.stop), (0, 5))
+        self.assertEqual(list(chunk.value_array), [.1, .2, .3, .4, .5])
+        # physical values were removed
+        self.assertEqual(len(self.ct1.get_value_buffer()), 0)
+        self.assertEqual(len(self.ct2.get_value_buffer()), 0)
+
+    def test_pseudocounter_calc_array(self):
+        """Test that the vectorized pseudo counter calculates the chunks of
+        physical values in one call to the controller"""
+        pc_value_buffer = self.pc.get_value_buffer()
+        ctrl = self.pc.controller.ctrl
+        with mock.patch.object(ctrl, "CalcArray",
+                               wraps=ctrl.CalcArray) as calc_array, \
+                mock.patch.object(ctrl, "Calc", wraps=ctrl.Calc) as calc:
+            self.ct2.extend_value_buffer([10., 10., 0., 10., 10.])
+            self.ct1.extend_value_buffer([1., 2., 3., 4., 5.])
+        self.assertEqual(calc_array.call_count, 1)
+        self.assertEqual(calc.call_count, 0)
+        self.assertEqual(list(pc_value_buffer.last_chunk.value_array),
+                         [.1, .2, 3., .4, .5])
+
+    def tearDown(self):
+        sardanacustomsettings.VALUE_BUFFER_CAPACITY = self._capacity
+        PseudoCounterTestCase.tearDown(self)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+from unittest import TestCase, mock
+
+from taurus.test import insertTest
+
+from sardana.pool.test.base import BasePoolTestCase
+
+
+@insertTest(helper_name="calc_physical_array", vectorized=True)
+@insertTest(helper_name="calc_physical_array", vectorized=False)
+@insertTest(helper_name="calc_all_pseudo_array", vectorized=True)
+@insertTest(helper_name="calc_all_pseudo_array", vectorized=False)
+class PseudoMotorTestCase(BasePoolTestCase, TestCase):
+    """TestCase with PseudoMotor integration tests."""
+
+    def setUp(self):
+        """Create Slit pseudo motors based on two dummy motors"""
+        BasePoolTestCase.setUp(self)
+        mot1 = self.mots["_test_mot_1_1"]
+        mot2 = self.mots["_test_mot_1_2"]
+        self.physical = mot1, mot2
+        pmctrl = self.createController("slitctrl", "Slit", "Slit")
+        self.gap = self.createPMElement(pmctrl, "gap", 1, (mot1.id, mot2.id))
+        self.offset = self.createPMElement(pmctrl, "offset", 2,
+                                           (mot1.id, mot2.id))
+
+    def _vectorized(self, vectorized):
+        return mock.patch.object(self.gap.controller, "is_vectorized",
+                                 return_value=vectorized)
+
+    def calc_physical_array(self, vectorized):
+        """Test that the physical positions of many points are calculated
+        as point by point"""
+        gaps = [1., 2., 3., 4.]
+        with self._vectorized(vectorized):
+            result = self.gap.calc_physical_array(gaps)
+        self.assertFalse(result.error, result.exc_info)
+        self.assertEqual(result.value.shape, (4, 2))
+        for gap, physical in zip(gaps, result.value):
+            expected = self.gap.calc_physical(gap)
+            self.assertFalse(expected.error, expected.exc_info)
+            self.assertEqual(list(physical), list(expected.value))
+        pseudo = [[gap, 1.] for gap in gaps]
+        with self._vectorized(vectorized):
+            result = self.offset.calc_physical_array(pseudo)
+        self.assertEqual(list(result.value[:, 0] - result.value[:, 1]),
+                         [2.] * len(gaps))
+
+    def calc_all_pseudo_array(self, vectorized):
+        """Test that the pseudo positions of many points are calculated
+        as point by point"""
+        physical = [[1., 1.], [2., 0.], [0., 3.]]
+        with self._vectorized(vectorized):
+            result = self.gap.calc_all_pseudo_array(physical)
+        self.assertFalse(result.error, result.exc_info)
+        for pos, pseudo in zip(physical, result.value):
+            expected = self.gap.calc_all_pseudo(pos)
+            self.assertEqual(list(pseudo), list(expected.value))
+        result = self.gap.calc_all_pseudo_array([[1., 2., 3.]])
+        self.assertTrue(result.error)
+
+    def test_calc_array_error(self):
+        """Test that the controller errors are reported in the result"""
+        ctrl = self.gap.controller.ctrl
+        with mock.patch.object(ctrl, "CalcAllPhysicalArray",
+                               side_effect=ValueError):
+            result = self.gap.calc_physical_array([1., 2.])
+        self.assertTrue(result.error)
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
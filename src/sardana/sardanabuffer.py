@@ -28,11 +28,16 @@ for Sardana buffers"""
 
 
 
-__all__ = ["SardanaBuffer", "LateValueException", "EarlyValueException"]
+__all__ = ["SardanaBuffer", "BufferChunk", "LateValueException",
+           "EarlyValueException"]
 
+import time
 import weakref
 
 from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy
 
 from .sardanavalue import SardanaValue
 from .sardanaevent import EventGenerator, EventType
@@ -54,18 +59,229 @@ class EarlyValueException(SardanaException):
     pass
 
 
+class BufferChunk(Mapping):
+    """Chunk of values with consecutive indexes added to an array backed
+    :class:`SardanaBuffer`.
+
+    It gives direct access to the NumPy arrays of values
+    (:attr:`value_array`) and timestamps (:attr:`timestamp_array`) and the
+    values which are errors (:attr:`errors`). For backwards compatibility it
+    is also a mapping of indexes to :class:`~sardana.sardanavalue.SardanaValue`
+    objects (created on access).
+
+    .. note::
+        The BufferChunk class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including removal of the class) may occur if
+        deemed necessary by the core developers.
+    """
+
+    def __init__(self, start, values, timestamps, errors=None):
+        #: index of the first value
+        self.start = start
+        #: array of values (errors are filled with placeholders)
+        self.value_array = values
+        #: array of timestamps
+        self.timestamp_array = timestamps
+        #: dictionary of values which are errors (index as key)
+        self.errors = errors or {}
+
+    @property
+    def stop(self):
+        """index following the last value"""
+        return self.start + len(self.value_array)
+
+    @property
+    def indexes(self):
+        """array of indexes"""
+        return numpy.arange(self.start, self.stop)
+
+    def __len__(self):
+        return len(self.value_array)
+
+    def __iter__(self):
+        return iter(range(self.start, self.stop))
+
+    def __contains__(self, idx):
+        return self.start <= idx < self.stop
+
+    def __getitem__(self, idx):
+        if idx not in self:
+            raise KeyError(idx)
+        error = self.errors.get(idx)
+        if error is not None:
+            return error
+        i = idx - self.start
+        return SardanaValue(value=_to_value(self.value_array[i]),
+                            timestamp=float(self.timestamp_array[i]))
+
+
+def _to_value(value):
+    """Converts NumPy scalar to Python scalar"""
+    if isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
+def _to_arrays(values):
+    """Converts sequence of values (SardanaValue objects or plain values) to
+    array of values, array of timestamps and dictionary of errors"""
+    if isinstance(values, numpy.ndarray):
+        return values, numpy.full(len(values), time.time()), {}
+    raw_values, timestamps, errors = [], numpy.empty(len(values)), {}
+    good_value = None
+    now = None
+    for i, value in enumerate(values):
+        if isinstance(value, SardanaValue):
+            timestamps[i] = value.timestamp
+            if value.error:
+                errors[i] = value
+                raw_values.append(None)
+                continue
+            value = value.value
+        else:
+            if now is None:
+                now = time.time()
+            timestamps[i] = now
+        good_value = value
+        raw_values.append(value)
+    if errors and good_value is not None:
+        good_value = numpy.asarray(good_value)
+        placeholder = None
+        if good_value.dtype.kind in "biuf":
+            placeholder = numpy.full(good_value.shape, numpy.nan)
+        for i in errors:
+            raw_values[i] = placeholder
+    try:
+        array = numpy.array(raw_values)
+    except ValueError:
+        # e.g. ragged sequence of arrays
+        array = None
+    if array is None or array.dtype.kind not in "biufcSU" \
+            or array.shape[:1] != (len(raw_values),):
+        array = numpy.empty(len(raw_values), dtype=object)
+        array[:] = raw_values
+    return array, timestamps, errors
+
+
+class _ValueRing(object):
+    """Ring of preallocated NumPy arrays storing values and timestamps in
+    slots corresponding to the value index modulo capacity. The ring grows
+    instead of overwriting persistent (not yet removed) values."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = None
+        self.timestamps = numpy.empty(capacity)
+        # index of the persistent value stored in each slot (-1 if none)
+        self.idxs = numpy.full(capacity, -1, dtype=numpy.int64)
+
+    def _allocate(self, capacity, dtype, shape):
+        values = numpy.empty((capacity,) + shape, dtype=dtype)
+        timestamps = numpy.empty(capacity)
+        idxs = numpy.full(capacity, -1, dtype=numpy.int64)
+        if self.values is not None:
+            valid = self.idxs >= 0
+            slots = self.idxs[valid] % capacity
+            if dtype == object and self.values.dtype != object:
+                values[slots] = list(self.values[valid])
+            else:
+                values[slots] = self.values[valid]
+            timestamps[slots] = self.timestamps[valid]
+            idxs[slots] = self.idxs[valid]
+        self.capacity = capacity
+        self.values, self.timestamps, self.idxs = values, timestamps, idxs
+
+    def _prepare(self, start, array):
+        stop = start + len(array)
+        shape, dtype = array.shape[1:], array.dtype
+        capacity = self.capacity
+        if self.values is not None:
+            if self.values.dtype == object:
+                shape, dtype = self.values.shape[1:], object
+            elif dtype == object or self.values.shape[1:] != shape:
+                shape, dtype = (), object
+            else:
+                dtype = numpy.result_type(self.values.dtype, dtype)
+        valid = self.idxs[self.idxs >= 0]
+        low, high = start, stop
+        if len(valid):
+            low, high = min(low, valid.min()), max(high, valid.max() + 1)
+        if high - low > capacity:
+            capacity = max(2 * capacity, high - low)
+        if (self.values is None or capacity != self.capacity
+                or dtype != self.values.dtype
+                or shape != self.values.shape[1:]):
+            self._allocate(capacity, dtype, shape)
+
+    def write(self, start, array, timestamps, persistent):
+        """Writes values to the ring and returns views of them"""
+        n = len(array)
+        self._prepare(start, array)
+        first = start % self.capacity
+        if self.values.dtype == object and array.dtype != object:
+            array = list(array)
+        if first + n <= self.capacity:
+            chunk = slice(first, first + n)
+            self.values[chunk] = array
+            self.timestamps[chunk] = timestamps
+            if persistent:
+                self.idxs[chunk] = numpy.arange(start, start + n)
+            return self.values[chunk], self.timestamps[chunk]
+        slots = numpy.arange(start, start + n) % self.capacity
+        self.values[slots] = array
+        self.timestamps[slots] = timestamps
+        if persistent:
+            self.idxs[slots] = numpy.arange(start, start + n)
+        return self.values[slots], self.timestamps[slots]
+
+    def get(self, start, stop):
+        """Returns values and timestamps of the given index range or None
+        if any of them is not in the ring"""
+        idxs = numpy.arange(start, stop)
+        slots = idxs % self.capacity
+        if not numpy.array_equal(self.idxs[slots], idxs):
+            return None
+        first = start % self.capacity
+        if first + len(idxs) <= self.capacity:
+            chunk = slice(first, first + len(idxs))
+            return self.values[chunk], self.timestamps[chunk]
+        return self.values[slots], self.timestamps[slots]
+
+    def contains(self, idx):
+        return self.idxs[idx % self.capacity] == idx
+
+    def remove(self, idx):
+        slot = idx % self.capacity
+        if self.idxs[slot] != idx:
+            return False
+        self.idxs[slot] = -1
+        return True
+
+    def clear(self):
+        self.idxs[:] = -1
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self.idxs >= 0))
+
+
 class SardanaBuffer(EventGenerator):
     """Buffer for SardanaValue objects. Each value is identified by an unique
     idx and all values are organized based on the order of addition to the
     buffer
 
+    If *capacity* is given, the buffer is array backed: the values and
+    timestamps are stored in a ring of preallocated NumPy arrays (of the
+    given initial capacity) and the errors in a side table. The add events
+    are fired with :class:`BufferChunk` objects which give access to the
+    arrays of the added values without creating objects per value.
+
     ..todo:: Eliminate the last_chunk - it is not really necessary and just
      consumes memory.
-    ..todo:: It is better to fire events in form of a list with tuples
-    of idx and value objects.
     """
 
-    def __init__(self, obj=None, name=None, persistent=False, **kwargs):
+    def __init__(self, obj=None, name=None, persistent=False, capacity=None,
+                 **kwargs):
         """Construct SardanaBuffer object
 
         :param obj: the object which owns this buffer
@@ -76,6 +292,9 @@ class SardanaBuffer(EventGenerator):
             being explicitly removed (True) or just until firing the next event
             (False)
         :type persistent: bool
+        :param capacity: initial capacity of the array backed buffer, None
+            means buffer of SardanaValue objects
+        :type capacity: int
         """
         super(SardanaBuffer, self).__init__(**kwargs)
         if obj is not None:
@@ -84,12 +303,26 @@ class SardanaBuffer(EventGenerator):
         self.name = name or self.__class__.__name__
         self._persistent = persistent
         self._buffer = OrderedDict()
+        self._ring = None
+        if capacity is not None:
+            self._ring = _ValueRing(capacity)
+        # persistent errors of the array backed buffer
+        self._errors = {}
         self._next_idx = 0
         self._last_chunk = None
 
     def __len__(self):
+        if self._ring is not None:
+            return len(self._ring) + len(self._errors)
         return self._buffer.__len__()
 
+    def is_array_backed(self):
+        """Returns whether the buffer is array backed
+
+        :return: whether the buffer is array backed
+        :rtype: bool"""
+        return self._ring is not None
+
     def get_obj(self):
         """Returns the object which owns this buffer
 
@@ -121,14 +354,60 @@ class SardanaBuffer(EventGenerator):
         :return: the value object corresponding to the idx
         :rtype: SardanaValue
         """
-        try:
-            return self._buffer[idx]
-        except KeyError:
-            msg = "value with %s index is not in buffer" % idx
-            if self.next_idx > idx:
-                raise LateValueException(msg)
-            else:
-                raise EarlyValueException(msg)
+        if self._ring is not None:
+            value = self._errors.get(idx)
+            if value is None and self._ring.contains(idx):
+                slot = idx % self._ring.capacity
+                value = SardanaValue(
+                    value=_to_value(self._ring.values[slot]),
+                    timestamp=float(self._ring.timestamps[slot]))
+            if value is not None:
+                return value
+        else:
+            try:
+                return self._buffer[idx]
+            except KeyError:
+                pass
+        msg = "value with %s index is not in buffer" % idx
+        if self.next_idx > idx:
+            raise LateValueException(msg)
+        else:
+            raise EarlyValueException(msg)
+
+    def get_values(self, start, stop):
+        """Return values of the given consecutive indexes.
+
+        :param start: index of the first value
+        :type start: int
+        :param stop: index following the last value
+        :type stop: int
+        :return: the values (array for the array backed buffer without
+            errors in the given range, list otherwise)
+        :rtype: numpy.ndarray or list
+        """
+        if self._ring is not None and stop <= self._next_idx:
+            ret = self._ring.get(start, stop)
+            if ret is not None:
+                for idx in self._errors:
+                    if start <= idx < stop:
+                        break
+                else:
+                    return ret[0]
+        return [self.get_value(idx) for idx in range(start, stop)]
+
+    def _extend_array(self, values, initial_idx):
+        array, timestamps, errors = _to_arrays(values)
+        values, timestamps = self._ring.write(initial_idx, array, timestamps,
+                                              self._persistent)
+        errors = {initial_idx + i: value for i, value in errors.items()}
+        if self._persistent:
+            self._errors.update(errors)
+            for idx in errors:
+                self._ring.remove(idx)
+        self._last_chunk = BufferChunk(initial_idx, values, timestamps,
+                                       errors)
+        self._next_idx = initial_idx + len(array)
+        self.fire_add_event()
 
     def append(self, value, idx=None):
         """Append a single value at the end of the buffer with a given index.
@@ -144,6 +423,9 @@ class SardanaBuffer(EventGenerator):
         """
         if idx is None:
             idx = self._next_idx
+        if self._ring is not None:
+            self._extend_array([value], idx)
+            return
         self._last_chunk = OrderedDict()
         if not isinstance(value, SardanaValue):
             value = SardanaValue(value)
@@ -166,14 +448,15 @@ class SardanaBuffer(EventGenerator):
         """
         if initial_idx is None:
             initial_idx = self._next_idx
-        self._last_chunk = OrderedDict()
-        for idx, value in enumerate(values, initial_idx):
-            if not isinstance(value, SardanaValue):
-                value = SardanaValue(value)
-            self._last_chunk[idx] = value
-            if self._persistent:
-                self._buffer[idx] = value
-        self._next_idx = idx + 1
+        if self._ring is not None:
+            self._extend_array(values, initial_idx)
+            return
+        values = SardanaValue.from_values(values)
+        idxs = range(initial_idx, initial_idx + len(values))
+        self._last_chunk = OrderedDict(zip(idxs, values))
+        if self._persistent:
+            self._buffer.update(self._last_chunk)
+        self._next_idx = idxs.stop
         self.fire_add_event()
 
     def remove(self, idx):
@@ -184,11 +467,45 @@ class SardanaBuffer(EventGenerator):
         :return: the value object corresponding to the idx
         :rtype: object
         """
-        try:
-            return self._buffer.pop(idx)
-        except KeyError:
-            msg = "value with %s index is not in buffer" % idx
-            raise KeyError(msg)
+        if self._ring is not None:
+            value = self._errors.pop(idx, None)
+            if value is not None:
+                return value
+            if self._ring.contains(idx):
+                value = self.get_value_obj(idx)
+                self._ring.remove(idx)
+                return value
+        else:
+            try:
+                return self._buffer.pop(idx)
+            except KeyError:
+                pass
+        msg = "value with %s index is not in buffer" % idx
+        raise KeyError(msg)
+
+    def discard(self, start, stop):
+        """Remove values of the given consecutive indexes (the ones which
+        are not in the buffer are ignored).
+
+        :param start: index of the first value
+        :type start: int
+        :param stop: index following the last value
+        :type stop: int
+        """
+        if self._ring is None:
+            for idx in range(start, stop):
+                self._buffer.pop(idx, None)
+            return
+        for idx in [idx for idx in self._errors if start <= idx < stop]:
+            del self._errors[idx]
+        if stop - start >= self._ring.capacity:
+            idxs = self._ring.idxs
+            idxs[(idxs >= start) & (idxs < stop)] = -1
+            return
+        idxs = numpy.arange(start, stop)
+        slots = idxs % self._ring.capacity
+        stored = self._ring.idxs[slots] == idxs
+        self._ring.idxs[slots[stored]] = -1
 
     def fire_add_event(self, propagate=1):
         """Fires an event to the listeners of the object which owns this
@@ -204,6 +521,9 @@ class SardanaBuffer(EventGenerator):
     def clear(self):
         self._next_idx = 0
         self._buffer = OrderedDict()
+        if self._ring is not None:
+            self._ring.clear()
+            self._errors = {}
 
     def get_last_chunk(self):
         return self._last_chunk
@@ -75,13 +75,61 @@ LOG_MACRO_FILTER = "sardana.macroserver.msmacromanager.LogMacroFilter"
 # Maximum number of Taurus deprecation warnings allowed to be displayed.
 TAURUS_MAX_DEPRECATION_COUNTS = 0
 
-#: Type of encoding for ValueBuffer Tango attribute of experimental channels
+#: Type of encoding for ValueBuffer Tango attribute of experimental channels.
+#: Available options:
+#:
+#: - "pickle" (default)
+#: - "json"
+#: - "binary" - raw NumPy array buffers, decoded without creating Python
+#:   objects per value (recommended for 1D/2D and high-rate channels)
 VALUE_BUFFER_CODEC = "pickle"
 
 #: Type of encoding for ValueRefBuffer Tango attribute of experimental
-#: channels
+#: channels. Available options as for :data:`VALUE_BUFFER_CODEC`.
 VALUE_REF_BUFFER_CODEC = "pickle"
 
+#: Initial capacity (number of values) of the Pool experimental channels
+#: value buffers backed by a ring of NumPy arrays (the ring grows if
+#: necessary). Available options:
+#:
+#: - None (default) - buffers of SardanaValue objects
+#: - int - array backed buffers of the given initial capacity (recommended
+#:   for high-rate hardware synchronized acquisitions)
+VALUE_BUFFER_CAPACITY = None
+
+#: Execute the concurrent hardware requests of the Pool actions (e.g. reading
+#: the state and position of the motors during the motion) in persistent
+#: threads, one for each controller. Available options:
+#:
+#: - False (default) - use the global thread pool (of fixed size)
+#: - True - use the persistent controller readers (recommended for motor
+#:   groups and measurement groups involving many controllers)
+POOL_CONTROLLER_READERS = False
+
+#: Period (in seconds) of writing the memorized attributes to the Tango
+#: database (write-behind mode). The writes are coalesced per attribute and
+#: the pending ones are also written when the device is deleted (e.g. on
+#: server shutdown). The measurement group attributes written on every scan
+#: point (IntegrationTime, NbStarts, Moveable and SynchDescription) are then
+#: memorized by Sardana instead of by Tango. Available options:
+#:
+#: - None (default) - write immediately on every write of the attribute
+#: - float - write at most every given period
+POOL_MEMORIZED_WRITE_PERIOD = None
+
+#: Maximum integration time (in seconds) of the counts (e.g. of the step
+#: scan points) executed by the clients with a single call to the Count
+#: command of the measurement group. The command blocks the measurement
+#: group device until the acquisition ends, so Stop, Abort and the requests
+#: of other clients wait for it. It is used only in the Timer acquisition
+#: mode. Available options:
+#:
+#: - None (default) - prepare, start, wait for and read the acquisition with
+#:   separate requests
+#: - float - use the Count command for integration times up to the given
+#:   one (recommended only for very short ones e.g. 0.01)
+MG_COUNT_COMMAND_MAX_TIME = None
+
 #: Database backend for MacroServer environment implemented using shelve.
 #: Available options:
 #:
@@ -90,8 +138,49 @@ VALUE_REF_BUFFER_CODEC = "pickle"
 #:   additional package e.g. python3-gdbm on Debian. At the time of writing of
 #:   this documentation it is not available for conda.
 #: - "dumb" - worst performance but directly available with Python 3.
+#: - "sqlite" - stores each environment variable in a separate row of an
+#:   SQLite database (file with ".sqlite" suffix). If it does not exist yet,
+#:   the existing shelve environment is migrated to it (the shelve files are
+#:   kept untouched).
 MS_ENV_SHELVE_BACKEND = None
 
+#: Period (in seconds) of synchronizing the MacroServer environment changes
+#: to the database (write-behind mode). The pending changes are also
+#: synchronized when the MacroServer shuts down.
+#: Available options:
+#:
+#: - None (default) - synchronize immediately on every environment change
+#: - float - synchronize at most every given period
+MS_ENV_SYNC_PERIOD = None
+
+#: Maximum number of scans retained in the MacroServer scan history store.
+#: The store is kept next to the environment database (file with
+#: ".scanhistory" suffix).
+MS_SCAN_HISTORY_MAX_SIZE = 1000
+
+#: Mirror the most recent scans of the scan history store in the
+#: ScanHistory environment variable at the end of each scan. Enable it only
+#: for clients which still read the scan history from the environment
+#: (spock showscan queries the MacroServer GetScanHistory command).
+MS_SCAN_HISTORY_ENV = False
+
+#: Cache the metadata (macro names, descriptions, parameters, results and
+#: hints) of the MacroServer macro libraries. The cache is kept next to the
+#: environment database (file with ".macrocache" suffix). Available options:
+#:
+#: - False (default) - import all the macro libraries at startup
+#: - True - import at startup only the macro libraries which changed since
+#:   they were cached, the rest are imported on the first use of their macros
+MS_MACRO_CACHE = False
+
+#: Number of threads validating (importing) the MacroServer macro libraries
+#: at startup. Available options:
+#:
+#: - None (default) - import the macro libraries one by one
+#: - int - import the macro libraries in parallel (recommended when the
+#:   macro libraries import heavy modules)
+MS_MACRO_IMPORT_WORKERS = None
+
 #: macroexecutor maximum number of macros stored in the history. 
 #: Available options:
 #:
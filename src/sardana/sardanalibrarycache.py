@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module is part of the Python Sardana library. It defines the base
+class for the persistent caches of the library (macro and controller
+libraries) metadata"""
+
+__all__ = ["LibraryCache"]
+
+__docformat__ = 'restructuredtext'
+
+import io
+import os
+import pickle
+import hashlib
+import threading
+
+from taurus.core.util.log import Logger
+
+from sardana import release
+
+
+def _file_hash(file_path):
+    with open(file_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler which keeps the identity of the persistent objects"""
+
+    def __init__(self, f, persistent_objects):
+        pickle.Pickler.__init__(self, f, pickle.HIGHEST_PROTOCOL)
+        self._persistent_ids = {id(obj): name for name, obj
+                                in persistent_objects.items()}
+
+    def persistent_id(self, obj):
+        return self._persistent_ids.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, f, persistent_objects):
+        pickle.Unpickler.__init__(self, f)
+        self._persistent_objects = persistent_objects
+
+    def persistent_load(self, pid):
+        try:
+            return self._persistent_objects[pid]
+        except KeyError:
+            raise pickle.UnpicklingError("unsupported persistent object")
+
+
+class LibraryCache(Logger):
+    """Base class of the persistent caches of the libraries metadata.
+
+    The entries are keyed by the library file path and are valid as long as
+    the file does not change: its modification time and size are checked
+    first and, if they differ, the hash of its contents.
+
+    The cache is discarded when the Sardana version changes.
+
+    Subclasses implement :meth:`getMetadata`.
+
+    .. note::
+        The LibraryCache class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    #: version of the cache file format
+    VERSION = 1
+
+    #: objects which identity must be kept (e.g. compared with `is`)
+    #: dict<str, object>
+    PERSISTENT_OBJECTS = {}
+
+    def __init__(self, filename, name="LibraryCache"):
+        self.call__init__(Logger, name)
+        self._filename = filename
+        self._lock = threading.RLock()
+        self._dirty = False
+        # dict<str, dict>
+        # key   - library file path
+        # value - library metadata
+        self._libs = {}
+        self._load()
+
+    @property
+    def filename(self):
+        """The cache file name"""
+        return self._filename
+
+    def _dump(self, obj, f):
+        _Pickler(f, self.PERSISTENT_OBJECTS).dump(obj)
+
+    def _load(self):
+        try:
+            with open(self._filename, "rb") as f:
+                data = _Unpickler(f, self.PERSISTENT_OBJECTS).load()
+        except FileNotFoundError:
+            return
+        except Exception:
+            self.warning("Discarding corrupted cache %s", self._filename)
+            self.debug("Details:", exc_info=1)
+            return
+        if (data.get("version") != self.VERSION
+                or data.get("sardana") != release.version):
+            self.info("Discarding cache of a different version")
+            return
+        self._libs = data["libs"]
+
+    def save(self):
+        """Writes the cache file if it has changed (atomically, so a crash
+        does not leave a corrupted cache)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(version=self.VERSION, sardana=release.version,
+                        libs=self._libs)
+            tmp_filename = self._filename + ".tmp"
+            try:
+                with open(tmp_filename, "wb") as f:
+                    self._dump(data, f)
+                os.replace(tmp_filename, self._filename)
+            except Exception:
+                self.warning("Failed to write cache %s", self._filename)
+                self.debug("Details:", exc_info=1)
+                return
+            self._dirty = False
+
+    def get(self, file_path):
+        """Returns the metadata of the library if the file has not changed
+        since it was cached.
+
+        :param file_path: library file path
+        :type file_path: :obj:`str`
+        :return: the library metadata or None
+        :rtype: :obj:`dict` or None
+        """
+        with self._lock:
+            entry = self._libs.get(file_path)
+            if entry is None:
+                return None
+            try:
+                stat = os.stat(file_path)
+                if (stat.st_mtime, stat.st_size) == (entry["mtime"],
+                                                     entry["size"]):
+                    return entry
+                if _file_hash(file_path) != entry["hash"]:
+                    return None
+            except OSError:
+                return None
+            # the file was touched but not modified
+            entry["mtime"], entry["size"] = stat.st_mtime, stat.st_size
+            self._dirty = True
+            return entry
+
+    def getMetadata(self, lib):
+        """Returns the metadata of the (imported) library to be cached.
+
+        :param lib: library
+        :type lib: :class:`~sardana.sardanameta.SardanaLibrary`
+        :return: the library metadata
+        :rtype: :obj:`dict`
+        """
+        raise NotImplementedError
+
+    def update(self, lib):
+        """Stores the metadata of the (imported) library.
+
+        :param lib: library
+        :type lib: :class:`~sardana.sardanameta.SardanaLibrary`
+        """
+        file_path = lib.file_path
+        try:
+            stat = os.stat(file_path)
+            entry = dict(mtime=stat.st_mtime, size=stat.st_size,
+                         hash=_file_hash(file_path), name=lib.name,
+                         description=lib.description)
+            entry.update(self.getMetadata(lib))
+            # not all the metadata may be serializable e.g. macro hints
+            self._dump(entry, io.BytesIO())
+        except Exception:
+            self.debug("Library %s can not be cached", file_path,
+                       exc_info=1)
+            self.remove(file_path)
+            return
+        with self._lock:
+            self._libs[file_path] = entry
+            self._dirty = True
+
+    def remove(self, file_path):
+        """Removes the metadata of the library
+
+        :param file_path: library file path
+        :type file_path: :obj:`str`
+        """
+        with self._lock:
+            if self._libs.pop(file_path, None) is not None:
+                self._dirty = True
+
+    def __len__(self):
+        return len(self._libs)
+
+    def __contains__(self, file_path):
+        return file_path in self._libs
@@ -203,11 +203,14 @@ class ModuleManager(Singleton, Logger):
         del sys.modules[fake_name]
         return True, None
 
-    def reloadModule(self, module_name, path=None, reload=True):
-        """Loads/reloads the given module name"""
-        valid, _ = self.isValidModule(module_name, path)
-        if not valid:
-            return None
+    def reloadModule(self, module_name, path=None, reload=True,
+                     validate=True):
+        """Loads/reloads the given module name. If validate is False the
+        module is not validated (with :meth:`isValidModule`) first."""
+        if validate:
+            valid, _ = self.isValidModule(module_name, path)
+            if not valid:
+                return None
 
         if not reload:
             return self.loadModule(module_name, path=path)
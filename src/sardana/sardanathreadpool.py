@@ -64,6 +64,23 @@ class OmniWorker(Worker):
                 Worker.run(self)
 
 
+class OmniThread(threading.Thread):
+    """Thread which runs its target in an omni thread (see
+    :class:`OmniWorker`)"""
+
+    def run(self):
+        try:
+            import tango
+        except ImportError:
+            threading.Thread.run(self)
+            return
+        if hasattr(tango, "EnsureOmniThread"):
+            with tango.EnsureOmniThread():
+                threading.Thread.run(self)
+        else:
+            threading.Thread.run(self)
+
+
 def get_thread_pool():
     """Returns the global pool of threads for Sardana
 
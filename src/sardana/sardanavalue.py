@@ -36,6 +36,13 @@ import time
 
 
 class SardanaValue(object):
+    """Value (or error) of a Sardana attribute together with its timestamp.
+
+    Instances do not have a per-instance dictionary (see :attr:`__slots__`)
+    so no other attributes can be set on them (subclasses may add them)."""
+
+    __slots__ = ("value", "error", "exc_info", "timestamp", "dtype",
+                 "dformat")
 
     def __init__(self, value=None, exc_info=None, timestamp=None,
                  dtype=None, dformat=None):
@@ -48,6 +55,31 @@ class SardanaValue(object):
         self.dtype = dtype
         self.dformat = dformat
 
+    @classmethod
+    def from_values(cls, values, timestamp=None):
+        """Create value objects for a chunk of values sharing the same
+        timestamp. Elements which already are value objects are passed
+        unchanged.
+
+        :param values: values
+        :type values: seq<object>
+        :param timestamp: timestamp of the values [default: None, meaning
+                          create a 'now' timestamp]
+        :type timestamp: float or None
+        :return: value objects
+        :rtype: list<:class:`~sardana.sardanavalue.SardanaValue`>
+
+        .. note::
+            The from_values method has been included in Sardana
+            on a provisional basis. Backwards incompatible changes
+            (up to and including its removal) may occur if
+            deemed necessary by the core developers.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        return [value if isinstance(value, SardanaValue)
+                else cls(value, None, timestamp) for value in values]
+
     def __repr__(self):
         v = None
         if self.error:
@@ -449,7 +449,12 @@ class SpockBaseDoor(BaseDoor):
 
     def show_scan(self, scan_nb=None):
         env = self.getEnvironment()
-        scan_history_info = env.get("ScanHistory")
+        serialnos = () if scan_nb is None else (scan_nb,)
+        try:
+            scan_history_info = self.macro_server.getScanHistory(serialnos)
+        except PyTango.DevFailed:
+            # MacroServer without the scan history store
+            scan_history_info = env.get("ScanHistory")
         directory_map = env.get("DirectoryMap")
         self._plotter.show_scan(scan_nb=scan_nb,
                                 scan_history_info=scan_history_info,
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for the memorized attributes writer."""
+
+import time
+import unittest
+
+from taurus.test import insertTest
+
+from sardana.tango.core.util import MemorizedWriter
+
+
+class Database(object):
+    """Tango database which stores the device attribute properties as
+    strings"""
+
+    def __init__(self):
+        self.nb_puts = 0
+        self.props = {}
+
+    def put_device_attribute_property(self, dev_name, attrs):
+        self.nb_puts += 1
+        for attr_name, props in attrs.items():
+            stored = self.props.setdefault((dev_name, attr_name), {})
+            stored.update(props)
+
+
+WRITES = [("mg1", "IntegrationTime", dict(__value=0.1)),
+          ("mg1", "NbStarts", dict(__value=1)),
+          ("mg1", "IntegrationTime", dict(__value=0.2)),
+          ("mg1", "IntegrationTime", dict(__value=0.2)),
+          ("mot1", "Velocity", dict(__value_ts="1.0")),
+          ("mot1", "Velocity", dict(__value="2.0", __value_ts="2.0")),
+          ("mg1", "Moveable", dict(__value="None"))]
+
+EXPECTED = {("mg1", "IntegrationTime"): dict(__value=["0.2"]),
+            ("mg1", "NbStarts"): dict(__value=["1"]),
+            ("mg1", "Moveable"): dict(__value=["None"]),
+            ("mot1", "Velocity"): dict(__value=["2.0"], __value_ts=["2.0"])}
+
+
+@insertTest(helper_name="write", period=None, nb_puts=6, nb_puts_again=4)
+@insertTest(helper_name="write", period=10, nb_puts=2, nb_puts_again=0)
+@insertTest(helper_name="write_behind")
+class MemorizedWriterTestCase(unittest.TestCase):
+
+    def write(self, period, nb_puts, nb_puts_again):
+        """Test that the database stores the last write values regardless of
+        the write-behind mode"""
+        db = Database()
+        writer = MemorizedWriter(period)
+        for dev_name, attr_name, props in WRITES:
+            writer.write(db, dev_name, attr_name, props)
+        writer.flush("mot1")
+        writer.flush("mg1")
+        self.assertEqual(db.props, EXPECTED)
+        # unchanged write values are not written
+        self.assertEqual(db.nb_puts, nb_puts)
+        for dev_name, attr_name, props in WRITES:
+            writer.write(db, dev_name, attr_name, props)
+        writer.flush()
+        self.assertEqual(db.props, EXPECTED)
+        self.assertEqual(db.nb_puts, nb_puts + nb_puts_again)
+
+    def write_behind(self):
+        """Test that the pending writes are written periodically"""
+        db = Database()
+        writer = MemorizedWriter(0.05)
+        writer.set_stored("mg1", "NbStarts", dict(__value="1"))
+        for dev_name, attr_name, props in WRITES:
+            writer.write(db, dev_name, attr_name, props)
+        self.assertEqual(db.nb_puts, 0)
+        # wait for the periodic write, with margin for loaded hosts
+        timeout = time.time() + 5
+        while db.nb_puts < 2 and time.time() < timeout:
+            time.sleep(0.05)
+        # NbStarts was already stored
+        expected = dict(EXPECTED)
+        expected.pop(("mg1", "NbStarts"))
+        self.assertEqual(db.props, expected)
+        self.assertEqual(db.nb_puts, 2)
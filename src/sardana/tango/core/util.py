@@ -31,7 +31,8 @@ __all__ = ["get_tango_version_str", "get_tango_version_number",
            "get_pytango_version_str", "get_pytango_version_number",
            "exception_str",
            "GenericScalarAttr", "GenericSpectrumAttr", "GenericImageAttr",
-           "memorize_write_attribute",
+           "memorize_write_attribute", "MemorizedWriter",
+           "get_memorized_writer",
            "tango_protect", "to_tango_state", "to_tango_type_format",
            "to_tango_access", "to_tango_attr_info",
            "from_tango_access", "from_tango_type_format",
@@ -48,6 +49,7 @@ import logging
 import os.path
 import traceback
 import itertools
+import threading
 
 import PyTango
 from PyTango import Util, Database, WAttribute, DbDevInfo, DevFailed, \
@@ -314,6 +316,155 @@ def _check_attr_range(dev_name, attr_name, attr_value):
             raise ValueError(msg)
 
 
+class MemorizedWriter(Logger):
+    """Writer of the memorized attributes properties (e.g. ``__value`` and
+    ``__value_ts``) to the Tango database.
+
+    The properties are written immediately or, if a period is given, in
+    write-behind mode: the writes are coalesced per attribute (the latest
+    wins) and put in the database at most every period and when the device
+    is deleted (see :meth:`flush`). In both modes the writes which do not
+    change the already stored properties are skipped.
+
+    .. note::
+        The MemorizedWriter class has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+    """
+
+    def __init__(self, period=None, name="MemorizedWriter"):
+        Logger.__init__(self, name)
+        self._period = period
+        self._lock = threading.RLock()
+        # dev_name -> (db, {attr_name: props})
+        self._pending = {}
+        # (dev_name, attr_name) -> props
+        self._stored = {}
+        self._timer = None
+
+    @property
+    def period(self):
+        """Period of writing the properties (None means immediately)"""
+        return self._period
+
+    @staticmethod
+    def _to_db_props(props):
+        db_props = {}
+        for name, value in props.items():
+            if isinstance(value, str):
+                value = [value]
+            elif isinstance(value, (list, tuple)):
+                value = [str(v) for v in value]
+            else:
+                value = [str(value)]
+            db_props[name] = value
+        return db_props
+
+    def set_stored(self, dev_name, attr_name, props):
+        """Let the writer know the properties already stored in the database
+        e.g. when restoring the attribute
+
+        :param dev_name: device name
+        :type dev_name: :obj:`str`
+        :param attr_name: attribute name
+        :type attr_name: :obj:`str`
+        :param props: attribute properties
+        :type props: :obj:`dict`
+        """
+        with self._lock:
+            self._stored[(dev_name, attr_name)] = self._to_db_props(props)
+
+    def write(self, db, dev_name, attr_name, props):
+        """Write the attribute properties to the database
+
+        :param db: Tango database
+        :type db: :class:`~PyTango.Database`
+        :param dev_name: device name
+        :type dev_name: :obj:`str`
+        :param attr_name: attribute name
+        :type attr_name: :obj:`str`
+        :param props: attribute properties
+        :type props: :obj:`dict`
+        """
+        props = self._to_db_props(props)
+        key = dev_name, attr_name
+        with self._lock:
+            attrs = self._pending.get(dev_name, (db, {}))[1]
+            pending = attrs.get(attr_name)
+            if pending is None:
+                stored = self._stored.get(key, {})
+                if all(stored.get(name) == value
+                       for name, value in props.items()):
+                    return
+            else:
+                props = dict(pending, **props)
+            if not self._period:
+                self._put(db, dev_name, {attr_name: props})
+                return
+            attrs[attr_name] = props
+            self._pending[dev_name] = db, attrs
+            if self._timer is None:
+                self._timer = threading.Timer(self._period, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _put(self, db, dev_name, attrs):
+        db.put_device_attribute_property(dev_name, attrs)
+        for attr_name, props in attrs.items():
+            key = dev_name, attr_name
+            self._stored[key] = dict(self._stored.get(key, {}), **props)
+
+    def flush(self, dev_name=None):
+        """Put the pending writes in the database
+
+        :param dev_name: device name (None means all devices)
+        :type dev_name: :obj:`str`
+        """
+        with self._lock:
+            if dev_name is None:
+                pending, self._pending = self._pending, {}
+            elif dev_name in self._pending:
+                pending = {dev_name: self._pending.pop(dev_name)}
+            else:
+                return
+            if self._timer is not None and len(self._pending) == 0:
+                self._timer.cancel()
+                self._timer = None
+            for name, (db, attrs) in pending.items():
+                # the coalesced writes may end up with the stored values
+                for attr_name, props in list(attrs.items()):
+                    stored = self._stored.get((name, attr_name), {})
+                    if all(stored.get(prop_name) == value
+                           for prop_name, value in props.items()):
+                        del attrs[attr_name]
+                if len(attrs) == 0:
+                    continue
+                try:
+                    self._put(db, name, attrs)
+                except Exception:
+                    self.warning("Could not memorize attributes of %s", name)
+                    self.debug("Details:", exc_info=1)
+
+
+__memorized_writer = None
+
+
+def get_memorized_writer():
+    """Return the memorized attributes writer of the server (its period is
+    given by the POOL_MEMORIZED_WRITE_PERIOD custom setting)
+
+    :return: memorized attributes writer
+    :rtype: :class:`MemorizedWriter`"""
+    global __memorized_writer
+    if __memorized_writer is None:
+        from sardana import sardanacustomsettings
+        period = getattr(sardanacustomsettings,
+                         "POOL_MEMORIZED_WRITE_PERIOD", None)
+        __memorized_writer = MemorizedWriter(period)
+    return __memorized_writer
+
+
 def memorize_write_attribute(write_attr_func):
     """The main purpose is to use this as a decorator for write_<attr_name>
        device methods.
@@ -357,8 +508,8 @@ def memorize_write_attribute(write_attr_func):
             attr_values = dict(__value_ts=store[1])
             if store_value:
                 attr_values['__value'] = store[0]
-            db.put_device_attribute_property(
-                dev_name, {attr_name: attr_values})
+            get_memorized_writer().write(db, dev_name, attr_name,
+                                         attr_values)
         return ret
 
     return write_attr_wrapper
@@ -29,7 +29,8 @@ import os.path
 import sys
 
 from PyTango import Util, Except, DevVoid, DevLong, DevString, DevState, \
-    DevEncoded, DevVarStringArray, READ, READ_WRITE, SCALAR, SPECTRUM, DebugIt
+    DevEncoded, DevVarStringArray, DevVarLongArray, READ, READ_WRITE, \
+    SCALAR, SPECTRUM, DebugIt
 
 import taurus
 from taurus.core.util.codecs import CodecFactory
@@ -66,6 +67,8 @@ class MacroServer(SardanaDevice):
     def delete_device(self):
         SardanaDevice.delete_device(self)
         self._macro_server.clear_log_report()
+        # synchronize the pending (write-behind) environment changes
+        self._macro_server.environment_manager.flush()
         # Workaround for bug #494.
         factory = taurus.Factory("tango")
         for attr in list(factory.tango_attrs.values()):
@@ -267,6 +270,26 @@ class MacroServer(SardanaDevice):
 
         return ret
 
+    def GetScanHistory(self, serialnos):
+        """GetScanHistory(sequence<long> serialnos):
+
+           Returns the scan history entries.
+
+           Params:
+               - serialnos: a list of scan serial numbers or an empty list
+                 for all the scans kept in the scan history
+           Returns:
+               - a JSON encoded list of the scan history entries
+        """
+        scan_history = self.macro_server.scan_history
+        if len(serialnos) == 0:
+            entries = scan_history.getLast()
+        else:
+            entries = [scan_history.get(serialno) for serialno in serialnos]
+            entries = [entry for entry in entries if entry is not None]
+        codec = CodecFactory().getCodec('json')
+        return codec.encode(('', entries))[1]
+
     def ReloadMacro(self, macro_names):
         """ReloadMacro(list<string> macro_names):"""
         try:
@@ -419,6 +442,9 @@ class MacroServerClass(SardanaDeviceClass):
         'GetMacroInfo':
             [[DevVarStringArray, "Macro(s) name(s)"],
              [DevVarStringArray, "Macro(s) description(s)"]],
+        'GetScanHistory':
+            [[DevVarLongArray, "Scan(s) serial number(s) (empty for all)"],
+             [DevString, "Scan history entries (a JSON encoded list)"]],
         'ReloadMacro':
             [[DevVarStringArray, "Macro(s) name(s)"],
              [DevVarStringArray, "[OK] if successfull or a traceback "
@@ -45,7 +45,7 @@ from sardana.pool.poolexception import PoolException
 from sardana.sardanautils import str_to_value
 
 from sardana.tango.core.util import exception_str, throw_sardana_exception, \
-    to_tango_type_format
+    to_tango_type_format, get_memorized_writer
 from sardana.tango.pool.PoolDevice import PoolElementDevice, \
     PoolElementDeviceClass
 
@@ -70,10 +70,10 @@ class IORegister(PoolElementDevice):
     def set_write_value_to_db(self):
         value_attr = self.ior.get_value_attribute()
         if value_attr.has_write_value():
-            data = dict(Value=dict(__value=value_attr.w_value,
-                                   __value_ts=value_attr.w_timestamp))
+            props = dict(__value=value_attr.w_value,
+                         __value_ts=value_attr.w_timestamp)
             db = self.get_database()
-            db.put_device_attribute_property(self.get_name(), data)
+            get_memorized_writer().write(db, self.get_name(), 'Value', props)
 
     def get_write_value_from_db(self):
         name = 'Value'
@@ -30,10 +30,12 @@ __all__ = ["MeasurementGroup", "MeasurementGroupClass"]
 __docformat__ = 'restructuredtext'
 
 import sys
+import math
 import time
 
 from PyTango import Except, DevVoid, DevLong, DevDouble, DevString, \
-    DispLevel, DevState, AttrQuality, READ, READ_WRITE, SCALAR, Util
+    DevEncoded, DispLevel, DevState, AttrQuality, READ, READ_WRITE, SCALAR, \
+    Util
 
 from taurus.core.util.codecs import CodecFactory
 from taurus.core.util.log import DebugIt
@@ -42,7 +44,8 @@ from sardana import State, SardanaServer
 from sardana.sardanaattribute import SardanaAttribute
 from sardana.pool import AcqMode
 from sardana.pool.pooldefs import SynchDomain, SynchParam
-from sardana.tango.core.util import exception_str
+from sardana.tango.core.util import exception_str, get_memorized_writer
+from sardana.util.codec import register_codecs
 from sardana.tango.pool.PoolDevice import PoolGroupDevice, PoolGroupDeviceClass
 
 
@@ -50,6 +53,8 @@ class MeasurementGroup(PoolGroupDevice):
 
     def __init__(self, dclass, name):
         PoolGroupDevice.__init__(self, dclass, name)
+        register_codecs()
+        self._values_codec = CodecFactory().getCodec('binary')
 
     def init(self, name):
         PoolGroupDevice.init(self, name)
@@ -100,6 +105,9 @@ class MeasurementGroup(PoolGroupDevice):
                                                    user_elements=self.Elements)
         mg.add_listener(self.on_measurement_group_changed)
 
+        if self.in_constructor and get_memorized_writer().period:
+            self._restore_write_behind_memorized()
+
         # force a state read to initialize the state attribute
         # state = self.measurement_group.state
         self.set_state(DevState.ON)
@@ -193,6 +201,34 @@ class MeasurementGroup(PoolGroupDevice):
         pass
         # state = to_tango_state(self.motor_group.get_state(cache=False))
 
+    def _restore_write_behind_memorized(self):
+        """Restore the attributes memorized in write-behind mode (the Tango
+        memorization restores the rest of them)"""
+        attr_names = MeasurementGroupClass.write_behind_memorized
+        db = self.get_database()
+        db_values = db.get_device_attribute_property(self.get_name(),
+                                                     attr_names)
+        multi_attribute = self.get_device_attr()
+        writer = get_memorized_writer()
+        for attr_name in attr_names:
+            props = db_values[attr_name]
+            if props is None or "__value" not in props:
+                continue
+            writer.set_stored(self.get_name(), attr_name,
+                              dict(__value=props["__value"]))
+            attribute = multi_attribute.get_w_attr_by_name(attr_name)
+            write_meth = getattr(self, "write_" + attr_name)
+            self.restore_attribute(attribute, write_meth, props["__value"])
+
+    def _memorize_write_behind(self, attr):
+        """Memorize the write value of the attribute in write-behind mode
+        (if enabled)"""
+        writer = get_memorized_writer()
+        if not writer.period:
+            return
+        writer.write(self.get_database(), self.get_name(), attr.get_name(),
+                     dict(__value=attr.get_write_value()))
+
     def read_attr_hardware(self, data):
         pass
 
@@ -204,6 +240,7 @@ class MeasurementGroup(PoolGroupDevice):
 
     def write_IntegrationTime(self, attr):
         self.measurement_group.integration_time = attr.get_write_value()
+        self._memorize_write_behind(attr)
 
     def read_MonitorCount(self, attr):
         it = self.measurement_group.monitor_count
@@ -252,6 +289,7 @@ class MeasurementGroup(PoolGroupDevice):
 
     def write_NbStarts(self, attr):
         self.measurement_group.nb_starts = attr.get_write_value()
+        self._memorize_write_behind(attr)
 
     def read_Moveable(self, attr):
         moveable = self.measurement_group.moveable
@@ -264,6 +302,7 @@ class MeasurementGroup(PoolGroupDevice):
         if moveable == 'None':
             moveable = None
         self.measurement_group.moveable = moveable
+        self._memorize_write_behind(attr)
 
     def read_SynchDescription(self, attr):
         synch_description = self.measurement_group.synch_description
@@ -278,6 +317,7 @@ class MeasurementGroup(PoolGroupDevice):
         synch_description = \
             self._synch_description_str2enum(synch_description)
         self.measurement_group.synch_description = synch_description
+        self._memorize_write_behind(attr)
 
     def read_LatencyTime(self, attr):
         latency_time = self.measurement_group.latency_time
@@ -306,6 +346,21 @@ class MeasurementGroup(PoolGroupDevice):
             raise Exception("Cannot acquire: already involved in an operation")
         self.measurement_group.start_acquisition()
 
+    def Count(self, integration_time):
+        """Count and return the encoded values of the enabled channels.
+
+        The command blocks the device until the acquisition ends, so the
+        Stop or Abort commands sent in the meantime wait for it to finish.
+        """
+        try:
+            self.wait_for_operation()
+        except:
+            raise Exception("Cannot acquire: already involved in an operation")
+        if math.isnan(integration_time):
+            integration_time = None
+        values = self.measurement_group.count(integration_time)
+        return self._values_codec.encode(('', values))
+
     def Stop(self):
         self.measurement_group.stop()
 
@@ -324,7 +379,10 @@ class MeasurementGroupClass(PoolGroupDeviceClass):
     #    Command definitions
     cmd_list = {
         'Prepare': [[DevVoid, ""], [DevVoid, ""]],
-        'Start': [[DevVoid, ""], [DevVoid, ""]]
+        'Start': [[DevVoid, ""], [DevVoid, ""]],
+        'Count': [[DevDouble, "integration time (NaN to start the prepared "
+                              "acquisition)"],
+                  [DevEncoded, "binary encoded channels values"]]
     }
     cmd_list.update(PoolGroupDeviceClass.cmd_list)
 
@@ -362,6 +420,24 @@ class MeasurementGroupClass(PoolGroupDeviceClass):
     }
     attr_list.update(PoolGroupDeviceClass.attr_list)
 
+    #: Attributes written on every scan point. When the memorized attributes
+    #: are written in write-behind mode (see POOL_MEMORIZED_WRITE_PERIOD)
+    #: they are memorized by the device instead of by Tango (which writes
+    #: the database on every write).
+    write_behind_memorized = ["IntegrationTime", "NbStarts", "Moveable",
+                              "SynchDescription"]
+
+    def __init__(self, name):
+        PoolGroupDeviceClass.__init__(self, name)
+        if get_memorized_writer().period:
+            attr_list = dict(self.attr_list)
+            for attr_name in self.write_behind_memorized:
+                data_info, attr_info = attr_list[attr_name]
+                attr_info = dict(attr_info)
+                del attr_info['Memorized']
+                attr_list[attr_name] = [data_info, attr_info]
+            self.attr_list = attr_list
+
     def _get_class_properties(self):
         ret = PoolGroupDeviceClass._get_class_properties(self)
         ret['Description'] = "Measurement group device class"
@@ -33,8 +33,8 @@ import sys
 import time
 
 from PyTango import DevFailed, Except, DevVoid, DevShort, \
-    DevLong, DevDouble, DevBoolean, DispLevel, DevState, AttrQuality, \
-    READ, READ_WRITE, SCALAR, SPECTRUM
+    DevLong, DevDouble, DevBoolean, DevString, DispLevel, DevState, \
+    AttrQuality, READ, READ_WRITE, SCALAR, SPECTRUM
 
 from taurus.core.util.log import DebugIt
 
@@ -43,7 +43,7 @@ from sardana.sardanautils import str_to_value
 from sardana.sardanaattribute import SardanaAttribute
 from sardana.pool.poolexception import PoolException
 from sardana.tango.core.util import memorize_write_attribute, exception_str, \
-    to_tango_type_format, throw_sardana_exception
+    to_tango_type_format, throw_sardana_exception, get_memorized_writer
 from sardana.tango.pool.PoolDevice import PoolElementDevice, \
     PoolElementDeviceClass
 
@@ -235,6 +235,10 @@ attributes specified on the controller with
   managing a motor movement will wait between it detects the end of the
   motion and the last motor position reading.
 
+- **MotionLoop_Policy** : This property selects the sleep time policy of
+  the software managing a motor movement: *Fixed* or *Adaptive*. If empty
+  (default), the Pool *MotionLoop_Policy* property is used.
+
 .. rubric:: Getting motor state and limit switches using event
 
 The simplest way to know if a motor is moving is to survey its state.
@@ -295,10 +299,10 @@ with this value is sent to clients using events.
     def set_write_dial_position_to_db(self):
         dial = self.motor.get_dial_position_attribute()
         if dial.has_write_value():
-            data = dict(DialPosition=dict(
-                __value=dial.w_value, __value_ts=dial.w_timestamp))
+            props = dict(__value=dial.w_value, __value_ts=dial.w_timestamp)
             db = self.get_database()
-            db.put_device_attribute_property(self.get_name(), data)
+            get_memorized_writer().write(db, self.get_name(), 'DialPosition',
+                                         props)
 
     def get_write_dial_position_from_db(self):
         name = 'DialPosition'
@@ -350,6 +354,8 @@ with this value is sent to clients using events.
 
         if self.Sleep_bef_last_read > 0:
             motor.set_instability_time(self.Sleep_bef_last_read / 1000)
+        if self.MotionLoop_Policy:
+            motor.set_motion_loop_policy(self.MotionLoop_Policy)
         motor.add_listener(self.on_motor_changed)
         self.set_state(DevState.ON)
 
@@ -626,6 +632,10 @@ class MotorClass(PoolElementDeviceClass):
         'Sleep_bef_last_read': [DevLong,
                                 "Number of mS to sleep before the last read during a motor "
                                 "movement", 0],
+        'MotionLoop_Policy': [DevString,
+                              "Sleep time policy of the motion loop (Fixed or "
+                              "Adaptive). Empty means use the Pool policy",
+                              ""],
         '_Acceleration': [DevDouble, "", -1],
         '_Deceleration': [DevDouble, "", -1],
         '_Velocity': [DevDouble, "", -1],
@@ -44,6 +44,7 @@ from sardana import State, SardanaServer, ElementType, Interface, \
     TYPE_ACQUIRABLE_ELEMENTS, TYPE_PSEUDO_ELEMENTS
 from sardana.pool.pool import Pool as POOL
 from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
+from sardana.pool.poolmotion import MotionLoopPolicy
 from sardana.tango.core.util import get_tango_version_number
 import collections
 
@@ -116,13 +117,20 @@ class Pool(PyTango.Device_4Impl, Logger):
         self.get_device_properties(self.get_device_class())
         p = self.pool
         p.set_python_path(self.PythonPath)
+        p.set_controller_cache(self.ControllerCache or None)
         p.set_path(self.PoolPath)
         p.set_motion_loop_sleep_time(self.MotionLoop_SleepTime / 1000)
         p.set_motion_loop_states_per_position(
             self.MotionLoop_StatesPerPosition)
+        p.set_motion_loop_policy(self.MotionLoop_Policy)
         p.set_acq_loop_sleep_time(self.AcqLoop_SleepTime / 1000)
         p.set_acq_loop_states_per_value(self.AcqLoop_StatesPerValue)
+        p.set_acq_loop_notification_timeout(
+            self.AcqLoop_NotificationTimeout / 1000)
         p.set_drift_correction(self.DriftCorrection)
+        p.set_monitor_concurrent(self.Monitor_Concurrent)
+        # 0 means the monitor period
+        p.set_monitor_ctrl_timeout(self.Monitor_CtrlTimeout / 1000 or None)
         if self.RemoteLog is None:
             p.clear_remote_logging()
         else:
@@ -1345,6 +1353,13 @@ class PoolClass(PyTango.DeviceClass):
              "Number of State reads done before doing a position read in the "
              "motion loop [default: %d]" % POOL.Default_MotionLoop_StatesPerPosition,
              POOL.Default_MotionLoop_StatesPerPosition],
+        'MotionLoop_Policy':
+            [PyTango.DevString,
+             "Sleep time policy of the motion loop: Fixed (sleep time) or "
+             "Adaptive (poll quickly close to the expected end of motion "
+             "and back off during long motions) [default: %s]" %
+             MotionLoopPolicy.whatis(POOL.Default_MotionLoop_Policy),
+             MotionLoopPolicy.whatis(POOL.Default_MotionLoop_Policy)],
         'AcqLoop_SleepTime':
             [PyTango.DevLong,
              "Sleep time in the acquisition loop in mS [default: %dms]" %
@@ -1355,6 +1370,32 @@ class PoolClass(PyTango.DeviceClass):
              "Number of State reads done before doing a value read in the "
              "acquisition loop [default: %d]" % POOL.Default_AcqLoop_StatesPerValue,
              POOL.Default_AcqLoop_StatesPerValue],
+        'AcqLoop_NotificationTimeout':
+            [PyTango.DevLong,
+             "Maximum time the acquisition loop waits for a notification of "
+             "the notifier controllers before reading the state in mS "
+             "[default: %dms]" %
+             int(POOL.Default_AcqLoop_NotificationTimeout * 1000),
+             int(POOL.Default_AcqLoop_NotificationTimeout * 1000)],
+        'Monitor_Concurrent':
+            [PyTango.DevBoolean,
+             "Read the state of the controllers concurrently in the pool "
+             "monitor (the controllers which do not answer within the "
+             "Monitor_CtrlTimeout are skipped until they answer) "
+             "[default: %d]" % POOL.Default_Monitor_Concurrent,
+             POOL.Default_Monitor_Concurrent],
+        'Monitor_CtrlTimeout':
+            [PyTango.DevLong,
+             "Time the pool monitor waits for a controller in the concurrent "
+             "mode in mS [default: 0 - the monitor period]",
+             0],
+        'ControllerCache':
+            [PyTango.DevString,
+             "Controller libraries metadata cache file. The controller "
+             "libraries which did not change since they were cached are "
+             "imported only when their controllers are created "
+             "[default: None - no cache]",
+             None],
         'RemoteLog':
             [PyTango.DevString,
              "Logging (python logging) host:port [default: None]",
@@ -40,14 +40,16 @@ from PyTango import Util, DevVoid, DevLong64, DevBoolean, DevString,\
     seqStr_2_obj, Except, ErrSeverity
 
 from taurus.core.util.containers import CaselessDict
-from taurus.core.util.codecs import CodecFactory
+from taurus.core.util.codecs import CodecFactory, PickleCodec
 
 from sardana import InvalidId, InvalidAxis, ElementType
 from sardana import sardanacustomsettings
+from sardana.sardanabuffer import BufferChunk
+from sardana.util.codec import BinaryCodec, register_codecs
 from sardana.pool.poolmetacontroller import DataInfo
 from sardana.tango.core.SardanaDevice import SardanaDevice, SardanaDeviceClass
 from sardana.tango.core.util import GenericScalarAttr, GenericSpectrumAttr, \
-    GenericImageAttr, to_tango_attr_info
+    GenericImageAttr, to_tango_attr_info, get_memorized_writer
 
 
 class PoolDevice(SardanaDevice):
@@ -116,6 +118,8 @@ class PoolDevice(SardanaDevice):
         Override when necessary but **always** call the method from your super
         class"""
         SardanaDevice.delete_device(self)
+        # write the memorized attributes pending in write-behind mode
+        get_memorized_writer().flush(self.get_name())
 
     def Abort(self):
         """The tango abort command. Aborts the active operation"""
@@ -856,6 +860,7 @@ class PoolExpChannelDevice(PoolElementDevice):
     def __init__(self, dclass, name):
         """Constructor"""
         PoolElementDevice.__init__(self, dclass, name)
+        register_codecs()
         codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
         self._value_buffer_codec = CodecFactory().getCodec(codec_name)
         codec_name = getattr(sardanacustomsettings, "VALUE_REF_BUFFER_CODEC")
@@ -865,17 +870,28 @@ class PoolExpChannelDevice(PoolElementDevice):
         """Prepare value chunk to be passed via communication channel.
 
         :param value_chunk: value chunk
-        :type value_chunk: seq<SardanaValue>
+        :type value_chunk: seq<SardanaValue> or
+            :class:`~sardana.sardanabuffer.BufferChunk`
 
         :return: json string representing value chunk
         :rtype: str"""
+        codec = self._value_buffer_codec
+        if isinstance(value_chunk, BufferChunk) and not value_chunk.errors:
+            index = value_chunk.indexes
+            value = value_chunk.value_array
+            # only some codecs can encode the arrays (e.g. json can not)
+            if not isinstance(codec, (BinaryCodec, PickleCodec)):
+                index = index.tolist()
+                value = value.tolist()
+            data = dict(index=index, value=value)
+            return codec.encode(('', data))
         index = []
         value = []
         for idx, sdn_value in value_chunk.items():
             index.append(idx)
             value.append(sdn_value.value)
         data = dict(index=index, value=value)
-        encoded_data = self._value_buffer_codec.encode(('', data))
+        encoded_data = codec.encode(('', data))
         return encoded_data
 
     def _encode_value_ref_chunk(self, value_ref_chunk):
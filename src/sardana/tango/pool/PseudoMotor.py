@@ -32,6 +32,8 @@ __docformat__ = 'restructuredtext'
 import sys
 import time
 
+import numpy
+
 from PyTango import DevFailed, Except, READ_WRITE, SCALAR, DevVoid, \
     DevDouble, DevBoolean, DevVarStringArray, DevVarDoubleArray, DevState, \
     AttrQuality
@@ -248,6 +250,26 @@ class PseudoMotor(PoolElementDevice):
             throw_sardana_exception(result)
         return result.value
 
+    def CalcPhysicalArray(self, pseudo_positions):
+        """Returns the physical motor positions for many pseudo motor
+        positions (flattened array, one row of physical positions for each
+        pseudo position) assuming the current pseudo motor write positions for
+        all the other sibling pseudo motors"""
+        result = self.pseudo_motor.calc_physical_array(pseudo_positions)
+        if result.error:
+            throw_sardana_exception(result)
+        return result.value.ravel()
+
+    def CalcAllPseudoArray(self, physical_positions):
+        """Returns the pseudo motor positions for many points of physical
+        positions (flattened arrays, one row for each point)"""
+        n = len(self.pseudo_motor.get_user_elements())
+        physical_positions = numpy.reshape(physical_positions, (-1, n))
+        result = self.pseudo_motor.calc_all_pseudo_array(physical_positions)
+        if result.error:
+            throw_sardana_exception(result)
+        return result.value.ravel()
+
     def MoveRelative(self, argin):
         raise NotImplementedError
 
@@ -283,6 +305,13 @@ class PseudoMotorClass(PoolElementDeviceClass):
         'CalcPhysical': [[DevDouble, "pseudo position"], [DevVarDoubleArray, "physical positions"]],
         'CalcAllPseudo': [[DevVarDoubleArray, "physical positions"], [DevVarDoubleArray, "pseudo positions"]],
         'CalcAllPhysical': [[DevVarDoubleArray, "pseudo positions"], [DevVarDoubleArray, "physical positions"]],
+        'CalcPhysicalArray': [[DevVarDoubleArray, "pseudo positions"],
+                              [DevVarDoubleArray,
+                               "physical positions (flattened)"]],
+        'CalcAllPseudoArray': [[DevVarDoubleArray,
+                                "physical positions (flattened)"],
+                               [DevVarDoubleArray,
+                                "pseudo positions (flattened)"]],
         'MoveRelative': [[DevDouble, "amount to move"], [DevVoid, ""]],
     }
     cmd_list.update(PoolElementDeviceClass.cmd_list)
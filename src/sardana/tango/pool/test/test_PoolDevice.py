@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.tango-controls.org/static/sardana/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import types
+import unittest
+
+import numpy
+from taurus.test import insertTest
+from taurus.core.util.codecs import CodecFactory
+
+from sardana.sardanabuffer import BufferChunk
+from sardana.sardanavalue import SardanaValue
+from sardana.util.codec import register_codecs
+from sardana.tango.pool.PoolDevice import PoolExpChannelDevice
+
+
+@insertTest(helper_name="encode_value_chunk", codec_name="json")
+@insertTest(helper_name="encode_value_chunk", codec_name="pickle")
+@insertTest(helper_name="encode_value_chunk", codec_name="binary")
+@insertTest(helper_name="encode_value_chunk", codec_name="json",
+            array_backed=False)
+class EncodeValueChunkTestCase(unittest.TestCase):
+    """Test the encoding of the experimental channels value chunks"""
+
+    def encode_value_chunk(self, codec_name, array_backed=True):
+        register_codecs()
+        codec = CodecFactory().getCodec(codec_name)
+        device = types.SimpleNamespace(_value_buffer_codec=codec)
+        values = [1.5, 2.5, 3.5]
+        if array_backed:
+            chunk = BufferChunk(2, numpy.array(values), numpy.zeros(3))
+        else:
+            chunk = {idx: SardanaValue(value) for idx, value
+                     in enumerate(values, 2)}
+        encoded_data = PoolExpChannelDevice._encode_value_chunk(device,
+                                                                chunk)
+        _, data = codec.decode(encoded_data)
+        self.assertEqual(list(data["index"]), [2, 3, 4])
+        self.assertEqual(list(data["value"]), values)
@@ -693,6 +693,35 @@ class BaseDoor(MacroServerDevice):
     def processRecordData(self, data):
         pass
 
+    @staticmethod
+    def splitRecordData(packet):
+        """Split a record data packet of type *record_data_batch* (records
+        data in columns) into packets of type *record_data* (one per record).
+        Packets of other types are returned unchanged.
+
+        :param packet: record data packet
+        :type packet: dict
+        :return: record data packets
+        :rtype: list<dict>
+
+        .. note::
+            The splitRecordData method has been included in Sardana
+            on a provisional basis. Backwards incompatible changes
+            (up to and including its removal) may occur if
+            deemed necessary by the core developers.
+        """
+        if packet.get('type') != 'record_data_batch':
+            return [packet]
+        batch = packet['data']
+        names = list(batch.keys())
+        packets = []
+        for values in zip(*batch.values()):
+            record = dict(packet)
+            record['type'] = 'record_data'
+            record['data'] = dict(zip(names, values))
+            packets.append(record)
+        return packets
+
     def macroStatusReceived(self, s, t, v):
         if v is None or self._running_macros is None:
             return
@@ -1016,6 +1045,24 @@ class BaseMacroServer(MacroServerDevice):
             "TwoDExpChannel", "PseudoCounter"
         return self.getElementsOfTypes(channel_types)
 
+    def getScanHistory(self, serialnos=()):
+        """Returns the scan history entries kept by the MacroServer.
+
+        .. note::
+            The getScanHistory method has been included in Sardana
+            on a provisional basis. Backwards incompatible changes
+            (up to and including its removal) may occur if
+            deemed necessary by the core developers.
+
+        :param serialnos: scan serial numbers (empty for all the scans kept
+            in the scan history)
+        :type serialnos: seq<int>
+        :return: scan history entries in order of the scans
+        :rtype: list<dict>
+        """
+        data = self.command_inout("GetScanHistory", list(serialnos))
+        return CodecFactory().decode(('json', data))
+
     # -~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
     # Macro API
     # -~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
@@ -30,7 +30,8 @@ It contains specific part of sardana device pool"""
 __all__ = ["InterruptException", "StopException", "AbortException",
            "ReleaseException",
            "BaseElement", "ControllerClass", "ControllerLibrary",
-           "PoolElement", "Controller", "ComChannel", "ExpChannel",
+           "StateEventWait", "PoolElement", "Controller", "ComChannel",
+           "ExpChannel",
            "CTExpChannel", "ZeroDExpChannel", "OneDExpChannel",
            "TwoDExpChannel", "PseudoCounter", "Motor", "PseudoMotor",
            "MotorGroup", "TriggerGate",
@@ -68,6 +69,7 @@ from taurus.core.util.event import EventGenerator, AttributeEventWait, \
 from taurus.core.tango import TangoDevice, FROM_TANGO_TO_STR_TYPE
 
 from sardana import sardanacustomsettings
+from sardana.util.codec import register_codecs
 from .sardana import BaseSardanaElementContainer, BaseSardanaElement
 from .motion import Moveable, MoveableSource
 
@@ -267,6 +269,67 @@ class TangoAttributeEG(Logger, EventGenerator):
         return getattr(self._attr, name)
 
 
+class StateEventWait(AttributeEventWait):
+    """Long-lived waiter of the state events of a Pool element.
+
+    It stays connected to the state attribute so the consecutive operations
+    of the element reuse the same event subscription. Every started
+    operation is identified by a monotonic operation id.
+
+    .. note::
+        The StateEventWait class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including its removal) may occur if
+        deemed necessary by the core developers.
+    """
+
+    def __init__(self, attr):
+        AttributeEventWait.__init__(self, attr)
+        self._operation_id = 0
+
+    def getOperationId(self):
+        """Returns the id of the last started operation
+
+        :return: operation id (0 if no operation was started)
+        :rtype: int
+        """
+        return self._operation_id
+
+    def waitReady(self, timeout=None):
+        """Wait until the last recorded state is different than MOVING
+
+        :param timeout: optional timeout (seconds)
+        :type timeout: float
+        """
+        last_val = self.getLastRecordedEvent()
+        if last_val is not None and last_val != DevState.MOVING:
+            return
+        after = self.getRecordedEvent(DevState.MOVING) or 0
+        self.waitEvent(DevState.MOVING, after=after, equal=False,
+                       timeout=timeout)
+
+    def startOperation(self):
+        """Start a new operation: forget the events of the previous ones.
+
+        :return: id of the new operation
+        :rtype: int
+        """
+        self.lock()
+        try:
+            # Clear event set to not confuse the events of the previous
+            # operations with the events of the new one. This was observed
+            # on Windows where the time stamp resolution is very poor.
+            last_val = self.getLastRecordedEvent()
+            self.clearEventSet()
+            # keep the last state for waitReady - no new event may come
+            # if the element is already ready
+            self._last_val = last_val
+            self._operation_id += 1
+            return self._operation_id
+        finally:
+            self.unlock()
+
+
 def reservedOperation(fn):
     def new_fn(*args, **kwargs):
         self = args[0]
@@ -350,6 +413,7 @@ class PoolElement(BaseElement, TangoDevice):
     def cleanUp(self):
         TangoDevice.cleanUp(self)
         self._reserved = None
+        self._clearEventWait()
         f = self.factory()
 
         attr_map = self._attrEG
@@ -414,14 +478,17 @@ class PoolElement(BaseElement, TangoDevice):
 
     def _getEventWait(self):
         if self._evt_wait is None:
-            # create an object that waits for attribute events.
-            # each time we use it we have to connect and disconnect to an
-            # attribute
-            self._evt_wait = AttributeEventWait()
+            # create an object that waits for the state events. It stays
+            # connected to the state attribute so the subscription is reused
+            # by all the operations
+            self._evt_wait = StateEventWait(self.getAttribute("state"))
         return self._evt_wait
 
     def _clearEventWait(self):
+        evt_wait = self._evt_wait
         self._evt_wait = None
+        if evt_wait is not None:
+            evt_wait.disconnect()
 
     def getStateEG(self):
         return self._getAttrEG('state')
@@ -475,25 +542,22 @@ class PoolElement(BaseElement, TangoDevice):
 
     @reservedOperation
     def start(self, *args, **kwargs):
+        """Start the operation
+
+        :return: id of the operation: the time stamp of its beginning
+          and the operation id
+        :rtype: tuple(float, int)
+        """
         evt_wait = self._getEventWait()
-        evt_wait.connect(self.getAttribute("state"))
-        try:
-            evt_wait.waitEvent(DevState.MOVING, equal=False)
-            # Clear event set to not confuse the value coming from the
-            # connection with the event of of end of the operation
-            # in the next wait event. This was observed on Windows where
-            # the time stamp resolution is very poor.
-            evt_wait.clearEventSet()
-            self.__go_time = 0
-            self.__go_start_time = ts1 = time.time()
-            self._start(*args, **kwargs)
-            ts2 = time.time()
-            evt_wait.waitEvent(DevState.MOVING, after=ts1)
-        except:
-            evt_wait.disconnect()
-            raise
+        evt_wait.waitReady()
+        op_id = evt_wait.startOperation()
+        self.__go_time = 0
+        self.__go_start_time = ts1 = time.time()
+        self._start(*args, **kwargs)
+        ts2 = time.time()
+        evt_wait.waitEvent(DevState.MOVING, after=ts1)
         ts2 = evt_wait.getRecordedEvents().get(DevState.MOVING, ts2)
-        return (ts2,)
+        return (ts2, op_id)
 
     def waitFinish(self, timeout=None, id=None):
         """Wait for the operation to finish
@@ -501,7 +565,7 @@ class PoolElement(BaseElement, TangoDevice):
         :param timeout: optional timeout (seconds)
         :type timeout: float
         :param id: id of the opertation returned by start
-        :type id: tuple(float)
+        :type id: tuple(float, int)
         """
         if timeout is None:
             # 0.1 s of timeout with infinite retries facilitates aborting
@@ -513,16 +577,21 @@ class PoolElement(BaseElement, TangoDevice):
             # in two intervals
             timeout = timeout / 2
             retries = 1
+        evt_wait = self._getEventWait()
+        op_id = None
         if id is not None:
+            if len(id) > 1:
+                op_id = id[1]
             id = id[0]
-        evt_wait = self._getEventWait()
+        # a new operation was already started so this one has finished
+        if op_id is not None and op_id != evt_wait.getOperationId():
+            return
         try:
             evt_wait.waitEvent(DevState.MOVING, after=id, equal=False,
                                timeout=timeout, retries=retries)
         finally:
             self.__go_end_time = time.time()
             self.__go_time = self.__go_end_time - self.__go_start_time
-            evt_wait.disconnect()
 
     @reservedOperation
     def go(self, *args, **kwargs):
@@ -707,6 +776,7 @@ class ExpChannel(PoolElement):
 
         self._value_buffer = {}
         self._value_buffer_cb = None
+        register_codecs()
         codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
         self._value_buffer_codec = CodecFactory().getCodec(codec_name)
 
@@ -1039,7 +1109,7 @@ class Motor(PoolElement, Moveable):
         state, pos = self.getAttribute("state"), self.getAttribute("position")
 
         evt_wait = self._getEventWait()
-        evt_wait.connect(state)
+        evt_wait.startOperation()
         evt_wait.lock()
         try:
             # evt_wait.waitEvent(DevState.MOVING, equal=False)
@@ -1060,7 +1130,6 @@ class Motor(PoolElement, Moveable):
                                timeout=0.1, retries=1)
         finally:
             evt_wait.unlock()
-            evt_wait.disconnect()
 
         evt_iter_wait = AttributeEventIterator(state, pos)
         evt_iter_wait.lock()
@@ -1133,6 +1202,53 @@ class PseudoMotor(PoolElement, Moveable):
     def getDialPositionObj(self):
         return self.getPositionObj()
 
+    def calcPhysicalArray(self, positions):
+        """Calculate the physical positions for many positions of this pseudo
+        motor in one call to the Pool. The other sibling pseudo motors are
+        assumed to stay at their last set points.
+
+        :param positions: pseudo motor positions
+        :type positions: seq<float>
+        :return: (number of positions, number of physical elements) array of
+            physical positions, columns follow the :attr:`elements` order
+        :rtype: numpy.ndarray
+
+        .. note::
+            The calcPhysicalArray method has been included in Sardana on a
+            provisional basis. Backwards incompatible changes (up to and
+            including its removal) may occur if deemed necessary by the core
+            developers.
+        """
+        positions = numpy.asarray(positions, dtype=float)
+        if len(positions) == 0:
+            return numpy.empty((0, len(self.elements)))
+        physical = self.command_inout("CalcPhysicalArray", positions)
+        return numpy.reshape(physical, (len(positions), -1))
+
+    def calcAllPseudoArray(self, physical_positions):
+        """Calculate the positions of all the sibling pseudo motors for many
+        points of physical positions in one call to the Pool.
+
+        :param physical_positions: (N, number of physical elements) physical
+            positions, columns follow the :attr:`elements` order
+        :type physical_positions: seq<seq<float>> or numpy.ndarray
+        :return: (N, number of pseudo motors) array of pseudo positions
+        :rtype: numpy.ndarray
+
+        .. note::
+            The calcAllPseudoArray method has been included in Sardana on a
+            provisional basis. Backwards incompatible changes (up to and
+            including its removal) may occur if deemed necessary by the core
+            developers.
+        """
+        physical_positions = numpy.array(physical_positions, dtype=float,
+                                         ndmin=2)
+        if len(physical_positions) == 0:
+            return numpy.empty((0, 0))
+        pseudo = self.command_inout("CalcAllPseudoArray",
+                                    physical_positions.ravel())
+        return numpy.reshape(pseudo, (len(physical_positions), -1))
+
     # -~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
     # Moveable interface
     #
@@ -2409,6 +2525,7 @@ class MeasurementGroup(PoolElement):
         self._configuration = None
         self._channels = None
         self._last_integ_time = None
+        self._count_cmd_available = None
         self.call__init__(PoolElement, name, **kw)
 
         self._flg_event = threading.Event()
@@ -2417,6 +2534,7 @@ class MeasurementGroup(PoolElement):
 
         self._value_buffer_cb = None
         self._value_buffer_channels = None
+        register_codecs()
         codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
         self._value_buffer_codec = CodecFactory().getCodec(codec_name)
 
@@ -3349,6 +3467,8 @@ class MeasurementGroup(PoolElement):
         """
         if start_time is None:
             start_time = time.time()
+        if self._isCountCommandUsable(self._last_integ_time):
+            return self._count(None, start_time)
         PoolElement.go(self)
         state = self.getStateEG().readValue()
         if state == Fault:
@@ -3381,12 +3501,72 @@ class MeasurementGroup(PoolElement):
         integration_time = args[0]
         if integration_time is None or integration_time == 0:
             return self.getStateEG().readValue(), self.getValues()
+        if self._isCountCommandUsable(integration_time):
+            return self._count(integration_time, start_time)
         self.putIntegrationTime(integration_time)
         self.setMoveable(None)
         self.setNbStarts(1)
         self.prepare()
         return self.count_raw(start_time)
 
+    def _isCountCommandUsable(self, integration_time):
+        """Check if the count can be executed with the Count command.
+
+        The Count command blocks the measurement group device until the
+        acquisition finishes, so it is used only if enabled with the
+        MG_COUNT_COMMAND_MAX_TIME sardanacustomsettings, in the Timer
+        acquisition mode and for integration times up to the configured one
+        and well below the client timeout.
+        """
+        max_time = getattr(sardanacustomsettings,
+                           "MG_COUNT_COMMAND_MAX_TIME", None)
+        if max_time is None or integration_time is None:
+            return False
+        if integration_time > max_time:
+            return False
+        if self._count_cmd_available is None:
+            try:
+                self._count_cmd_available = \
+                    "Count" in self.get_command_list()
+            except DevFailed:
+                return False
+        if not self._count_cmd_available:
+            return False
+        if self.getAcquisitionMode() != "Timer":
+            return False
+        return integration_time < self.get_timeout_millis() / 2000.
+
+    def _count(self, integration_time, start_time):
+        """Count with a single Count command call which configures, prepares,
+        starts and waits for the acquisition and returns all the values.
+
+        :param integration_time: integration time, None means start the
+          already prepared acquisition
+        :type integration_time: :obj:`float`
+        :param start_time: start time of the whole count operation
+        :type start_time: :obj:`float`
+        :return: state and channel names and values (or value references)
+        :rtype: :obj:`tuple`
+        """
+        cfg = self.getConfiguration()
+        cfg.prepare()
+        if integration_time is None:
+            arg = float("nan")
+        else:
+            arg = integration_time
+            # the integration time was set by the Count command
+            self._last_integ_time = integration_time
+        format_, data = self.command_inout("Count", arg)
+        _, data = CodecFactory().getCodec(format_).decode((format_, data))
+        values = CaselessDict(cfg.cache)
+        for full_name, value in data.items():
+            if isinstance(value, numpy.ndarray) and value.ndim == 0:
+                value = value[()]
+            values[full_name] = value
+        state = self.getStateEG().readValue()
+        self._total_go_time = time.time() - start_time
+        return state, values
+
     def count_continuous(self, synch_description, value_buffer_cb=None,
                          value_ref_buffer_cb=None):
         """Execute measurement process according to the given synchronization
@@ -24,14 +24,21 @@
 ##############################################################################
 
 
+import time
 import uuid
+import threading
+import types
 import numpy
 
+from PyTango import DevState
 from taurus import Device
-from unittest import TestCase
+from unittest import TestCase, mock
+from taurus.core.taurusbasetypes import TaurusEventType
 from taurus.test.base import insertTest
+from sardana import sardanacustomsettings
 from sardana.sardanautils import is_number, is_non_str_seq, is_pure_str
-from sardana.taurus.core.tango.sardana.pool import registerExtensions
+from sardana.taurus.core.tango.sardana.pool import registerExtensions, \
+    PoolElement, MeasurementGroup
 from sardana.tango.pool.test.base_sartest import SarTestTestCase
 
 
@@ -144,3 +151,105 @@ class TestMotor(SarTestTestCase, TestCase):
 
     def tearDown(self):
         SarTestTestCase.tearDown(self)
+
+
+class StateAttribute(object):
+    """State attribute which counts the subscriptions to its events"""
+
+    def __init__(self):
+        self.value = DevState.ON
+        self.listeners = []
+        self.subscriptions = 0
+
+    def addListener(self, listener):
+        self.subscriptions += 1
+        self.listeners.append(listener)
+        # the current value is sent to the new listeners
+        listener.eventReceived(self, TaurusEventType.Change,
+                               types.SimpleNamespace(rvalue=self.value))
+
+    def removeListener(self, listener):
+        self.listeners.remove(listener)
+
+    def fire(self, value):
+        self.value = value
+        for listener in list(self.listeners):
+            listener.eventReceived(self, TaurusEventType.Change,
+                                   types.SimpleNamespace(rvalue=value))
+
+
+class Element(PoolElement):
+    """Pool element with the simulated state attribute and an operation
+    which finishes immediately"""
+
+    def __init__(self):
+        self._reserved = None
+        self._evt_wait = None
+        self._total_go_time = 0
+        self._PoolElement__go_start_time = 0
+        self._PoolElement__go_end_time = 0
+        self._PoolElement__go_time = 0
+        self.state_attr = StateAttribute()
+
+    def getAttribute(self, name):
+        return self.state_attr
+
+    def _start(self, *args, **kwargs):
+        self.state_attr.fire(DevState.MOVING)
+        self.state_attr.fire(DevState.ON)
+
+
+class TestPoolElementStateEvents(TestCase):
+
+    def test_subscription(self):
+        element = Element()
+        op_ids = []
+        for _ in range(10):
+            op_id = element.start()
+            element.waitFinish(id=op_id)
+            op_ids.append(op_id[1])
+        self.assertEqual(element.state_attr.subscriptions, 1)
+        self.assertEqual(op_ids, list(range(1, 11)))
+        # operation already finished - it does not wait
+        element.waitFinish(id=(time.time(), 1))
+        element._clearEventWait()
+        self.assertEqual(element.state_attr.listeners, [])
+
+    def test_start_after_clear(self):
+        """Test that start does not wait for a new state event if the
+        event set was cleared, e.g. by Motor.iterMove, when the element was
+        already ready"""
+        element = Element()
+        element.go()
+        # Motor.iterMove starts its operation without any new state event
+        element._getEventWait().startOperation()
+        start = threading.Thread(target=element.start, daemon=True)
+        start.start()
+        start.join(5)
+        self.assertFalse(start.is_alive())
+        element._clearEventWait()
+
+
+@insertTest(helper_name="count_command", max_time=None, integ_time=0.001,
+            expected=False)
+@insertTest(helper_name="count_command", max_time=0.01, integ_time=0.001,
+            expected=True)
+@insertTest(helper_name="count_command", max_time=0.01, integ_time=0.1,
+            expected=False)
+@insertTest(helper_name="count_command", max_time=0.01, integ_time=0.001,
+            acq_mode="Monitor", expected=False)
+@insertTest(helper_name="count_command", max_time=10, integ_time=2,
+            expected=False)
+class TestMeasurementGroupCountCommand(TestCase):
+
+    def count_command(self, max_time, integ_time, expected,
+                      acq_mode="Timer"):
+        """Test that the Count command is used only if enabled and for
+        short integration times in the Timer acquisition mode"""
+        mg = MeasurementGroup.__new__(MeasurementGroup)
+        mg._count_cmd_available = True
+        mg.getAcquisitionMode = lambda: acq_mode
+        mg.get_timeout_millis = lambda: 3000
+        with mock.patch.object(sardanacustomsettings,
+                               "MG_COUNT_COMMAND_MAX_TIME", max_time):
+            self.assertEqual(mg._isCountCommandUsable(integ_time), expected)
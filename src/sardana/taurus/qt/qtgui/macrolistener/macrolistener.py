@@ -270,6 +270,9 @@ class DynamicPlotManager(Qt.QObject, TaurusBaseComponent):
                 self.prepare(data)
             elif event_type == 'record_data':
                 self.newPoint(data)
+            elif event_type == 'record_data_batch':
+                for point in self.door.splitRecordData(data):
+                    self.newPoint(point)
             elif event_type == 'record_end':
                 self.end(data)
 
@@ -25,7 +25,11 @@
 
 from unittest import TestCase
 
-from sardana.sardanabuffer import SardanaBuffer
+import numpy
+
+from sardana.sardanavalue import SardanaValue
+from sardana.sardanabuffer import SardanaBuffer, BufferChunk, \
+    LateValueException, EarlyValueException
 
 
 class TestPersistentBuffer(TestCase):
@@ -51,3 +55,55 @@ class TestPersistentBuffer(TestCase):
         self.buffer.append(1)
         self.assertEqual(len(self.buffer), 4)
         self.assertEqual(len(self.buffer.last_chunk), 1)
+
+
+class TestArrayBackedBuffer(TestPersistentBuffer):
+    """Unit tests for array backed Buffer class"""
+
+    def setUp(self):
+        self.buffer = SardanaBuffer(persistent=True, capacity=2)
+        self.buffer.extend([1, 2, 3])
+
+    def test_chunk(self):
+        """Test that the last chunk gives access to arrays as well as to
+        SardanaValue objects"""
+        error = SardanaValue(exc_info=(None, None, None))
+        self.buffer.extend([4., error, SardanaValue(6., timestamp=1.)])
+        chunk = self.buffer.last_chunk
+        self.assertIsInstance(chunk, BufferChunk)
+        self.assertEqual((chunk.start, chunk.stop), (3, 6))
+        numpy.testing.assert_array_equal(chunk.indexes, [3, 4, 5])
+        numpy.testing.assert_array_equal(chunk.value_array,
+                                         [4., numpy.nan, 6.])
+        self.assertEqual(chunk.timestamp_array[2], 1.)
+        self.assertEqual(list(chunk.keys()), [3, 4, 5])
+        self.assertIs(chunk[4], error)
+        self.assertEqual(chunk[5].value, 6.)
+        self.assertIs(self.buffer.get_value_obj(4), error)
+
+    def test_grow(self):
+        """Test that persistent values are not overwritten"""
+        self.buffer.extend(range(4, 101))
+        for idx in range(100):
+            self.assertEqual(self.buffer.get_value(idx), idx + 1)
+        numpy.testing.assert_array_equal(self.buffer.get_values(10, 20),
+                                         range(11, 21))
+
+    def test_remove(self):
+        """Test remove and discard methods"""
+        self.assertEqual(self.buffer.remove(0).value, 1)
+        self.assertRaises(KeyError, self.buffer.remove, 0)
+        self.assertRaises(LateValueException, self.buffer.get_value, 0)
+        self.assertRaises(EarlyValueException, self.buffer.get_value, 3)
+        self.buffer.discard(0, 2)
+        self.assertEqual(len(self.buffer), 1)
+        self.assertEqual(self.buffer.get_value(2), 3)
+
+    def test_shape(self):
+        """Test buffer of arrays"""
+        buffer = SardanaBuffer(capacity=2)
+        buffer.extend([numpy.zeros(3), numpy.ones(3)])
+        self.assertEqual(buffer.last_chunk.value_array.shape, (2, 3))
+        # values of different shape
+        buffer.extend([numpy.zeros(4)])
+        self.assertEqual(buffer.last_chunk[2].value.shape, (4,))
@@ -25,6 +25,7 @@
 
 """Unit tests for sardanavalue module"""
 
+import pickle
 import unittest
 from sardana.sardanavalue import SardanaValue
 
@@ -89,3 +90,25 @@ class SardanaValueTestCase(unittest.TestCase):
 
         self.assertEqual(sar_val.error, False,
                          'The error attribute should be False')
+
+    def testSlots(self):
+        """Verify that SardanaValue has no per-instance dictionary and that
+        it can be pickled."""
+        sar_val = SardanaValue(value=3, timestamp=1.)
+        self.assertFalse(hasattr(sar_val, "__dict__"))
+        with self.assertRaises(AttributeError):
+            sar_val.foo = 1
+        sar_val = pickle.loads(pickle.dumps(sar_val))
+        self.assertEqual((sar_val.value, sar_val.timestamp), (3, 1.))
+
+    def testFromValues(self):
+        """Verify that value objects created from a chunk of values share the
+        same timestamp and that value objects are passed unchanged."""
+        sar_val = SardanaValue(value=3, timestamp=1.)
+        sar_vals = SardanaValue.from_values([1, 2, sar_val], timestamp=2.)
+        self.assertEqual([v.value for v in sar_vals], [1, 2, 3])
+        self.assertEqual([v.timestamp for v in sar_vals], [2., 2., 1.])
+        self.assertIs(sar_vals[2], sar_val)
+        sar_vals = SardanaValue.from_values([1, 2])
+        self.assertEqual(sar_vals[0].timestamp, sar_vals[1].timestamp)
+        self.assertFalse(sar_vals[0].error)
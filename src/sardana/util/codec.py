@@ -0,0 +1,138 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains the Sardana codecs"""
+
+__all__ = ["BinaryCodec", "register_codecs"]
+
+__docformat__ = 'restructuredtext'
+
+import json
+import pickle
+import struct
+
+import numpy
+
+from taurus.core.util.codecs import Codec, CodecFactory
+
+_HEADER_SIZE = struct.Struct("<I")
+
+
+class BinaryCodec(Codec):
+    """A codec able to encode/decode dictionaries of sequences (e.g. value
+    buffers) to/from a compact binary format.
+
+    Numeric sequences are sent as raw, contiguous NumPy array buffers
+    described by the header (dtype and shape) and are decoded into NumPy
+    arrays sharing the memory of the encoded data, without creating Python
+    objects per element. Other values are pickled.
+
+    Example::
+
+        >>> from sardana.util.codec import register_codecs
+        >>> from taurus.core.util.codecs import CodecFactory
+
+        >>> register_codecs()
+        >>> codec = CodecFactory().getCodec('binary')
+        >>> data = dict(index=[0, 1], value=[1.5, 2.5])
+        >>> format, encoded_data = codec.encode(("", data))
+        >>> format, decoded_data = codec.decode((format, encoded_data))
+        >>> print(decoded_data["value"])
+        [1.5 2.5]
+
+    .. note::
+        The BinaryCodec class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including removal of the module) may occur if
+        deemed necessary by the core developers.
+    """
+
+    def encode(self, data, *args, **kwargs):
+        """encodes the given data to binary bytes. The given data **must** be
+        a dictionary with string keys.
+
+        :param data: a sequence of two elements where the first item is the
+            encoding format of the second item object
+        :type data: sequence[str, obj]
+        :return: a sequence of two elements where the first item is the
+            encoding format of the second item object
+        :rtype: sequence[str, obj]
+        """
+        format = "binary"
+        if len(data[0]):
+            format += "_%s" % data[0]
+        fields, buffers = [], []
+        for name, value in data[1].items():
+            try:
+                array = numpy.ascontiguousarray(value)
+            except ValueError:
+                # e.g. ragged sequence of arrays
+                array = None
+            if array is not None and array.dtype.kind in "biufc":
+                buffer = array.tobytes()
+                fields.append([name, array.dtype.str, array.shape,
+                               len(buffer)])
+            else:
+                buffer = pickle.dumps(value, pickle.DEFAULT_PROTOCOL)
+                fields.append([name, None, None, len(buffer)])
+            buffers.append(buffer)
+        header = json.dumps(fields).encode("utf-8")
+        encoded_data = b"".join([_HEADER_SIZE.pack(len(header)), header]
+                                + buffers)
+        return format, encoded_data
+
+    def decode(self, data, *args, **kwargs):
+        """decodes the given data from binary bytes.
+
+        :param data: a sequence of two elements where the first item is the
+            encoding format of the second item object
+        :type data: sequence[str, obj]
+        :return: a sequence of two elements where the first item is the
+            encoding format of the second item object
+        :rtype: sequence[str, obj]
+        """
+        if not data[0].startswith("binary"):
+            return data
+        format = data[0].partition("_")[2]
+        buffer = data[1]
+        header_size, = _HEADER_SIZE.unpack_from(buffer)
+        offset = _HEADER_SIZE.size
+        header = bytes(buffer[offset:offset + header_size])
+        offset += header_size
+        decoded_data = {}
+        for name, dtype, shape, nbytes in json.loads(header.decode("utf-8")):
+            if dtype is None:
+                value = pickle.loads(buffer[offset:offset + nbytes])
+            else:
+                dtype = numpy.dtype(dtype)
+                value = numpy.frombuffer(buffer, dtype=dtype,
+                                         count=nbytes // dtype.itemsize,
+                                         offset=offset).reshape(shape)
+            decoded_data[name] = value
+            offset += nbytes
+        return format, decoded_data
+
+
+def register_codecs():
+    """Registers the Sardana codecs in the Taurus codec factory"""
+    CodecFactory().registerCodec("binary", BinaryCodec)
@@ -36,18 +36,21 @@ from taurus.core.util.log import Logger
 
 def strictly_increasing(l):
     """Check whether list l has strictly increasing values"""
-    return all(x < y for x, y in zip(l, l[1:]))
+    return bool(numpy.all(numpy.diff(l) > 0))
 
 
 def strictly_decreasing(l):
     """Check whether list l has strictly deacreasing values"""
-    return all(x > y for x, y in zip(l, l[1:]))
+    return bool(numpy.all(numpy.diff(l) < 0))
 
 
 class FunctionGenerator(EventGenerator, Logger):
     """Generator of active and passive events describing a rectangular
     function.
 
+    The active and passive events are stored in NumPy arrays (event tables)
+    which are consumed with a cursor, so triggering does not copy them.
+
     .. note::
         The FunctionGenerator class has been included in Sardana
         on a provisional basis. Backwards incompatible changes
@@ -67,8 +70,13 @@ class FunctionGenerator(EventGenerator, Logger):
         self._position = None
         self._initial_domain_in_use = None
         self._active_domain_in_use = None
-        self._active_events = list()
-        self._passive_events = list()
+        self._active_events = numpy.empty(0)
+        self._passive_events = numpy.empty(0)
+        # cursors pointing to the next active and passive events
+        self._active_cursor = 0
+        self._passive_cursor = 0
+        # active events multiplied by the direction (increasing order)
+        self._search_events = None
         self._started = False
         self._stopped = False
         self._running = False
@@ -118,24 +126,37 @@ class FunctionGenerator(EventGenerator, Logger):
                                     set_active_domain_in_use)
 
     def add_active_event(self, event):
-        self._active_events.append(event)
+        self.set_active_events(numpy.append(self.active_events, event))
 
     def set_active_events(self, events):
-        self._active_events = events
+        self._active_events = numpy.array(events, dtype=float, ndmin=1)
+        self._active_cursor = 0
+        self._update_search_events()
 
     def get_active_events(self):
-        return self._active_events
+        """Get the active events which were not fired yet.
+
+        :return: view of the active event table
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._active_events[self._active_cursor:]
 
     active_events = property(get_active_events, set_active_events)
 
     def add_passive_event(self, event):
-        self._passive_events.append(event)
+        self.set_passive_events(numpy.append(self.passive_events, event))
 
     def set_passive_events(self, events):
-        self._passive_events = events
+        self._passive_events = numpy.array(events, dtype=float, ndmin=1)
+        self._passive_cursor = 0
 
     def get_passive_events(self):
-        return self._passive_events
+        """Get the passive events which were not fired yet.
+
+        :return: view of the passive event table
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._passive_events[self._passive_cursor:]
 
     passive_events = property(get_passive_events, set_passive_events)
 
@@ -147,12 +168,20 @@ class FunctionGenerator(EventGenerator, Logger):
             self._condition = numpy.less_equal
         else:
             raise ValueError("direction can be -1 or 1 (negative or positive)")
+        self._update_search_events()
 
     def get_direction(self):
         return self._direction
 
     direction = property(get_direction, set_direction)
 
+    def _update_search_events(self):
+        # active events in increasing order for the binary search
+        if self._direction is None:
+            self._search_events = None
+        else:
+            self._search_events = self._active_events * self._direction
+
     def event_received(self, *args, **kwargs):
         _, _, v = args
         if v.error:
@@ -189,7 +218,8 @@ class FunctionGenerator(EventGenerator, Logger):
     def run(self):
         self._running = True
         try:
-            while len(self.active_events) > 0 and not self.is_stopped():
+            while (self._active_cursor < len(self._active_events)
+                   and not self.is_stopped()):
                 self.wait_active()
                 self.fire_active()
                 self.wait_passive()
@@ -222,7 +252,7 @@ class FunctionGenerator(EventGenerator, Logger):
             self.warning(msg)
 
     def wait_active(self):
-        candidate = self.active_events[0]
+        candidate = self._active_events[self._active_cursor]
         if self.initial_domain_in_use == SynchDomain.Time:
             now = time.time()
             candidate += self._start_time
@@ -241,35 +271,37 @@ class FunctionGenerator(EventGenerator, Logger):
 
     def fire_active(self):
         # check if some events needs to be skipped
+        cursor = self._active_cursor
+        if self.initial_domain_in_use is SynchDomain.Time:
+            now = time.time() - self._start_time
+        else:
+            now = self._position
         i = 0
-        while i < len(self.active_events) - 1:
-            candidate = self.active_events[i + 1]
-            if self.initial_domain_in_use is SynchDomain.Time:
-                candidate += self._start_time
-                now = time.time()
-            elif self.initial_domain_in_use is SynchDomain.Position:
-                now = self._position
-            if self._condition(now, candidate):
-                i += 1
-            else:
-                break
+        if now is not None:
+            # index of the last already passed event
+            last = numpy.searchsorted(self._search_events,
+                                      now * self._direction,
+                                      side="right") - 1
+            i = max(int(last) - cursor, 0)
         self._id += i
         if not self._start_fired:
             self.fire_start()
         self.fire_event(EventType("active"), self._id)
-        self.active_events = self.active_events[i + 1:]
-        self.passive_events = self.passive_events[i:]
+        self._active_cursor = cursor + i + 1
+        self._passive_cursor += i
 
     def wait_passive(self):
         if self.active_domain_in_use == SynchDomain.Time:
             now = time.time()
-            candidate = self._start_time + self.passive_events[0]
+            candidate = (self._start_time
+                         + self._passive_events[self._passive_cursor])
             self.sleep(candidate - now)
         else:
+            candidate = self._passive_events[self._passive_cursor]
             while True:
                 if self._position_event.isSet():
                     self._position_event.clear()
-                    if self._condition(self._position, self.passive_events[0]):
+                    if self._condition(self._position, candidate):
                         break
                 else:
                     self._position_event.wait(self.MAX_NAP_TIME)
@@ -278,8 +310,8 @@ class FunctionGenerator(EventGenerator, Logger):
 
     def fire_passive(self):
         self.fire_event(EventType("passive"), self._id)
-        self.set_passive_events(self.passive_events[1:])
-        if len(self.passive_events) == 0:
+        self._passive_cursor += 1
+        if self._passive_cursor == len(self._passive_events):
             self.fire_end()
 
     def fire_end(self):
@@ -342,22 +374,24 @@ class FunctionGenerator(EventGenerator, Logger):
             active = active_param[active_domain_in_use]
             initial_in_initial_domain = initial_param[initial_domain_in_use]
             initial_in_active_domain = initial_param[active_domain_in_use]
-            active_event_in_initial_domain = initial_in_initial_domain
-            active_event_in_active_domain = initial_in_active_domain
             if repeats > 1:
                 total_param = group[Total]
                 total_in_initial_domain = total_param[initial_domain_in_use]
                 total_in_active_domain = total_param[active_domain_in_use]
-                for _ in range(repeats):
-                    passive_event = active_event_in_active_domain + active
-                    active_events.append(active_event_in_initial_domain)
-                    passive_events.append(passive_event)
-                    active_event_in_initial_domain += total_in_initial_domain
-                    active_event_in_active_domain += total_in_active_domain
             else:
-                active_events.append(active_event_in_initial_domain)
-                passive_event = active_event_in_active_domain + active
-                passive_events.append(passive_event)
+                total_in_initial_domain = total_in_active_domain = 0
+            steps = numpy.arange(repeats)
+            active_events.append(initial_in_initial_domain
+                                 + total_in_initial_domain * steps)
+            passive_events.append(initial_in_active_domain + active
+                                  + total_in_active_domain * steps)
+
+        if len(configuration) > 0:
+            active_events = numpy.concatenate(active_events)
+            passive_events = numpy.concatenate(passive_events)
+        else:
+            active_events = numpy.empty(0)
+            passive_events = numpy.empty(0)
 
         # determine direction
         if self.direction is None:
@@ -25,13 +25,16 @@
 
 """This module contains the definition for a simulated motor"""
 
-__all__ = ["MotionPath", "Motion", "BaseMotor", "Motor", "DemoMotor"]
+__all__ = ["MotionPath", "Motion", "BaseMotor", "Motor", "DemoMotor",
+           "motion_durations"]
 
 __docformat__ = 'restructuredtext'
 
 import time
 from math import pow, sqrt
 
+import numpy
+
 
 class MotionPath(object):
     """Active motion path description"""
@@ -274,6 +277,77 @@ class MotionPath(object):
               self.displacement_reach_min_vel)
 
 
+def motion_durations(motor, initial_user_pos, final_user_pos):
+    """Calculate durations of many motions at once.
+
+    Vectorized equivalent of the :attr:`MotionPath.duration` (calculated
+    without the active time) of the trapezoidal or triangular (small
+    motions) velocity profile of the motor.
+
+    .. note::
+        The motion_durations function has been included in Sardana on a
+        provisional basis. Backwards incompatible changes (up to and
+        including its removal) may occur if deemed necessary by the core
+        developers.
+
+    :param motor: motor describing the velocity profile
+    :type motor: :class:`BaseMotor`
+    :param initial_user_pos: initial positions of the motions
+    :type initial_user_pos: :obj:`numpy.ndarray` or seq<float>
+    :param final_user_pos: final positions of the motions
+    :type final_user_pos: :obj:`numpy.ndarray` or seq<float>
+    :return: durations of the motions
+    :rtype: :obj:`numpy.ndarray`
+    """
+    initial_pos = numpy.asarray(initial_user_pos, dtype=float)
+    initial_pos = initial_pos * motor.step_per_unit
+    final_pos = numpy.asarray(final_user_pos, dtype=float)
+    final_pos = final_pos * motor.step_per_unit
+    displacement = numpy.abs(final_pos - initial_pos)
+    # accelerations are signed by the direction of the motion
+    sign = numpy.where(final_pos > initial_pos, 1., -1.)
+    accel, decel = motor.accel, motor.decel
+    min_vel, max_vel = motor.min_vel, motor.max_vel
+
+    displmnt_not_cnst = motor.displacement_reach_max_vel + \
+        motor.displacement_reach_min_vel
+    small_motion = displacement < displmnt_not_cnst
+
+    with numpy.errstate(all="ignore"):
+        # maximum velocity possible in small motions
+        cnst = sign * 2 * accel * decel * displacement / (decel - accel)
+        small_max_vel = numpy.sqrt(numpy.abs(pow(min_vel, 2) + cnst))
+        reached_max_vel = numpy.where(small_motion, small_max_vel, max_vel)
+
+        delta_vel = numpy.abs(reached_max_vel - min_vel)
+        infinite_delta_vel = delta_vel == float('inf')
+
+        # time to reach maximum velocity
+        if accel == 0:
+            max_vel_time = 0.
+        else:
+            max_vel_time = numpy.where(infinite_delta_vel, 0.,
+                                       numpy.abs(delta_vel / accel))
+
+        # time to reach minimum velocity
+        if decel == 0:
+            min_vel_time = 0.
+        else:
+            min_vel_time = numpy.where(infinite_delta_vel, 0.,
+                                       numpy.abs(delta_vel / decel))
+
+        # time at maximum velocity
+        if abs(max_vel) == float('inf'):
+            at_max_vel_time = 0.
+        else:
+            at_max_vel_displacement = displacement - displmnt_not_cnst
+            at_max_vel_time = numpy.where(
+                small_motion, 0., numpy.abs(at_max_vel_displacement / max_vel))
+
+        duration = max_vel_time + at_max_vel_time + min_vel_time
+    return numpy.where(displacement == 0, 0., duration)
+
+
 class Motion(object):
     """Active motion description"""
 
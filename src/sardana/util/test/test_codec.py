@@ -0,0 +1,67 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.tango-controls.org/static/sardana/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+
+import numpy
+
+from unittest import TestCase
+from taurus.test import insertTest
+from taurus.core.util.codecs import CodecFactory
+
+from sardana.util.codec import register_codecs
+
+
+def createValueBuffer(nb_points, shape=()):
+    index = list(range(nb_points))
+    if shape:
+        value = [numpy.random.random(shape) for _ in index]
+    else:
+        value = [float(i) for i in index]
+    return dict(index=index, value=value)
+
+
+@insertTest(helper_name="encode_decode", data=dict(index=[0], value_ref=[
+    "h5file:///tmp/test.h5::/data"]))
+@insertTest(helper_name="encode_decode", data=dict(index=[], value=[]))
+@insertTest(helper_name="encode_decode", data=createValueBuffer(5, (3, 2)))
+@insertTest(helper_name="encode_decode", data=createValueBuffer(5, (3,)))
+@insertTest(helper_name="encode_decode", data=createValueBuffer(5))
+class BinaryCodecTestCase(TestCase):
+
+    def setUp(self):
+        register_codecs()
+        self.codec = CodecFactory().getCodec("binary")
+
+    def encode_decode(self, data):
+        format, encoded_data = self.codec.encode(("", data))
+        self.assertEqual(format, "binary")
+        # Tango may pass the encoded data as memoryview
+        format, decoded_data = self.codec.decode((format,
+                                                  memoryview(encoded_data)))
+        self.assertEqual(format, "")
+        self.assertEqual(set(decoded_data.keys()), set(data.keys()))
+        for key, value in data.items():
+            decoded_value = decoded_data[key]
+            self.assertEqual(len(decoded_value), len(value))
+            for v, dv in zip(value, decoded_value):
+                numpy.testing.assert_array_equal(v, dv)
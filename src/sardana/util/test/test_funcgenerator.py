@@ -235,5 +235,65 @@ class FuncGeneratorTestCase(TestCase):
         for a, b in zip(passive_events, passive_events_ok):
             self.assertAlmostEqual(a, b, 10, msg)
 
+    def test_configuration_repeats(self):
+        configuration = [{SynchParam.Initial: {SynchDomain.Position: 0.},
+                          SynchParam.Delay: {SynchDomain.Time: 0.},
+                          SynchParam.Active: {SynchDomain.Position: .1,
+                                              SynchDomain.Time: .001},
+                          SynchParam.Total: {SynchDomain.Position: .2,
+                                             SynchDomain.Time: .002},
+                          SynchParam.Repeats: 1000000}]
+        self.func_generator.initial_domain = SynchDomain.Position
+        self.func_generator.active_domain = SynchDomain.Position
+        self.func_generator.set_configuration(configuration)
+        steps = numpy.arange(1000000)
+        numpy.testing.assert_allclose(self.func_generator.active_events,
+                                      .2 * steps)
+        numpy.testing.assert_allclose(self.func_generator.passive_events,
+                                      .1 + .2 * steps)
+        self.assertEqual(self.func_generator.direction, 1)
+
+    def test_fire_active_skip(self):
+        self.func_generator.initial_domain = SynchDomain.Position
+        self.func_generator.active_domain = SynchDomain.Position
+        self.func_generator.direction = -1
+        self.func_generator.set_configuration(configuration_negative)
+        self.func_generator.start()
+        # position passed the active events 0, 1 and 2
+        self.func_generator._position = -.45
+        self.func_generator.fire_active()
+        self.func_generator.fire_passive()
+        self.assertListEqual(self.listener.active_event_ids, [2])
+        self.assertListEqual(self.listener.passive_event_ids, [2])
+        self.assertEqual(len(self.func_generator.active_events), 7)
+        self.assertAlmostEqual(self.func_generator.active_events[0], -.6, 10)
+        self.assertAlmostEqual(self.func_generator.passive_events[0], -.7, 10)
+
+    def test_fire_repeats(self):
+        repeats = 1000
+        nb_triggers = 100
+        configuration = [{SynchParam.Initial: {SynchDomain.Position: 0.},
+                          SynchParam.Delay: {SynchDomain.Time: 0.},
+                          SynchParam.Active: {SynchDomain.Position: .1,
+                                              SynchDomain.Time: .001},
+                          SynchParam.Total: {SynchDomain.Position: .2,
+                                             SynchDomain.Time: .002},
+                          SynchParam.Repeats: repeats}]
+        self.func_generator.initial_domain = SynchDomain.Position
+        self.func_generator.active_domain = SynchDomain.Position
+        self.func_generator.set_configuration(configuration)
+        self.func_generator.start()
+        # position passes the active and passive event of each repeat
+        for position in .2 * numpy.arange(nb_triggers) + .15:
+            self.func_generator._position = position
+            self.func_generator.fire_active()
+            self.func_generator.fire_passive()
+            self.func_generator._id += 1
+        ids = list(range(nb_triggers))
+        self.assertListEqual(self.listener.active_event_ids, ids)
+        self.assertListEqual(self.listener.passive_event_ids, ids)
+        self.assertEqual(len(self.func_generator.active_events),
+                         repeats - nb_triggers)
+
     def tearDown(self):
         self.func_generator.remove_listener(self.listener)
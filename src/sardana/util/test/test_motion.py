@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for the motion path calculations."""
+
+import unittest
+
+import numpy
+from taurus.test import insertTest
+
+from sardana.util.motion import Motor, MotionPath, motion_durations
+
+
+@insertTest(helper_name="durations", min_vel=0, max_vel=1, accel_time=.1,
+            decel_time=.1)
+@insertTest(helper_name="durations", min_vel=.5, max_vel=2, accel_time=.2,
+            decel_time=.5)
+@insertTest(helper_name="durations", min_vel=0, max_vel=1, accel_time=0,
+            decel_time=0)
+@insertTest(helper_name="durations", min_vel=0, max_vel=float("inf"),
+            accel_time=0, decel_time=0)
+@insertTest(helper_name="durations", min_vel=.5, max_vel=1, accel_time=0,
+            decel_time=.2)
+class MotionDurationsTestCase(unittest.TestCase):
+    """Test the calculation of many motion durations at once"""
+
+    @staticmethod
+    def _positions(nb_motions):
+        positions = numpy.random.RandomState(0).uniform(-2, 2, nb_motions)
+        # include null and repeated motions
+        positions[::10] = 0.
+        return positions[:-1], positions[1:]
+
+    def durations(self, min_vel, max_vel, accel_time, decel_time):
+        """Test that the durations are the same as of the motion paths"""
+        motor = Motor(min_vel=min_vel, max_vel=max_vel,
+                      accel_time=accel_time, decel_time=decel_time)
+        initial, final = self._positions(1000)
+        durations = motion_durations(motor, initial, final)
+        expected = [MotionPath(motor, start, stop).duration
+                    for start, stop in zip(initial, final)]
+        numpy.testing.assert_allclose(durations, expected)